@@ -0,0 +1,105 @@
+"""
+Token savings of the prompt compression pipeline over a sample corpus.
+
+For every document in benchmarks/corpus (or the directory given) and every
+feature, the prompt is built the way the app builds it, once from the raw
+text and once from the compressed text, and the token counts are compared.
+
+Quality checks, which fail the run when violated:
+
+* retention: the document's most salient terms, and nearly all of its
+  vocabulary outside detected boilerplate, survive compression;
+* schema: with --live and GROQ_API_KEY set, each compressed prompt is sent to
+  the model and the response must pass the same validators the app uses.
+
+    python benchmarks/compression.py
+    python benchmarks/compression.py --live
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from study_engine.batch import build_prompts  # noqa: E402
+from study_engine.compression import compress_notes, strip_boilerplate  # noqa: E402
+from study_engine.config import CONTEXT_TOKEN_BUDGET, load_env  # noqa: E402
+from study_engine.retrieval import BM25Index, chunk_paragraphs, estimate_tokens, select_passages, tokenize  # noqa: E402
+from study_engine.schemas import VALIDATORS  # noqa: E402
+
+FEATURES = ["flashcards", "quiz", "summary", "study_guide"]
+MIN_VOCABULARY_RECALL = 0.97
+
+
+def retention(raw: str, compressed: str) -> tuple:
+    """(salient terms lost, vocabulary recall) of compressed relative to raw minus boilerplate."""
+    reference = strip_boilerplate(raw)
+    kept = set(tokenize(compressed))
+    salient = BM25Index(chunk_paragraphs(reference)).salient_terms(30)
+    vocabulary = set(tokenize(reference))
+    recall = len(vocabulary & kept) / len(vocabulary) if vocabulary else 1.0
+    return [t for t in salient if t not in kept], recall
+
+
+def prompt_tokens(content: str, feature: str, subject: str) -> int:
+    passages, _, _ = select_passages(content, subject if feature == "study_guide" else "", CONTEXT_TOKEN_BUDGET)
+    system_prompt, user_prompt, _ = build_prompts(feature, passages, subject, 10)
+    return estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure prompt token savings from input compression")
+    parser.add_argument("corpus", nargs="?", default=str(ROOT / "benchmarks" / "corpus"))
+    parser.add_argument("--live", action="store_true", help="Also generate from compressed prompts and validate")
+    args = parser.parse_args(argv)
+
+    documents = sorted(p for p in Path(args.corpus).iterdir() if p.suffix in {".txt", ".md"})
+    failed = False
+    total_before = total_after = 0
+    print(f"{'document':<24}{'feature':<13}{'raw':>8}{'compressed':>12}{'saved':>8}")
+    for path in documents:
+        raw = path.read_text(encoding="utf-8")
+        compressed, notes_before, notes_after = compress_notes(raw)
+        for feature in FEATURES:
+            before = prompt_tokens(raw, feature, path.stem)
+            after = prompt_tokens(compressed, feature, path.stem)
+            total_before += before
+            total_after += after
+            print(f"{path.name:<24}{feature:<13}{before:>8}{after:>12}{1 - after / before:>8.0%}")
+        lost, recall = retention(raw, compressed)
+        print(f"{'':<24}notes {notes_before} -> {notes_after} tokens, vocabulary recall {recall:.1%}")
+        if lost or recall < MIN_VOCABULARY_RECALL:
+            print(f"FAIL: {path.name} lost content (salient terms: {', '.join(lost) or 'none'})")
+            failed = True
+
+    print(f"total prompt tokens: {total_before} -> {total_after} ({1 - total_after / total_before:.0%} saved)")
+
+    if args.live:
+        load_env()
+        from study_engine.ai import AIProvider
+        provider = AIProvider()
+        if not provider.is_configured():
+            print("GROQ_API_KEY is not set; skipping --live")
+        else:
+            for path in documents:
+                compressed, _, _ = compress_notes(path.read_text(encoding="utf-8"))
+                for feature in FEATURES:
+                    passages, _, _ = select_passages(compressed, path.stem, CONTEXT_TOKEN_BUDGET)
+                    system_prompt, user_prompt, _ = build_prompts(feature, passages, path.stem, 10)
+                    try:
+                        data = provider.generate_json(system_prompt, user_prompt, feature)
+                        if feature in VALIDATORS:
+                            VALIDATORS[feature](data)
+                        print(f"valid    {path.name} [{feature}]")
+                    except Exception as e:
+                        print(f"FAIL: {path.name} [{feature}]: {e}")
+                        failed = True
+
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Time of the near-duplicate filter on generated item sets of growing size.
+
+Each set holds distinct questions built from the corpus vocabulary plus
+reworded copies of a tenth of them, so the benchmark also reports how many
+of the planted paraphrases were caught. Exits non-zero when filtering --items
+items takes longer than --max-ms (median of --runs):
+
+    python benchmarks/dedup.py --items 300 --max-ms 10
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from study_engine.dedup import DEFAULT_THRESHOLD, duplicate_flags  # noqa: E402
+from study_engine.retrieval import STOPWORDS  # noqa: E402
+
+CORPUS = ROOT / "benchmarks" / "corpus"
+TEMPLATES = ["What is the relationship between {} and {} in {}?", "How does {} change {} during {}?",
+             "Why is {} needed for {} and {}?", "Which part of {} controls {} in {}?"]
+REWORDINGS = ["Explain the relationship between {} and {} in {}.", "During {2}, how does {0} change {1}?",
+              "Why are {} needed for {} and {}?", "Which part of {} is responsible for controlling {} in {}?"]
+
+
+def vocabulary() -> list:
+    words = set()
+    for path in CORPUS.glob("*.txt"):
+        words.update(w for w in re.findall(r'[a-z]{5,}', path.read_text(encoding="utf-8").lower()))
+    return sorted(words - STOPWORDS)
+
+
+def item_set(size: int, paraphrase_share: float, words: list, rng: random.Random) -> tuple:
+    """Distinct generated-looking questions plus reworded copies of some of them."""
+    planted = int(size * paraphrase_share)
+    originals = [(rng.randrange(len(TEMPLATES)), rng.sample(words, 3)) for _ in range(size - planted)]
+    texts = [TEMPLATES[t].format(*w) for t, w in originals]
+    texts += [REWORDINGS[t].format(*w) for t, w in rng.sample(originals, planted)]
+    return texts, planted
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time near-duplicate filtering of generated items")
+    parser.add_argument("--items", type=int, default=300, help="Set size checked against --max-ms")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per size (median is reported)")
+    parser.add_argument("--max-ms", type=float, default=10.0, help="Fail when --items takes longer than this")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    words = vocabulary()
+    print(f"{'items':>6}{'median ms':>11}{'planted':>9}{'removed':>9}")
+    failed = False
+    for size in sorted({20, 100, args.items, 1000}):
+        texts, planted = item_set(size, 0.1, words, rng)
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            flags = duplicate_flags(texts, DEFAULT_THRESHOLD)
+            timings.append((time.perf_counter() - start) * 1000)
+        median = statistics.median(timings)
+        print(f"{size:>6}{median:>11.2f}{planted:>9}{sum(flags):>9}")
+        if size == args.items and median > args.max_ms:
+            failed = True
+    if failed:
+        print(f"FAIL: {args.items} items took longer than --max-ms {args.max_ms:.1f}")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Peak memory of streaming a stored question bank to each export format.
+
+A fresh database gets one bank of --questions generated questions. Each
+format is exported straight from storage (QuestionBankStore.iter_questions)
+into a sink that only counts bytes, first for the first tenth of the bank
+and then for all of it, under tracemalloc. Because the exporters hold one
+batch of rows at a time, the peak should be about the same for both sizes.
+Exits non-zero when any full-size export peaks above --max-mb:
+
+    python benchmarks/export.py --questions 100000 --max-mb 8
+"""
+
+import argparse
+import itertools
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from study_engine.exports import FORMATS, export_stream  # noqa: E402
+from study_engine.question_banks import BATCH_SIZE, QuestionBankStore  # noqa: E402
+
+
+def question(n: int) -> dict:
+    return {
+        "question": f"Question {n}: which statement about topic {n % 97} is correct?",
+        "options": [{"text": f"Statement {n}-{k} about the topic", "is_correct": k == n % 4} for k in range(4)],
+        "explanation": f"Statement {n}-{n % 4} is the one the notes support.",
+    }
+
+
+def measure(fmt: str, items) -> tuple:
+    """(peak MB, seconds, bytes written) of one export."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    written = 0
+    for chunk in export_stream(fmt, "questions", items, "Benchmark"):
+        written += len(chunk)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return peak, seconds, written
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure export memory as a question bank grows")
+    parser.add_argument("--questions", type=int, default=100000, help="Bank size, checked against --max-mb")
+    parser.add_argument("--max-mb", type=float, default=8.0, help="Fail when a full export peaks above this")
+    args = parser.parse_args(argv)
+
+    small = max(1, args.questions // 10)
+    failed = []
+    with tempfile.TemporaryDirectory() as tmp:
+        store = QuestionBankStore(Path(tmp) / "export.db")
+        bank_id = store.create_bank("me@example.com", "Benchmark")
+        for start in range(0, args.questions, BATCH_SIZE):
+            store.add_questions(bank_id, [question(n) for n in range(start, min(start + BATCH_SIZE, args.questions))])
+
+        print(f"{'format':>7}{'items':>9}{'peak MB':>9}{'seconds':>9}{'MB out':>9}")
+        for fmt in FORMATS:
+            for size in (small, args.questions):
+                items = itertools.islice(store.iter_questions(bank_id), size)
+                peak, seconds, written = measure(fmt, items)
+                print(f"{fmt:>7}{size:>9}{peak:>9.2f}{seconds:>9.2f}{written / 1e6:>9.1f}")
+            if peak > args.max_mb:
+                failed.append(f"{fmt} peaked at {peak:.2f} MB")
+    if failed:
+        print(f"FAIL: {', '.join(failed)} (limit {args.max_mb} MB)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
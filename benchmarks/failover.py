@@ -0,0 +1,174 @@
+"""
+Tail latency with and without hedged requests, and failover during an outage.
+
+Two local stand-in endpoints are started (see benchmarks/standin.py). The
+primary is fast except for a slow tail of requests; the secondary is a
+little slower but steady. The same --requests completions are run through a
+ProviderPool with hedging off and on, and p50/p90/p99 latency and the
+endpoint that answered are reported. A third run takes the primary down
+completely and checks that every request is still answered by the
+secondary once its circuit breaker opens. Finally, in-process endpoints
+go through both breakers opening, recovering and the primary failing
+again, which must still fail over to the secondary.
+
+Exits non-zero when hedging does not bring p99 under --max-p99-ms, when
+any request fails during the outage, or when failover does not survive
+the recovery:
+
+    python benchmarks/failover.py --requests 200 --max-p99-ms 600
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.standin import StandIn, serve  # noqa: E402
+from study_engine.providers import Endpoint, ProviderError, ProviderPool  # noqa: E402
+
+MESSAGES = [{"role": "system", "content": "Return JSON."}, {"role": "user", "content": "Make flashcards."}]
+
+
+class ToggleEndpoint(Endpoint):
+    """In-process endpoint that fails while down is set."""
+
+    def __init__(self, name: str):
+        super().__init__(name, "http://127.0.0.1:9")
+        self.down = False
+
+    def stream_chat(self, model, messages, first_token=None, cancelled=None):
+        if self.down:
+            raise OSError(f"{self.name} is down")
+        if first_token is not None:
+            first_token.set()
+        return "{}", None
+
+
+def recovery() -> list:
+    """
+    Open both breakers, let them recover, then fail the primary; returns the
+    problems found. A breaker whose probe was claimed without being sent
+    stays half-open and makes the last request fail.
+    """
+    primary, secondary = ToggleEndpoint("primary"), ToggleEndpoint("secondary")
+    pool = ProviderPool([primary, secondary], failure_threshold=1, open_seconds=0.05)
+    problems = []
+    primary.down = secondary.down = True
+    try:
+        pool.complete("large", MESSAGES)
+        problems.append("a request succeeded with both endpoints down")
+    except ProviderError:
+        pass
+    time.sleep(0.1)
+    primary.down = secondary.down = False
+    if pool.complete("large", MESSAGES)["endpoint"] != "primary":
+        problems.append("the recovered primary did not answer")
+    primary.down = True
+    try:
+        pool.complete("large", MESSAGES)
+    except ProviderError as e:
+        problems.append(f"no failover after recovery: {e}")
+    states = {name: state["state"] for name, state in pool.snapshot().items()}
+    if states["secondary"] != "closed":
+        problems.append(f"secondary breaker left {states['secondary']}")
+    return problems
+
+
+def percentile(samples: list, share: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def run(pool: ProviderPool, requests: int, concurrency: int) -> tuple:
+    """(latencies of answered requests in seconds, winner counts, hedges sent, failures)."""
+    def one(_):
+        try:
+            return pool.complete("large", MESSAGES)
+        except ProviderError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(one, range(requests)))
+    answered = [r for r in results if r]
+    return ([r["latency"] for r in answered], Counter(r["endpoint"] for r in answered),
+            sum(r["hedged"] for r in answered), len(results) - len(answered))
+
+
+def report(name: str, latencies: list, winners: Counter, hedges: int, failures: int):
+    if not latencies:
+        print(f"{name:<10}{'all requests failed':>30}")
+        return
+    p50, p90, p99 = (percentile(latencies, p) * 1000 for p in (0.5, 0.9, 0.99))
+    won = ", ".join(f"{endpoint} {count}" for endpoint, count in winners.most_common())
+    print(f"{name:<10}{p50:>8.0f}{p90:>8.0f}{p99:>8.0f}{hedges:>8}{failures:>9}   {won}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure hedged requests and failover against local stand-ins")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--first-token-ms", type=float, default=40, help="Primary's usual first-token delay")
+    parser.add_argument("--secondary-ms", type=float, default=80, help="Secondary's first-token delay")
+    parser.add_argument("--tail-rate", type=float, default=0.05, help="Share of slow primary requests")
+    parser.add_argument("--tail-ms", type=float, default=1500, help="First-token delay of slow requests")
+    parser.add_argument("--max-p99-ms", type=float, default=600, help="Fail when hedged p99 is above this")
+    args = parser.parse_args(argv)
+
+    secondary_server, secondary_url = serve(StandIn(args.secondary_ms / 1000, seed=2))
+    servers = [secondary_server]
+
+    def pool(primary: StandIn, hedge: bool) -> ProviderPool:
+        server, url = serve(primary)
+        servers.append(server)
+        return ProviderPool(
+            [Endpoint("primary", url), Endpoint("secondary", secondary_url)],
+            hedge=hedge, default_hedge_seconds=args.first_token_ms * 3 / 1000, open_seconds=60,
+        )
+
+    def tailed() -> StandIn:
+        return StandIn(args.first_token_ms / 1000, args.tail_rate, args.tail_ms / 1000, seed=1)
+
+    print(f"{'run':<10}{'p50 ms':>8}{'p90 ms':>8}{'p99 ms':>8}{'hedges':>8}{'failures':>9}   answered by")
+    failed = False
+    try:
+        report("unhedged", *run(pool(tailed(), False), args.requests, args.concurrency))
+        hedged_pool = pool(tailed(), True)
+        latencies, winners, hedges, failures = run(hedged_pool, args.requests, args.concurrency)
+        report("hedged", latencies, winners, hedges, failures)
+        print(f"hedge after: {hedged_pool.hedge_delay(hedged_pool.endpoints[0]) * 1000:.0f} ms "
+              "(primary's observed p90 time to first token)")
+        if failures or not latencies or percentile(latencies, 0.99) * 1000 > args.max_p99_ms:
+            print(f"FAIL: hedged p99 is above {args.max_p99_ms:.0f} ms")
+            failed = True
+
+        outage_pool = pool(StandIn(args.first_token_ms / 1000, fail_rate=1.0), True)
+        start = time.perf_counter()
+        latencies, winners, hedges, failures = run(outage_pool, args.requests, args.concurrency)
+        report("outage", latencies, winners, hedges, failures)
+        state = outage_pool.snapshot()["primary"]
+        print(f"outage: primary circuit {state['state']} after {state['requests']} attempts, "
+              f"{time.perf_counter() - start:.1f} s for {args.requests} requests "
+              f"(median {statistics.median(latencies) * 1000:.0f} ms)" if latencies else "")
+        if failures:
+            print(f"FAIL: {failures} requests failed while the primary was down")
+            failed = True
+
+        problems = recovery()
+        print(f"recovery: {'; '.join(problems) if problems else 'failover works after both breakers recover'}")
+        if problems:
+            print("FAIL: failover after recovery")
+            failed = True
+    finally:
+        for server in servers:
+            server.shutdown()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Registry, timer and baseline comparison for the benchmark suite.
+
+Cases are plain functions registered with @case. Each receives a
+Benchmark and calls it with the code to time, the way pytest-benchmark's
+fixture is used:
+
+    @case("micro", "extract_json.fenced")
+    def extract_fenced(benchmark):
+        benchmark(extract_json, FENCED_RESPONSE)
+
+The timer runs the code once to warm up and picks an iteration count so a
+round takes at least min_time, then times `rounds` rounds. Results are
+seconds per call.
+
+Comparisons use the fastest round, which is the least disturbed by other
+work on the machine. Right before each case a fixed pure-Python loop is
+timed as well and stored with the case. The ratio of the median loop
+times of two runs, scale_factor(), tracks both a different host and a
+slow spell on the same one: on a shared single-vCPU VM it followed the
+median slowdown of a whole run to within 10%. It does not follow single
+cases, and it does not follow disk and SQLite speed, so those still need
+the per-case thresholds and a second measurement.
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_METRIC = "min"
+CALIBRATION_LOOPS = 100000
+
+CASES = {}
+
+
+def case(group: str, name: str, rounds: int = None, min_time: float = None, threshold: float = None):
+    """Register a benchmark case; threshold overrides the allowed slowdown for noisy cases."""
+    def register(func):
+        if name in CASES:
+            raise ValueError(f"Duplicate benchmark {name}")
+        CASES[name] = {"group": group, "func": func, "rounds": rounds, "min_time": min_time,
+                       "threshold": threshold}
+        return func
+    return register
+
+
+class Benchmark:
+    """Times one callable; stats is set after it has been called."""
+
+    def __init__(self, rounds: int = 7, min_time: float = 0.05):
+        self.rounds = rounds
+        self.min_time = min_time
+        self.stats = None
+
+    def __call__(self, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        once = time.perf_counter() - start
+        iterations = max(1, int(self.min_time / once)) if once > 0 else 1000
+        times = []
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func(*args, **kwargs)
+            times.append((time.perf_counter() - start) / iterations)
+        self.stats = {
+            "min": min(times), "median": statistics.median(times), "mean": statistics.mean(times),
+            "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "rounds": self.rounds, "iterations": iterations,
+        }
+        return result
+
+
+def calibrate() -> float:
+    """Seconds for a fixed pure-Python loop, the best of nine, as a measure of current machine speed."""
+    best = float("inf")
+    for _ in range(9):
+        start = time.perf_counter()
+        total = 0
+        for i in range(CALIBRATION_LOOPS):
+            total += i % 7
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(groups: list = None, match: str = "", rounds: int = None, progress=None, names: list = None) -> dict:
+    """
+    Run the registered cases in the given groups whose names contain match,
+    or the cases in names; returns name -> stats.
+    """
+    results = {}
+    for name, spec in CASES.items():
+        if names is not None and name not in names:
+            continue
+        if (groups and spec["group"] not in groups) or match not in name:
+            continue
+        min_time = 0.05 if spec["min_time"] is None else spec["min_time"]
+        benchmark = Benchmark(rounds or spec["rounds"] or 7, min_time)
+        calibration = calibrate()
+        spec["func"](benchmark)
+        if benchmark.stats is None:
+            raise RuntimeError(f"Benchmark {name} did not call its benchmark argument")
+        results[name] = dict(benchmark.stats, group=spec["group"], calibration=calibration)
+        if progress:
+            progress(name, results[name])
+    return results
+
+
+def machine() -> dict:
+    """What identifies the host a run was measured on."""
+    return {"host": platform.node(), "cpus": os.cpu_count(), "python": platform.python_version(),
+            "platform": platform.platform(), "implementation": sys.implementation.name}
+
+
+def save(path, results: dict):
+    baseline = {"machine": machine(), "results": results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def scale_factor(results: dict, baseline: dict) -> float:
+    """How much slower this run's machine is than the baseline's, from the median calibration loop times."""
+    shared = [name for name in results if name in baseline["results"]]
+    if not shared:
+        return 1.0
+    return (statistics.median(results[name]["calibration"] for name in shared)
+            / statistics.median(baseline["results"][name]["calibration"] for name in shared))
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD, metric: str = DEFAULT_METRIC,
+            factor: float = 1.0) -> list:
+    """
+    Rows of (name, baseline seconds, current seconds, ratio, regressed) for
+    cases present in both runs, with baseline times multiplied by factor.
+    """
+    rows = []
+    for name in results:
+        if name not in baseline["results"]:
+            continue
+        expected = baseline["results"][name][metric] * factor
+        ratio = results[name][metric] / expected if expected else 1.0
+        limit = CASES[name]["threshold"] if name in CASES and CASES[name]["threshold"] is not None else threshold
+        rows.append((name, expected, results[name][metric], ratio, ratio > 1 + limit))
+    return rows
@@ -0,0 +1,156 @@
+"""
+Macro benchmarks: whole user flows against the offline stand-in.
+
+* upload: a 1 MB text file and a 20-page PDF through the upload spool,
+  from the raw stream to the extracted text;
+* generate: the flashcard and quiz pages' pipelines from an uploaded PDF
+  to validated, deduplicated items (compression, chunk selection,
+  prompts, model calls, JSON parsing, the question bank), with
+  OfflineEndpoint in place of the model;
+* render: drawing generated flashcards and a matching game with
+  Streamlit's AppTest;
+* app: the whole Flashcards page in the running app, from pasting notes
+  to the cards on screen, with a local stand-in server as the endpoint.
+
+Every call starts from empty stores, so nothing is reused between rounds.
+Run them with benchmarks/suite.py.
+"""
+
+import io
+import itertools
+import json
+import os
+import time
+
+from benchmarks import synthetic
+from benchmarks.harness import case
+from benchmarks.micro import fresh
+from benchmarks.standin import CANNED, OfflineEndpoint, StandIn, serve
+from study_engine.ai import AIProvider
+from study_engine.artifacts import ArtifactStore
+from study_engine.compression import compress_notes
+from study_engine.generation import run_bank_quiz, run_incremental_flashcards
+from study_engine.providers import ProviderPool
+from study_engine.question_banks import DocumentQuestionBank
+from study_engine.uploads import UploadSpool
+
+# Whole flows vary by up to 80% between runs on the same host (rendering most),
+# so only a doubling counts as a regression.
+MACRO = {"rounds": 5, "min_time": 0, "threshold": 1.0}
+
+_runs = itertools.count()
+TEXT_UPLOAD = synthetic.notes(170000).encode("utf-8")
+PDF_UPLOAD = synthetic.pdf_bytes(20)
+
+
+def fresh_spool() -> UploadSpool:
+    return UploadSpool(fresh("spool"), 100_000_000, 1_000_000_000)
+
+
+def upload(data: bytes, name: str) -> tuple:
+    """(handle, text) of a fresh upload."""
+    spool = fresh_spool()
+    handle = spool.spool(io.BytesIO(data), name)
+    with spool.open_text(handle, "bench") as text:
+        return handle, text
+
+
+def offline_provider() -> AIProvider:
+    return AIProvider(pool=ProviderPool([OfflineEndpoint()]))
+
+
+@case("macro", "upload.text_1mb", **MACRO)
+def upload_text(benchmark):
+    benchmark(upload, TEXT_UPLOAD, "notes.txt")
+
+
+@case("macro", "upload.pdf_20_pages", **MACRO)
+def upload_pdf(benchmark):
+    benchmark(upload, PDF_UPLOAD, "notes.pdf")
+
+
+@case("macro", "generate.flashcards", **MACRO)
+def generate_flashcards(benchmark):
+    provider = offline_provider()
+
+    def flow():
+        notes, before, after = compress_notes(upload(PDF_UPLOAD, "notes.pdf")[1])
+        store = ArtifactStore(fresh("artifacts.db"))
+        return run_incremental_flashcards(provider, notes, 10, store, compression=[before, after])
+
+    benchmark(flow)
+
+
+@case("macro", "generate.quiz", **MACRO)
+def generate_quiz(benchmark):
+    provider = offline_provider()
+
+    def flow():
+        handle, text = upload(PDF_UPLOAD, "notes.pdf")
+        content, before, after = compress_notes(text)
+        bank = DocumentQuestionBank(fresh("bank.db"))
+        return run_bank_quiz(provider, content[:3000], 5, bank, "bench@example.com", handle["id"],
+                             compression=[before, after])
+
+    benchmark(flow)
+
+
+def _render_flashcards_page(data):
+    from study_engine.ui.features.flashcards import render_flashcards
+    render_flashcards(data)
+
+
+def _render_matching_page(data):
+    from study_engine.ui.features.matching import render_matching
+    render_matching(data)
+
+
+def render(script, data: dict):
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_function(script, args=(data,), default_timeout=60).run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+@case("macro", "render.flashcards", **MACRO)
+def render_flashcards(benchmark):
+    data = {"title": CANNED["title"], "flashcards": CANNED["flashcards"] * 4}
+    benchmark(render, _render_flashcards_page, data)
+
+
+@case("macro", "render.matching", **MACRO)
+def render_matching(benchmark):
+    data = {"title": CANNED["title"], "pairs": CANNED["pairs"]}
+    benchmark(render, _render_matching_page, data)
+
+
+@case("macro", "app.flashcards", **dict(MACRO, rounds=3))
+def app_flashcards(benchmark):
+    from streamlit.testing.v1 import AppTest
+    from study_engine.config import BASE_DIR
+
+    _, url = serve(StandIn(first_token=0, chunk_delay=0))
+    os.environ["AI_ENDPOINTS"] = json.dumps([{"name": "standin", "base_url": url}])
+    os.environ["DATABASE_PATH"] = str(fresh("app.db"))
+    notes = synthetic.notes(1500)
+
+    def flow():
+        at = AppTest.from_file(str(BASE_DIR / "app.py"), default_timeout=60)
+        at.session_state.current_page = "app"
+        at.session_state.authenticated = True
+        at.session_state.username = "Bench"
+        at.session_state.user_email = "bench@example.com"
+        at.run()
+        at.sidebar.radio[0].set_value("🎴 Flashcards").run()
+        at.text_area[0].input(f"{notes}\n\nRun {next(_runs)}.").run()
+        at.checkbox(key="flashcard_reuse").uncheck()
+        at.button[0].click().run()
+        for _ in range(600):
+            if at.exception or any("Generated" in s.value for s in at.success):
+                break
+            time.sleep(0.01)
+            at.run()
+        if at.exception or not any("Generated" in s.value for s in at.success):
+            raise RuntimeError(f"Flashcards did not render: {at.exception or [e.value for e in at.error]}")
+
+    benchmark(flow)
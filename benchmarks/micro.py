@@ -0,0 +1,148 @@
+"""
+Micro benchmarks: the hot functions on fixed synthetic inputs.
+
+* extract_json on each response shape it has a path for;
+* the sanitization steps between a model response and a page: expanding
+  the compact format, validating quiz items and compressing uploaded notes;
+* PDF text extraction of a 20-page document;
+* prompt formatting with long notes;
+* the SQLite helpers behind login, the state store, question banks and
+  the progress page.
+
+Run them with benchmarks/suite.py.
+"""
+
+import atexit
+import itertools
+import os
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+from benchmarks import synthetic
+from benchmarks.harness import case
+from study_engine import db
+from study_engine.ai import extract_json
+from study_engine.attempts import AttemptStore
+from study_engine.compression import compress_notes
+from study_engine.kvstore import open_store
+from study_engine.prompts import format_user_prompt
+from study_engine.question_banks import DocumentQuestionBank
+from study_engine.schemas import validate_quiz
+from study_engine.uploads import _extract_pdf
+from study_engine.wire import expand_output
+
+WORKDIR = Path(tempfile.mkdtemp(prefix="study_engine_bench_"))
+atexit.register(shutil.rmtree, WORKDIR, True)
+_files = itertools.count()
+
+# Disk-bound timings vary more between runs than pure-Python ones.
+SQLITE = {"threshold": 0.5}
+
+RESPONSES = synthetic.responses()
+NOTES = synthetic.notes(5000, boilerplate=True)
+LONG_NOTES = synthetic.notes(20000)
+
+
+def fresh(name: str) -> Path:
+    """A new file path in the work directory, so a case measured again starts from the same state."""
+    return WORKDIR / f"{next(_files)}-{name}"
+
+
+def users_database() -> Path:
+    path = fresh("users.db")
+    os.environ["DATABASE_PATH"] = str(path)
+    db.init_database()
+    for n in range(1000):
+        db.add_user(f"student{n}@example.com", f"Student {n}", db.hash_password(str(n)))
+    return path
+
+
+for shape, text in RESPONSES.items():
+    case("micro", f"extract_json.{shape}")(lambda benchmark, text=text: benchmark(extract_json, text))
+
+
+@case("micro", "sanitize.validate_quiz")
+def validate_verbose_quiz(benchmark):
+    benchmark(validate_quiz, {"title": "Quiz", "questions": synthetic.quiz_items(50)})
+
+
+@case("micro", "sanitize.expand_compact_quiz")
+def expand_compact_quiz(benchmark):
+    data = synthetic.compact_quiz(50)
+    benchmark(lambda: validate_quiz(expand_output("quiz", data)))
+
+
+@case("micro", "sanitize.compress_notes")
+def compress_uploaded_notes(benchmark):
+    benchmark(compress_notes, NOTES)
+
+
+@case("micro", "pdf.extract_20_pages", rounds=5)
+def extract_pdf(benchmark):
+    source = fresh("notes.pdf")
+    source.write_bytes(synthetic.pdf_bytes(20))
+    benchmark(_extract_pdf, source, fresh("notes.txt"))
+
+
+for feature in ("flashcards", "quiz", "summary"):
+    for output_format in ("verbose", "compact"):
+        case("micro", f"prompts.{feature}.{output_format}")(
+            lambda benchmark, feature=feature, output_format=output_format: benchmark(
+                format_user_prompt, feature, output_format, content=LONG_NOTES, num=10
+            )
+        )
+
+
+@case("micro", "sqlite.get_user", **SQLITE)
+def get_user(benchmark):
+    users_database()
+    benchmark(db.get_user, "student500@example.com")
+
+
+@case("micro", "sqlite.list_users_page", **SQLITE)
+def list_users_page(benchmark):
+    users_database()
+    benchmark(db.list_users, "stu", "email")
+
+
+@case("micro", "sqlite.kv_set", **SQLITE)
+def kv_set(benchmark):
+    store = open_store(None, fresh("state.db"))
+    value = {"quiz_data": synthetic.quiz_items(10)}
+    benchmark(store.set, "session:bench", value, 600)
+
+
+@case("micro", "sqlite.kv_get", **SQLITE)
+def kv_get(benchmark):
+    store = open_store(None, fresh("state.db"))
+    store.set("session:bench", {"quiz_data": synthetic.quiz_items(10)}, ttl=600)
+    benchmark(store.get, "session:bench")
+
+
+@case("micro", "sqlite.record_attempt", **SQLITE)
+def record_attempt(benchmark):
+    store = AttemptStore(fresh("attempts.db"))
+    answers = [(q["question"], "A", i % 3 != 0, 12.0) for i, q in enumerate(synthetic.quiz_items(10))]
+    benchmark(store.record_attempt, "me@example.com", "Cell Biology", answers)
+
+
+@case("micro", "sqlite.progress", **SQLITE)
+def progress(benchmark):
+    store = AttemptStore(fresh("attempts.db"))
+    answers = [(q["question"], "A", i % 3 != 0, 12.0) for i, q in enumerate(synthetic.quiz_items(10))]
+    for _ in range(200):
+        store.record_attempt("reader@example.com", "Cell Biology", answers)
+    benchmark(store.progress, "reader@example.com")
+
+
+@case("micro", "sqlite.sample_unseen", **SQLITE)
+def sample_unseen(benchmark):
+    bank = DocumentQuestionBank(fresh("bank.db"))
+    rng = random.Random(4)
+    questions = validate_quiz({"questions": synthetic.quiz_items(2000)})["questions"]
+    for start in range(0, len(questions), 200):
+        bank.add("notes-fingerprint", "", "Cell Biology", questions[start:start + 200])
+    bank.mark_seen("me@example.com", "notes-fingerprint", "", rng.sample(range(2000), 500))
+    benchmark(bank.sample_unseen, "me@example.com", "notes-fingerprint", "", 10)
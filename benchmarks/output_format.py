@@ -0,0 +1,125 @@
+"""
+Output tokens and end-to-end time of a 15-question quiz, verbose vs compact.
+
+Offline (the default), the same 15 questions are serialized in both wire
+formats the way the model writes them. The benchmark compares their output
+tokens and estimates generation time from --tokens-per-second. It also times
+the local parse, expansion and validation, and checks that the compact form
+expands to exactly the verbose quiz.
+
+With --live and GROQ_API_KEY set, each format is requested --runs times from
+the model for a corpus document and the measured wall time and response
+tokens are reported instead.
+
+    python benchmarks/output_format.py
+    python benchmarks/output_format.py --live --runs 3
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from study_engine.ai import extract_json  # noqa: E402
+from study_engine.compression import compress_notes  # noqa: E402
+from study_engine.config import load_env  # noqa: E402
+from study_engine.prompts import QUIZ_SYSTEM, format_user_prompt  # noqa: E402
+from study_engine.retrieval import estimate_tokens  # noqa: E402
+from study_engine.schemas import validate_quiz  # noqa: E402
+from study_engine.wire import expand_output  # noqa: E402
+
+NUM_QUESTIONS = 15
+
+
+def sample_quiz() -> dict:
+    questions = []
+    for i in range(1, NUM_QUESTIONS + 1):
+        correct = i % 4
+        questions.append({
+            "id": i,
+            "question": f"Which organelle is responsible for step {i} of the process described in the notes?",
+            "options": [
+                {"label": label, "text": f"The {name} of the cell", "is_correct": n == correct}
+                for n, (label, name) in enumerate(zip("ABCD", ["nucleus", "mitochondrion", "ribosome", "lysosome"]))
+            ],
+            "explanation": f"The notes state that step {i} takes place in this organelle.",
+        })
+    return {"title": "Quiz", "questions": questions}
+
+
+def to_compact(quiz: dict) -> dict:
+    return {"t": quiz["title"], "q": [
+        [q["question"], [o["text"] for o in q["options"]],
+         next(i for i, o in enumerate(q["options"]) if o["is_correct"]), q["explanation"]]
+        for q in quiz["questions"]
+    ]}
+
+
+def local_time(text: str, repeat: int = 200) -> float:
+    """Milliseconds to parse, expand and validate one response."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        validate_quiz(expand_output("quiz", extract_json(text)))
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def offline(tokens_per_second: float) -> int:
+    verbose = sample_quiz()
+    compact = to_compact(verbose)
+    if validate_quiz(expand_output("quiz", compact)) != validate_quiz(verbose):
+        print("FAIL: compact quiz does not expand to the verbose quiz")
+        return 1
+    print(f"{'format':<10}{'chars':>8}{'tokens':>8}{'generate (s)':>14}{'local (ms)':>12}")
+    results = {}
+    for name, data in (("verbose", verbose), ("compact", compact)):
+        text = json.dumps(data)
+        tokens = estimate_tokens(text)
+        results[name] = tokens
+        print(f"{name:<10}{len(text):>8}{tokens:>8}{tokens / tokens_per_second:>14.2f}{local_time(text):>12.3f}")
+    print(f"compact output is {1 - results['compact'] / results['verbose']:.0%} smaller")
+    return 0
+
+
+def live(runs: int) -> int:
+    load_env()
+    from study_engine.ai import AIProvider
+    provider = AIProvider()
+    if not provider.is_configured():
+        print("GROQ_API_KEY is not set")
+        return 2
+    content, _, _ = compress_notes((ROOT / "benchmarks" / "corpus" / "lecture_pdf.txt").read_text(encoding="utf-8"))
+    print(f"{'format':<10}{'median s':>10}{'tokens':>8}{'valid':>8}")
+    for output_format in ("verbose", "compact"):
+        prompt = format_user_prompt("quiz", output_format, num=NUM_QUESTIONS, content=content)
+        times, tokens, valid = [], [], 0
+        for _ in range(runs):
+            start = time.perf_counter()
+            text = provider.generate(QUIZ_SYSTEM, prompt, "quiz")
+            try:
+                validate_quiz(expand_output("quiz", extract_json(text)))
+                valid += 1
+            except ValueError:
+                pass
+            times.append(time.perf_counter() - start)
+            tokens.append(estimate_tokens(text))
+        print(f"{output_format:<10}{statistics.median(times):>10.2f}{int(statistics.median(tokens)):>8}{valid:>5}/{runs}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare verbose and compact model output for a 15-question quiz")
+    parser.add_argument("--live", action="store_true", help="Call the model instead of using a fixed sample")
+    parser.add_argument("--runs", type=int, default=3, help="Live requests per format")
+    parser.add_argument("--tokens-per-second", type=float, default=250.0,
+                        help="Output speed used to estimate generation time offline")
+    args = parser.parse_args(argv)
+    return live(args.runs) if args.live else offline(args.tokens_per_second)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Read time of the progress page as a user's quiz history grows.
+
+A fresh database is filled with --attempts 10-question quizzes for one user
+(spread over 50 topics and a pool of 2,000 questions), plus the same number
+for other users. The median time of AttemptStore.progress is reported at
+several history sizes, along with the median time to record one attempt.
+Because the page reads maintained aggregates, both should stay flat. Exits
+non-zero when reading the largest history takes longer than --max-ms:
+
+    python benchmarks/progress.py --attempts 5000 --max-ms 5
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from study_engine.attempts import AttemptStore  # noqa: E402
+
+QUESTIONS_PER_QUIZ = 10
+TOPICS = 50
+QUESTION_POOL = 2000
+
+
+def quiz(rng: random.Random) -> tuple:
+    topic = f"Topic {rng.randrange(TOPICS)}"
+    answers = [
+        (f"Question {rng.randrange(QUESTION_POOL)} about {topic}?", rng.choice("ABCD"), rng.random() < 0.7,
+         rng.uniform(3, 30))
+        for _ in range(QUESTIONS_PER_QUIZ)
+    ]
+    return topic, answers
+
+
+def median_ms(action, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        action()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time the progress page read as quiz history grows")
+    parser.add_argument("--attempts", type=int, default=5000, help="Largest history size, checked against --max-ms")
+    parser.add_argument("--runs", type=int, default=50, help="Timed reads per size (median is reported)")
+    parser.add_argument("--max-ms", type=float, default=5.0, help="Fail when reading the largest history is slower")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AttemptStore(Path(tmp) / "progress.db")
+        sizes = sorted({10, 100, 1000, args.attempts})
+        recorded = 0
+        print(f"{'attempts':>9}{'read ms':>9}{'write ms':>10}")
+        read = 0.0
+        for size in sizes:
+            write_times = []
+            while recorded < size:
+                start = time.perf_counter()
+                store.record_attempt("me@example.com", *quiz(rng))
+                write_times.append((time.perf_counter() - start) * 1000)
+                store.record_attempt(f"user{recorded % 100}@example.com", *quiz(rng))
+                recorded += 1
+            read = median_ms(lambda: store.progress("me@example.com"), args.runs)
+            print(f"{size:>9}{read:>9.2f}{statistics.median(write_times) if write_times else 0:>10.2f}")
+    if read > args.max_ms:
+        print(f"FAIL: reading {args.attempts} attempts took {read:.2f} ms (limit {args.max_ms} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Local stand-in for an OpenAI-compatible chat endpoint.
+
+It answers POST /chat/completions with a canned study response, streamed as
+server-sent events, after a configurable delay before the first token. A
+fraction of requests can be made slow (a long tail) or fail with HTTP 503,
+so failover and hedging can be exercised without network access or keys.
+
+    python benchmarks/standin.py --port 8001 --first-token-ms 80 --tail-rate 0.1 --tail-ms 1500
+
+then point the app at it:
+
+    AI_ENDPOINTS='[{"name": "local", "base_url": "http://127.0.0.1:8001"}]'
+
+OfflineEndpoint gives the same answer in-process, without a socket, for
+benchmarks that time the app's own code (see benchmarks/macro.py).
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from study_engine.providers import Endpoint  # noqa: E402
+
+CHUNK_CHARS = 40
+
+_STAGES = [
+    ("glycolysis", "the cytoplasm", "splits glucose into two pyruvate molecules"),
+    ("pyruvate oxidation", "the mitochondrial matrix", "turns pyruvate into acetyl-CoA and releases CO2"),
+    ("the Krebs cycle", "the mitochondrial matrix", "oxidizes acetyl-CoA and loads NADH and FADH2"),
+    ("the electron transport chain", "the inner mitochondrial membrane", "pumps protons using electrons from NADH"),
+    ("chemiosmosis", "the inner mitochondrial membrane", "uses the proton gradient to make most of the ATP"),
+]
+_PLACES = ["the cytoplasm", "the mitochondrial matrix", "the inner mitochondrial membrane", "the nucleus"]
+CANNED = {
+    "title": "Cell Biology",
+    "flashcards": [{"id": i, "question": question, "answer": f"{stage[0].upper()}{stage[1:]} {does}."}
+                   for i, (question, (stage, _, does)) in enumerate(zip([
+                       "How does respiration begin?", "What links glycolysis to the Krebs cycle?",
+                       "Which cycle produces most NADH?", "What pumps protons across the membrane?",
+                       "How is the bulk of ATP made?",
+                   ], _STAGES), 1)],
+    "questions": [
+        {"id": i, "question": f"Where in the cell does {stage} take place?",
+         "options": [{"label": label, "text": text, "is_correct": text == where}
+                     for label, text in zip("ABCD", _PLACES)],
+         "explanation": f"{stage[0].upper()}{stage[1:]} happens in {where}, where it {does}."}
+        for i, (stage, where, does) in enumerate(_STAGES, 1)
+    ],
+    "pairs": [{"id": i, "term": stage, "definition": f"Happens in {where} and {does}"}
+              for i, (stage, where, does) in enumerate(_STAGES, 1)],
+    "summary": "Cells turn glucose into ATP.",
+    "outlines": [{"id": 1, "title": "Respiration", "content": "Glycolysis, Krebs cycle, electron transport",
+                  "sub_items": ["Glycolysis"]}],
+    "bullet_takeaways": ["Mitochondria make most of the ATP"],
+    "key_topics": [{"id": 1, "topic": "Respiration", "importance": "high"}],
+    "facts": [{"id": 1, "fact": "Glycolysis happens in the cytoplasm", "category": "location"}],
+    "overview": "How cells release energy from glucose.",
+    "key_points": ["Respiration has three stages"],
+    "terms": [{"term": "ATP", "definition": "The cell's energy currency"}],
+    "takeaways": ["Oxygen is the final electron acceptor"],
+    "is_correct": True, "score": 0.8, "feedback": "Mostly right.", "suggestions": ["Mention the Krebs cycle"],
+}
+
+
+class StandIn:
+    """Timing and failure behaviour of one stand-in endpoint."""
+
+    def __init__(self, first_token: float = 0.05, tail_rate: float = 0.0, tail: float = 1.0,
+                 fail_rate: float = 0.0, chunk_delay: float = 0.002, seed: int = None):
+        self.first_token = first_token
+        self.tail_rate = tail_rate
+        self.tail = tail
+        self.fail_rate = fail_rate
+        self.chunk_delay = chunk_delay
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def plan(self) -> tuple:
+        """(fail, seconds before the first token) for the next request."""
+        with self._lock:
+            self.requests += 1
+            fail = self._random.random() < self.fail_rate
+            slow = self._random.random() < self.tail_rate
+        return fail, self.tail if slow else self.first_token
+
+
+class OfflineEndpoint(Endpoint):
+    """Endpoint that streams the canned response from memory, with no network or delay."""
+
+    def __init__(self, name: str = "offline", response: dict = None):
+        super().__init__(name, "offline://")
+        self.text = json.dumps(response or CANNED)
+        self.requests = 0
+
+    def stream_chat(self, model: str, messages: list, first_token: threading.Event = None,
+                    cancelled: threading.Event = None) -> tuple:
+        self.requests += 1
+        parts = [self.text[start:start + CHUNK_CHARS] for start in range(0, len(self.text), CHUNK_CHARS)]
+        if first_token is not None:
+            first_token.set()
+        prompt = sum(len(m.get("content", "")) for m in messages) // 4
+        completion = len(self.text) // 4
+        return "".join(parts), {"prompt_tokens": prompt, "completion_tokens": completion,
+                                "total_tokens": prompt + completion}
+
+
+def _handler(standin: StandIn):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            fail, delay = standin.plan()
+            if fail:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            time.sleep(delay)
+            text = json.dumps(CANNED)
+            try:
+                for start in range(0, len(text), CHUNK_CHARS):
+                    self._event({"choices": [{"index": 0, "delta": {"content": text[start:start + CHUNK_CHARS]}}]})
+                    time.sleep(standin.chunk_delay)
+                if (body.get("stream_options") or {}).get("include_usage"):
+                    prompt = sum(len(m.get("content", "")) for m in body.get("messages", [])) // 4
+                    completion = len(text) // 4
+                    self._event({"choices": [], "usage": {"prompt_tokens": prompt, "completion_tokens": completion,
+                                                          "total_tokens": prompt + completion}})
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            self.close_connection = True
+
+        def _event(self, payload: dict):
+            self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode())
+            self.wfile.flush()
+
+    return Handler
+
+
+def serve(standin: StandIn, port: int = 0) -> tuple:
+    """Start a stand-in on a daemon thread; returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler(standin))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serve a local OpenAI-compatible stand-in endpoint")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--first-token-ms", type=float, default=50, help="Delay before the first token")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="Fraction of requests that are slow")
+    parser.add_argument("--tail-ms", type=float, default=1000, help="First-token delay of slow requests")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    args = parser.parse_args(argv)
+    standin = StandIn(args.first_token_ms / 1000, args.tail_rate, args.tail_ms / 1000, args.fail_rate)
+    server, url = serve(standin, args.port)
+    print(f"Serving on {url}; Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
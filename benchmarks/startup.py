@@ -0,0 +1,103 @@
+"""
+Cold-start benchmark for the Streamlit app.
+
+Each sample runs the app's first script run in a fresh interpreter, the way a
+woken container does, and reports:
+
+* time to first paint: the first script run of app.py, minus the same run of a
+  trivial one-line app so Streamlit's own startup is not counted;
+* the slowest imports from ``python -X importtime``;
+* heavy modules that must not be imported before a feature needs them.
+
+Exits non-zero when the median app overhead exceeds ``--max-ms`` or a deferred
+module was imported at startup, so it can gate changes in CI:
+
+    python benchmarks/startup.py --runs 5 --max-ms 250
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "app.py"
+DEFERRED_MODULES = ["PyPDF2", "study_engine.ui.main_app", "study_engine.ui.features"]
+
+RUNNER = """
+import sys, time
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=60).run()
+elapsed = time.perf_counter() - start
+if at.exception:
+    sys.exit("app raised: " + at.exception[0].message)
+print(f"ELAPSED {elapsed * 1000:.1f}")
+"""
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_once(app: Path, workdir: str, importtime: bool = False):
+    """First script run of `app` in a fresh interpreter; returns (ms, importtime stderr)."""
+    env = dict(os.environ, DATABASE_PATH=str(Path(workdir) / "bench.db"), PYTHONPATH=str(ROOT))
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", RUNNER, str(app)]
+    proc = subprocess.run(cmd, cwd=workdir, env=env, capture_output=True, text=True)
+    match = re.search(r"ELAPSED ([\d.]+)", proc.stdout)
+    if proc.returncode or not match:
+        sys.exit(f"benchmark run failed:\n{proc.stdout}\n{proc.stderr[-2000:]}")
+    return float(match.group(1)), proc.stderr
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Cumulative import time in microseconds per module."""
+    return {m.group(4): int(m.group(2)) for m in IMPORT_LINE.finditer(stderr)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure cold-start time of the Streamlit app")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per app (median is reported)")
+    parser.add_argument("--max-ms", type=float, default=250.0,
+                        help="Fail when the median app overhead over a trivial app exceeds this")
+    parser.add_argument("--top", type=int, default=10, help="Slowest project imports to list")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        trivial = Path(workdir) / "trivial_app.py"
+        trivial.write_text("import streamlit as st\nst.write('hello')\n")
+        app_times, base_times = [], []
+        for _ in range(args.runs):
+            base_times.append(run_once(trivial, workdir)[0])
+            app_times.append(run_once(APP, workdir)[0])
+        _, stderr = run_once(APP, workdir, importtime=True)
+
+    modules = parse_importtime(stderr)
+    app_ms = statistics.median(app_times)
+    base_ms = statistics.median(base_times)
+    overhead = app_ms - base_ms
+    print(f"first script run: app {app_ms:.1f} ms, trivial app {base_ms:.1f} ms, overhead {overhead:.1f} ms")
+
+    ours = sorted(((us, name) for name, us in modules.items() if name.split(".")[0] == "study_engine"), reverse=True)
+    print("slowest project imports (cumulative):")
+    for us, name in ours[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    eager = [name for name in modules if any(name == d or name.startswith(d + ".") for d in DEFERRED_MODULES)]
+    if eager:
+        print(f"FAIL: imported at startup but should be deferred: {', '.join(sorted(eager))}")
+        failed = True
+    if overhead > args.max_ms:
+        print(f"FAIL: overhead {overhead:.1f} ms exceeds --max-ms {args.max_ms:.1f}")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Micro and macro benchmark suite with a stored baseline.
+
+Runs the cases in benchmarks/micro.py and benchmarks/macro.py offline and
+prints seconds per call. Unless --no-compare is given, each case's fastest
+round is checked against the baseline file. A case that comes out slower
+by more than --threshold (the noisier SQLite and macro cases allow more)
+is measured again up to --retries times, keeping its best result, and the
+run exits non-zero if it is still too slow:
+
+    python benchmarks/suite.py                          # run and compare to benchmarks/baseline.json
+    python benchmarks/suite.py --group micro -k sqlite  # a subset
+    python benchmarks/suite.py --save                   # record a new baseline, the best of three runs
+
+Record the baseline from an otherwise idle system and commit it with the
+change that moved it. Before comparing, the baseline is scaled to the
+current speed of the machine, measured with a CPU calibration loop (see
+benchmarks/harness.py), so it also holds on other hosts. --no-scale
+compares raw times.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks import harness, macro, micro  # noqa: E402,F401
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def _duration(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and compare it to a baseline")
+    parser.add_argument("--group", choices=["micro", "macro"], action="append", help="Only these groups")
+    parser.add_argument("-k", dest="match", default="", help="Only cases whose name contains this")
+    parser.add_argument("--rounds", type=int, default=None, help="Rounds per case (default: per case)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="Baseline file")
+    parser.add_argument("--save", action="store_true", help="Write the results to the baseline file")
+    parser.add_argument("--save-runs", type=int, default=3,
+                        help="Runs to record with --save; each case keeps its fastest")
+    parser.add_argument("--no-compare", action="store_true", help="Only print the results")
+    parser.add_argument("--threshold", type=float, default=harness.DEFAULT_THRESHOLD,
+                        help="Allowed slowdown over the baseline, e.g. 0.25 for 25%%")
+    parser.add_argument("--no-scale", action="store_true",
+                        help="Do not adjust the baseline to this machine's current CPU speed")
+    parser.add_argument("--retries", type=int, default=2, help="Extra measurements of a case that regressed")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    print(f"{'benchmark':<34}{'min':>11}{'median':>11}{'stddev':>11}{'rounds':>8}")
+    results = harness.run(
+        args.group, args.match, args.rounds,
+        progress=lambda name, s: print(
+            f"{name:<34}{_duration(s['min']):>11}{_duration(s['median']):>11}{_duration(s['stddev']):>11}"
+            f"{s['rounds']:>5}x{s['iterations']}"
+        )
+    )
+    if not results:
+        print("No benchmarks matched")
+        return 1
+    if args.json:
+        harness.save(args.json, results)
+    if args.save:
+        # A baseline caught in a slow spell would hide real regressions later.
+        for _ in range(args.save_runs - 1):
+            for name, stats in harness.run(args.group, args.match, args.rounds).items():
+                if stats[harness.DEFAULT_METRIC] < results[name][harness.DEFAULT_METRIC]:
+                    results[name] = stats
+        if args.baseline.exists() and (args.group or args.match):
+            # Keep the cases this run skipped.
+            kept = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+            results = dict({name: stats for name, stats in kept.items() if name not in results}, **results)
+        harness.save(args.baseline, results)
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+    if args.no_compare or not args.baseline.exists():
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    recorded_on = baseline.get("machine", {}).get("host", "an unknown host")
+    factor = 1.0 if args.no_scale else harness.scale_factor(results, baseline)
+    print(f"\nBaseline from {recorded_on}, times x{factor:.2f} for this machine's current speed")
+    rows = harness.compare(results, baseline, args.threshold, factor=factor)
+    for _ in range(args.retries):
+        regressed = [row[0] for row in rows if row[4]]
+        if not regressed:
+            break
+        print(f"Measuring again: {', '.join(regressed)}")
+        for name, stats in harness.run(rounds=args.rounds, names=regressed).items():
+            if stats[harness.DEFAULT_METRIC] < results[name][harness.DEFAULT_METRIC]:
+                results[name] = stats
+        rows = harness.compare(results, baseline, args.threshold, factor=factor)
+    print(f"\n{'compared to baseline':<34}{'expected':>11}{'now':>11}{'change':>9}")
+    for name, expected, now, ratio, regressed in rows:
+        print(f"{name:<34}{_duration(expected):>11}{_duration(now):>11}{ratio - 1:>+9.0%}"
+              f"{'  REGRESSED' if regressed else ''}")
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"FAIL: {len(regressions)} benchmark(s) slower than the baseline allows: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
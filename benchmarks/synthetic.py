@@ -0,0 +1,110 @@
+"""
+Fixed synthetic inputs for the benchmark suite.
+
+Everything is generated from a seed, so every run times the same bytes:
+study notes, model responses in the shapes extract_json has to handle,
+quiz items for the validators, and a small text PDF written by hand so
+PDF extraction can be timed without fixture files.
+"""
+
+import json
+import random
+import zlib
+
+from benchmarks.standin import CANNED
+
+WORDS = (
+    "cell membrane protein enzyme glucose energy respiration mitochondria nucleus ribosome DNA RNA gene "
+    "transcription translation photosynthesis chlorophyll oxygen carbon dioxide water light reaction cycle "
+    "molecule atom bond ion gradient transport diffusion osmosis pressure temperature rate catalyst substrate "
+    "product pathway signal receptor hormone tissue organ system structure function evolution selection"
+).split()
+BOILERPLATE = ["BIO 101 Lecture Notes", "Page {page} of 40", "(c) University Press. All rights reserved."]
+
+
+def sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 18))]
+    return " ".join(words).capitalize() + "."
+
+
+def notes(words: int = 5000, seed: int = 1, boilerplate: bool = False) -> str:
+    """Paragraphs of study notes; with boilerplate, page headers and footers as a PDF extraction leaves them."""
+    rng = random.Random(seed)
+    paragraphs = []
+    count = 0
+    page = 1
+    while count < words:
+        paragraph = " ".join(sentence(rng) for _ in range(rng.randint(3, 6)))
+        count += len(paragraph.split())
+        paragraphs.append(paragraph)
+        if boilerplate and len(paragraphs) % 4 == 0:
+            paragraphs.append("\n".join(line.format(page=page) for line in BOILERPLATE) + "\f")
+            page += 1
+    return "\n\n".join(paragraphs)
+
+
+def quiz_items(count: int = 50, seed: int = 2) -> list:
+    """Verbose quiz questions as a model returns them, with uneven whitespace and mixed types."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        correct = rng.randrange(4)
+        items.append({
+            "id": str(i + 1),
+            "question": f"  {sentence(rng)[:-1]}?  ",
+            "options": [{"label": label, "text": sentence(rng), "is_correct": "true" if k == correct else ""}
+                        for k, label in enumerate("ABCD")],
+            "explanation": sentence(rng) if rng.random() < 0.8 else None,
+        })
+    return items
+
+
+def compact_quiz(count: int = 50, seed: int = 2) -> dict:
+    """The same questions in the compact wire format."""
+    return {"t": "Quiz", "q": [
+        [q["question"].strip(), [o["text"] for o in q["options"]],
+         "ABCD"[next(k for k, o in enumerate(q["options"]) if o["is_correct"])], q["explanation"]]
+        for q in quiz_items(count, seed)
+    ]}
+
+
+def responses(count: int = 20) -> dict:
+    """Model responses for extract_json: clean, fenced, wrapped in prose, with raw newlines, and Q/A text."""
+    data = dict(CANNED, questions=quiz_items(count))
+    clean = json.dumps(data)
+    pretty = json.dumps(data, indent=2)
+    flashcards = "\n".join(f"Q{i}: {sentence(random.Random(i))}\nA{i}: {sentence(random.Random(-i))}"
+                           for i in range(1, count + 1))
+    return {
+        "clean": clean,
+        "fenced": f"```json\n{pretty}\n```",
+        "prose": f"Sure! Here is the quiz you asked for:\n\n{pretty}\n\nLet me know if you want more questions.",
+        "newlines": clean.replace('. ', '.\n '),
+        "qa_text": f"Here are your flashcards.\n\n{flashcards}",
+    }
+
+
+def pdf_bytes(pages: int = 20, seed: int = 3) -> bytes:
+    """A text-only PDF of the given number of pages of notes."""
+    rng = random.Random(seed)
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for _ in range(pages):
+        lines = [sentence(rng)[:90] for _ in range(40)]
+        text = "".join(f"({line.replace('(', '').replace(')', '')}) Tj T* " for line in lines)
+        stream = zlib.compress(f"BT /F1 10 Tf 12 TL 50 780 Td {text}ET".encode("latin-1"))
+        objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents %d 0 R "
+                       b"/Resources << /Font << /F1 3 0 R >> >> >>" % len(objects))
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (" ".join(f"{k} 0 R" for k in kids).encode(), pages)
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
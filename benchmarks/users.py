@@ -0,0 +1,119 @@
+"""
+Per-page latency of the admin user listing at a million users.
+
+A fresh database is seeded with --users accounts (created over about a
+year, with generated emails and names). The median time of one
+list_users page is reported at the start, the middle and the end of the
+newest-first listing and of broad email and name prefix searches, along
+with the user count and a cached prefix count. With keyset pagination
+every page should cost about the same. Exits non-zero when any page takes
+longer than --max-ms:
+
+    python benchmarks/users.py --users 1000000 --max-ms 5
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from study_engine import db  # noqa: E402
+
+FIRST_NAMES = ["Ada", "Alan", "Grace", "Linus", "Barbara", "Edsger", "Donald", "Frances", "Ken", "Margaret",
+               "Dennis", "Radia", "Tim", "Katherine", "John", "Shafi"]
+LAST_NAMES = ["Lovelace", "Turing", "Hopper", "Torvalds", "Liskov", "Dijkstra", "Knuth", "Allen", "Thompson",
+              "Hamilton", "Ritchie", "Perlman", "Berners-Lee", "Johnson", "Backus", "Goldwasser"]
+SEARCHES = [("", "email"), ("a", "email"), ("grace", "name")]
+
+
+def seed(path: str, users: int, rng: random.Random):
+    start = time.mktime((2025, 1, 1, 0, 0, 0, 0, 0, -1))
+    conn = sqlite3.connect(path)
+    batch = []
+    for n in range(users):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        created = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(start + n * 365 * 86400 // users))
+        batch.append((f"{first.lower()}.{last.lower()}{n}@example.com", f"{first} {last}", "x" * 64, created))
+        if len(batch) == 10000:
+            conn.executemany('INSERT INTO users (email, name, password_hash, created_at) VALUES (?, ?, ?, ?)', batch)
+            conn.commit()
+            batch = []
+    conn.executemany('INSERT INTO users (email, name, password_hash, created_at) VALUES (?, ?, ?, ?)', batch)
+    conn.commit()
+    conn.close()
+
+
+def cursor_at(path: str, query: str, field: str, offset: int) -> list:
+    """The cursor list_users would return after offset rows (found with OFFSET, outside the timing)."""
+    conn = sqlite3.connect(path)
+    if query:
+        row = conn.execute(
+            f"SELECT {field}, id FROM users WHERE {field} LIKE ? ORDER BY {field} COLLATE NOCASE, id "
+            "LIMIT 1 OFFSET ?",
+            (query + "%", offset - 1)
+        ).fetchone()
+    else:
+        row = conn.execute(
+            'SELECT created_at, id FROM users ORDER BY created_at DESC, id DESC LIMIT 1 OFFSET ?', (offset - 1,)
+        ).fetchone()
+    conn.close()
+    return list(row) if row else None
+
+
+def median_ms(action, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        action()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time admin user listing pages at depth")
+    parser.add_argument("--users", type=int, default=1000000, help="Number of seeded accounts")
+    parser.add_argument("--runs", type=int, default=30, help="Timed reads per page (median is reported)")
+    parser.add_argument("--max-ms", type=float, default=5.0, help="Fail when any page is slower")
+    args = parser.parse_args(argv)
+
+    worst = 0.0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "users.db")
+        os.environ["DATABASE_PATH"] = path
+        db.init_database()
+        start = time.perf_counter()
+        seed(path, args.users, random.Random(5))
+        print(f"Seeded {args.users:,} users in {time.perf_counter() - start:.1f} s")
+
+        print(f"{'search':>14}{'matches':>10}{'first ms':>10}{'middle ms':>11}{'last ms':>9}")
+        for query, field in SEARCHES:
+            matches = db.count_users(query, field)
+            pages = []
+            for offset in (0, matches // 2, max(0, matches - db.USER_PAGE_SIZE)):
+                after = cursor_at(path, query, field, offset) if offset else None
+                pages.append(median_ms(lambda: db.list_users(query, field, after), args.runs))
+            worst = max(worst, *pages)
+            label = f"{field}:{query}" if query else "newest first"
+            print(f"{label:>14}{matches:>10,}{pages[0]:>10.2f}{pages[1]:>11.2f}{pages[2]:>9.2f}")
+
+        db._count_cache.clear()
+        cold = median_ms(lambda: db.count_users("a", "email"), 1)
+        cached = median_ms(lambda: db.count_users("a", "email"), args.runs)
+        total = median_ms(lambda: db.count_users(), args.runs)
+        print(f"count: total {total:.2f} ms, prefix {cold:.2f} ms uncached / {cached:.3f} ms cached")
+    if worst > args.max_ms:
+        print(f"FAIL: slowest page took {worst:.2f} ms (limit {args.max_ms} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+Backend helpers for My Study Buddy that do not depend on Streamlit.
+"""
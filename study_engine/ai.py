@@ -0,0 +1,143 @@
+"""
+Model client, routed per task to a model tier and across the configured
+endpoints, and parsing of the model's JSON responses.
+"""
+
+import json
+import re
+import time
+
+from study_engine.providers import ProviderPool, default_pool
+from study_engine.ratelimit import RateLimiter
+from study_engine.retrieval import estimate_tokens
+from study_engine.routing import DEFAULT_TIER, ModelRouter, tier_of
+from study_engine.usage import UsageLedger
+from study_engine.wire import expand_output
+
+
+class AIProvider:
+    def __init__(self, rate_limiter: RateLimiter = None, router: ModelRouter = None,
+                 ledger: UsageLedger = None, owner: str = "", daily_quota: int = 0, pool: ProviderPool = None):
+        self.pool = pool or default_pool()
+        self.rate_limiter = rate_limiter
+        self.router = router or ModelRouter()
+        self.ledger = ledger
+        self.owner = owner
+        self.daily_quota = daily_quota
+        
+    def is_configured(self):
+        return bool(self.pool.endpoints)
+    
+    def get_provider_name(self):
+        names = [e.name for e in self.pool.endpoints]
+        if names == ["groq"]:
+            return "Groq (LLaMA 3, routed by task)"
+        return " → ".join(names) + (" (failover, hedged)" if self.pool.hedge else " (failover)")
+    
+    def choose_model(self, feature: str, system_prompt: str, user_prompt: str) -> str:
+        return self.router.choose(feature, estimate_tokens(system_prompt) + estimate_tokens(user_prompt))
+    
+    def generate(self, system_prompt: str, user_prompt: str, feature: str = "", model: str = None) -> str:
+        model = model or self.choose_model(feature, system_prompt, user_prompt)
+        
+        if self.ledger:
+            self.ledger.check_quota(self.owner, self.daily_quota)
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        
+        start = time.monotonic()
+        try:
+            tier = tier_of(model, DEFAULT_TIER)
+            response = self.pool.complete(tier, [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ])
+            
+            latency = time.monotonic() - start
+            self.router.record_request(model, latency, ok=True)
+            if self.ledger:
+                self.ledger.record(self.owner, feature, response["model"], response["usage"], latency)
+                self.ledger.record_race(feature, response)
+            
+            return response["text"]
+            
+        except Exception as e:
+            self.router.record_request(model, time.monotonic() - start, ok=False)
+            raise e
+    
+    def generate_json(self, system_prompt: str, user_prompt: str, feature: str = "") -> dict:
+        """
+        Generate and parse a JSON response into the structure the pages render.
+
+        Compact responses are expanded locally; parse failures count against
+        the model used.
+        """
+        model = self.choose_model(feature, system_prompt, user_prompt)
+        text = self.generate(system_prompt, user_prompt, feature, model=model)
+        try:
+            data = expand_output(feature, extract_json(text))
+        except ValueError:
+            self.router.record_parse(model, ok=False)
+            raise
+        self.router.record_parse(model, ok=True)
+        return data
+
+
+def extract_json(text: str) -> dict:
+    """Extract JSON from AI response - handles multiple formats."""
+    
+    text = text.strip()
+    
+    try:
+        return json.loads(text)
+    except:
+        pass
+    
+    match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL | re.IGNORECASE)
+    if match:
+        try:
+            return json.loads(match.group(1).strip())
+        except:
+            pass
+    
+    match = re.search(r'```\s*(.*?)\s*```', text, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(1).strip())
+        except:
+            pass
+    
+    match = re.search(r'\{[\s\S]*\}', text)
+    if match:
+        json_str = match.group(0)
+        try:
+            return json.loads(json_str)
+        except:
+            json_str = json_str.replace('\n', ' ').replace('\r', '')
+            try:
+                return json.loads(json_str)
+            except:
+                pass
+    
+    match = re.search(r'\[[\s\S]*\]', text)
+    if match:
+        try:
+            return {"items": json.loads(match.group(0))}
+        except:
+            pass
+    
+    questions = []
+    q_matches = re.findall(r'(?:Q\d+|Question\s*\d*)[:\.]?\s*(.+?)(?=(?:Q\d+|Question|A\d+|Answer|$))', text, re.IGNORECASE | re.DOTALL)
+    a_matches = re.findall(r'(?:A\d+|Answer\s*\d*)[:\.]?\s*(.+?)(?=(?:Q\d+|Question|A\d+|Answer|$))', text, re.IGNORECASE | re.DOTALL)
+    
+    if q_matches and a_matches:
+        for i, (q, a) in enumerate(zip(q_matches, a_matches)):
+            questions.append({
+                "id": i + 1,
+                "question": q.strip(),
+                "answer": a.strip()
+            })
+        if questions:
+            return {"flashcards": questions, "title": "Generated Content", "total_count": len(questions)}
+    
+    raise ValueError(f"Could not extract JSON from response: {text[:200]}...")
@@ -0,0 +1,88 @@
+"""
+SQLite store for generated study artifacts (flashcards, quizzes, summaries).
+
+Artifacts are keyed by the hash of the content they were generated from, so a
+near-duplicate upload can be served an existing result instead of calling the
+model again.
+"""
+
+import hashlib
+import json
+
+from study_engine.database import connect, location
+from study_engine.near_duplicates import NearDuplicateIndex, minhash_signature
+
+SIMILARITY_THRESHOLD = 0.9
+
+
+def content_hash(text: str) -> str:
+    """Return a stable fingerprint for the exact source text."""
+    return hashlib.sha256(text.encode('utf-8', errors='ignore')).hexdigest()
+
+
+class ArtifactStore:
+    """Persist generated artifacts and look them up by similar source content."""
+
+    def __init__(self, db_path):
+        self.db_path = location(db_path)
+        self._init_table()
+        self.index = NearDuplicateIndex(self.db_path)
+
+    def _connect(self):
+        return connect(self.db_path)
+
+    def _init_table(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS artifacts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                content_hash TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                params TEXT NOT NULL DEFAULT '',
+                payload TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (content_hash, kind, params)
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def get(self, doc_id: str, kind: str, params: str = "") -> dict:
+        """Return the stored artifact for an exact content hash, or None."""
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT payload FROM artifacts WHERE content_hash = ? AND kind = ? AND params = ?',
+            (doc_id, kind, params)
+        ).fetchone()
+        conn.close()
+        return json.loads(row[0]) if row else None
+
+    def put(self, doc_id: str, kind: str, params: str, payload: dict):
+        """Store an artifact under an exact key without indexing it for similarity lookups."""
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR REPLACE INTO artifacts (content_hash, kind, params, payload) VALUES (?, ?, ?, ?)',
+            (doc_id, kind, params, json.dumps(payload))
+        )
+        conn.commit()
+        conn.close()
+
+    def save(self, content: str, kind: str, params: str, payload: dict) -> str:
+        """Store an artifact for the given source content and index the content."""
+        doc_id = content_hash(content)
+        self.put(doc_id, kind, params, payload)
+        self.index.add(doc_id, minhash_signature(content))
+        return doc_id
+
+    def find_similar(self, content: str, kind: str, params: str = "",
+                     threshold: float = SIMILARITY_THRESHOLD):
+        """Return (payload, similarity) for the closest cached artifact, or None."""
+        doc_id = content_hash(content)
+        payload = self.get(doc_id, kind, params)
+        if payload is not None:
+            return payload, 1.0
+        for match_id, similarity in self.index.query(minhash_signature(content), threshold):
+            payload = self.get(match_id, kind, params)
+            if payload is not None:
+                return payload, similarity
+        return None
@@ -0,0 +1,241 @@
+"""
+Persistent quiz attempts with incrementally maintained progress aggregates.
+
+Every submitted quiz appends one row to quiz_attempts and one row per
+question to quiz_answers. In the same transaction, running totals are
+upserted into three aggregate tables keyed by user, by (user, topic) and by
+(user, question). The progress page reads only those aggregates and the
+newest attempts, through primary keys and covering indexes with a LIMIT, so
+its cost does not grow with a user's history.
+
+A question is identified by a hash of its normalized text, so the same
+question asked again (from a saved quiz, a question bank or a regenerated
+quiz) adds to its existing totals.
+"""
+
+import hashlib
+import re
+import threading
+import time
+
+from study_engine.database import connect, location
+
+RECENT_ATTEMPTS = 30
+TOPIC_LIMIT = 20
+MISSED_LIMIT = 10
+
+
+def question_key(text: str) -> str:
+    """Stable id of a question across quizzes: a hash of its lowercased words."""
+    normalized = " ".join(re.findall(r'\w+', (text or "").lower()))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def grade(pct: int) -> str:
+    return "A" if pct >= 90 else "B" if pct >= 80 else "C" if pct >= 70 else "D" if pct >= 60 else "F"
+
+
+class AttemptStore:
+    """SQLite-backed quiz attempts and per-user, per-topic and per-question totals."""
+
+    def __init__(self, db_path):
+        self.db_path = location(db_path)
+        self._lock = threading.Lock()
+        self._init_tables()
+
+    def _connect(self):
+        return connect(self.db_path)
+
+    def _init_tables(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS quiz_attempts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                owner TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                questions INTEGER NOT NULL,
+                correct INTEGER NOT NULL,
+                seconds REAL NOT NULL,
+                created_at REAL NOT NULL
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_quiz_attempts_owner ON quiz_attempts (owner, id)')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS quiz_answers (
+                attempt_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                question_key TEXT NOT NULL,
+                chosen TEXT NOT NULL,
+                correct INTEGER NOT NULL,
+                seconds REAL NOT NULL,
+                PRIMARY KEY (attempt_id, position)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS quiz_user_stats (
+                owner TEXT PRIMARY KEY,
+                attempts INTEGER NOT NULL,
+                questions INTEGER NOT NULL,
+                correct INTEGER NOT NULL,
+                seconds REAL NOT NULL,
+                best_pct INTEGER NOT NULL,
+                last_at REAL NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS quiz_topic_stats (
+                owner TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                questions INTEGER NOT NULL,
+                correct INTEGER NOT NULL,
+                seconds REAL NOT NULL,
+                last_pct INTEGER NOT NULL,
+                last_at REAL NOT NULL,
+                PRIMARY KEY (owner, topic)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_quiz_topic_stats_recent ON quiz_topic_stats (owner, last_at)')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS quiz_question_stats (
+                owner TEXT NOT NULL,
+                question_key TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                question TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                misses INTEGER NOT NULL,
+                seconds REAL NOT NULL,
+                last_correct INTEGER NOT NULL,
+                last_at REAL NOT NULL,
+                PRIMARY KEY (owner, question_key)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_quiz_question_stats_missed ON quiz_question_stats (owner, misses)')
+        conn.commit()
+        conn.close()
+
+    def record_attempt(self, owner: str, topic: str, answers: list) -> int:
+        """
+        Store one submitted quiz and fold it into the aggregates.
+
+        answers is a list of (question text, chosen label, is correct, seconds).
+        Returns the attempt id.
+        """
+        if not answers:
+            return 0
+        now = time.time()
+        total = len(answers)
+        correct = sum(1 for _, _, ok, _ in answers if ok)
+        seconds = sum(s for _, _, _, s in answers)
+        pct = int(correct / total * 100)
+        keys = [question_key(q) for q, _, _, _ in answers]
+        with self._lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(
+                    'INSERT INTO quiz_attempts (owner, topic, questions, correct, seconds, created_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (owner, topic, total, correct, seconds, now)
+                )
+                attempt_id = cursor.lastrowid
+                conn.executemany(
+                    'INSERT INTO quiz_answers (attempt_id, position, question_key, chosen, correct, seconds) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    [(attempt_id, i, key, chosen or "", int(ok), s)
+                     for i, (key, (_, chosen, ok, s)) in enumerate(zip(keys, answers))]
+                )
+                conn.execute('''
+                    INSERT INTO quiz_user_stats (owner, attempts, questions, correct, seconds, best_pct, last_at)
+                    VALUES (?, 1, ?, ?, ?, ?, ?)
+                    ON CONFLICT (owner) DO UPDATE SET
+                        attempts = attempts + 1,
+                        questions = questions + excluded.questions,
+                        correct = correct + excluded.correct,
+                        seconds = seconds + excluded.seconds,
+                        best_pct = MAX(best_pct, excluded.best_pct),
+                        last_at = excluded.last_at
+                ''', (owner, total, correct, seconds, pct, now))
+                conn.execute('''
+                    INSERT INTO quiz_topic_stats (owner, topic, attempts, questions, correct, seconds, last_pct, last_at)
+                    VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+                    ON CONFLICT (owner, topic) DO UPDATE SET
+                        attempts = attempts + 1,
+                        questions = questions + excluded.questions,
+                        correct = correct + excluded.correct,
+                        seconds = seconds + excluded.seconds,
+                        last_pct = excluded.last_pct,
+                        last_at = excluded.last_at
+                ''', (owner, topic, total, correct, seconds, pct, now))
+                conn.executemany('''
+                    INSERT INTO quiz_question_stats
+                        (owner, question_key, topic, question, attempts, misses, seconds, last_correct, last_at)
+                    VALUES (?, ?, ?, ?, 1, ?, ?, ?, ?)
+                    ON CONFLICT (owner, question_key) DO UPDATE SET
+                        attempts = attempts + 1,
+                        misses = misses + excluded.misses,
+                        seconds = seconds + excluded.seconds,
+                        last_correct = excluded.last_correct,
+                        last_at = excluded.last_at
+                ''', [(owner, key, topic, q, int(not ok), s, int(ok), now)
+                      for key, (q, _, ok, s) in zip(keys, answers)])
+                conn.commit()
+            finally:
+                conn.close()
+        return attempt_id
+
+    def progress(self, owner: str) -> dict:
+        """
+        The owner's totals, their most recent topics, most-missed questions
+        and newest attempts (oldest first), each read with a bounded lookup.
+        """
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT attempts, questions, correct, seconds, best_pct, last_at FROM quiz_user_stats WHERE owner = ?',
+            (owner,)
+        ).fetchone()
+        topics = conn.execute(
+            'SELECT topic, attempts, questions, correct, seconds, last_pct, last_at FROM quiz_topic_stats '
+            'WHERE owner = ? ORDER BY last_at DESC LIMIT ?',
+            (owner, TOPIC_LIMIT)
+        ).fetchall()
+        missed = conn.execute(
+            'SELECT question, topic, attempts, misses, seconds, last_correct FROM quiz_question_stats '
+            'WHERE owner = ? AND misses > 0 ORDER BY misses DESC LIMIT ?',
+            (owner, MISSED_LIMIT)
+        ).fetchall()
+        recent = conn.execute(
+            'SELECT topic, questions, correct, seconds, created_at FROM quiz_attempts '
+            'WHERE owner = ? ORDER BY id DESC LIMIT ?',
+            (owner, RECENT_ATTEMPTS)
+        ).fetchall()
+        conn.close()
+        totals = None
+        if row:
+            attempts, questions, correct, seconds, best_pct, last_at = row
+            totals = {
+                "attempts": attempts, "questions": questions, "correct": correct,
+                "accuracy": correct / questions if questions else 0.0,
+                "seconds_per_question": seconds / questions if questions else 0.0,
+                "best_pct": best_pct, "last_at": last_at,
+            }
+        return {
+            "totals": totals,
+            "topics": [
+                {"topic": topic, "attempts": attempts, "accuracy": correct / questions if questions else 0.0,
+                 "seconds_per_question": seconds / questions if questions else 0.0,
+                 "last_pct": last_pct, "last_at": last_at}
+                for topic, attempts, questions, correct, seconds, last_pct, last_at in topics
+            ],
+            "missed": [
+                {"question": question, "topic": topic, "attempts": attempts, "misses": misses,
+                 "accuracy": 1 - misses / attempts, "seconds_per_question": seconds / attempts,
+                 "last_correct": bool(last_correct)}
+                for question, topic, attempts, misses, seconds, last_correct in missed
+            ],
+            "recent": [
+                {"topic": topic, "questions": questions, "correct": correct,
+                 "pct": int(correct / questions * 100) if questions else 0,
+                 "seconds": seconds, "created_at": created_at}
+                for topic, questions, correct, seconds, created_at in reversed(recent)
+            ],
+        }
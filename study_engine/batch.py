@@ -0,0 +1,194 @@
+"""
+Headless batch generation of study material from a directory of documents.
+
+    python -m study_engine.batch lectures/ --output results.jsonl
+    python -m study_engine.batch lectures/ --store --features flashcards,quiz
+
+Text is extracted from every .pdf/.txt/.md file on a process pool, then
+generations are scheduled concurrently within the shared Groq rate limit.
+Progress is checkpointed after every result, so an interrupted run resumes
+without redoing finished files.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from study_engine.ai import AIProvider
+from study_engine.artifacts import ArtifactStore
+from study_engine.compression import PAGE_BREAK, compress_notes
+from study_engine.config import CONTEXT_TOKEN_BUDGET, database, db_path, load_env
+from study_engine.kvstore import open_store
+from study_engine.prompts import (
+    FLASHCARD_SYSTEM, QUIZ_SYSTEM, STUDY_GUIDE_SYSTEM, SUMMARY_SYSTEM, format_user_prompt,
+)
+from study_engine.ratelimit import RateLimiter
+from study_engine.retrieval import select_passages
+from study_engine.schemas import VALIDATORS
+from study_engine.usage import UsageLedger
+
+DOCUMENT_SUFFIXES = {".pdf", ".txt", ".md"}
+FEATURES = ["flashcards", "quiz", "summary", "study_guide"]
+
+
+def extract_text(path: str) -> str:
+    """Extract plain text from a document; runs in a worker process."""
+    if path.lower().endswith(".pdf"):
+        import PyPDF2
+        reader = PyPDF2.PdfReader(path)
+        return PAGE_BREAK.join(page.extract_text() or "" for page in reader.pages)
+    return Path(path).read_text(encoding="utf-8", errors="ignore")
+
+
+def build_prompts(feature: str, content: str, subject: str, num: int) -> tuple:
+    """Return (system_prompt, user_prompt, params) for a feature."""
+    if feature == "flashcards":
+        return FLASHCARD_SYSTEM, format_user_prompt("flashcards", num=num, content=content), f"num={num}"
+    if feature == "quiz":
+        return QUIZ_SYSTEM, format_user_prompt("quiz", num=num, content=content), f"num={num}"
+    if feature == "summary":
+        return SUMMARY_SYSTEM, format_user_prompt("summary", content=content), ""
+    return STUDY_GUIDE_SYSTEM, format_user_prompt("study_guide", subject=subject, content=content), ""
+
+
+class Checkpoint:
+    """Finished (file, feature) pairs, saved atomically after each update."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.done = json.loads(path.read_text()) if path.exists() else {}
+
+    def is_done(self, key: str, fingerprint: str) -> bool:
+        return self.done.get(key) == fingerprint
+
+    def mark_done(self, key: str, fingerprint: str):
+        with self._lock:
+            self.done[key] = fingerprint
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(self.done, indent=1))
+            os.replace(tmp, self.path)
+
+
+def file_fingerprint(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def generate_one(provider: AIProvider, feature: str, content: str, subject: str, num: int) -> tuple:
+    content, _, _ = compress_notes(content)
+    passages, _, _ = select_passages(content, subject if feature == "study_guide" else "", CONTEXT_TOKEN_BUDGET)
+    system_prompt, user_prompt, params = build_prompts(feature, passages, subject, num)
+    data = provider.generate_json(system_prompt, user_prompt, feature)
+    if feature in VALIDATORS:
+        data = VALIDATORS[feature](data)
+    return passages, params, data
+
+
+def run(args) -> int:
+    root = Path(args.directory)
+    files = sorted(p for p in root.rglob("*") if p.is_file() and p.suffix.lower() in DOCUMENT_SUFFIXES)
+    features = [f.strip() for f in args.features.split(",") if f.strip()]
+    unknown = set(features) - set(FEATURES)
+    if unknown:
+        print(f"Unknown features: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+    checkpoint = Checkpoint(Path(args.checkpoint))
+
+    pending = {}
+    for path in files:
+        fingerprint = file_fingerprint(path)
+        todo = [f for f in features if not checkpoint.is_done(f"{path.relative_to(root)}::{f}", fingerprint)]
+        if todo:
+            pending[path] = (fingerprint, todo)
+    print(f"{len(files)} documents, {len(pending)} with work left")
+    if not pending:
+        return 0
+
+    limiter = RateLimiter(
+        open_store(os.getenv("STATE_STORE_URL"), db_path()), "groq",
+        float(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30"))
+    )
+    ledger = UsageLedger(database())
+    provider = AIProvider(rate_limiter=limiter, ledger=ledger, owner="batch")
+    if not provider.is_configured():
+        print("GROQ_API_KEY or AI_ENDPOINTS is not set", file=sys.stderr)
+        return 2
+    store = ArtifactStore(database()) if args.store else None
+    output = open(args.output, "a", encoding="utf-8") if args.output else None
+    output_lock = threading.Lock()
+    failures = 0
+
+    with ProcessPoolExecutor(max_workers=args.extract_workers) as extractors, \
+            ThreadPoolExecutor(max_workers=args.concurrency) as generators:
+        extractions = {extractors.submit(extract_text, str(path)): path for path in pending}
+        generations = {}
+        for future in as_completed(extractions):
+            path = extractions[future]
+            try:
+                content = future.result()
+            except Exception as e:
+                print(f"✗ {path}: could not extract text ({e})", file=sys.stderr)
+                failures += 1
+                continue
+            if not content.strip():
+                print(f"✗ {path}: no text found", file=sys.stderr)
+                failures += 1
+                continue
+            fingerprint, todo = pending[path]
+            for feature in todo:
+                job = generators.submit(generate_one, provider, feature, content, path.stem, args.num)
+                generations[job] = (path, fingerprint, feature)
+
+        for future in as_completed(generations):
+            path, fingerprint, feature = generations[future]
+            relative = str(path.relative_to(root))
+            try:
+                passages, params, data = future.result()
+            except Exception as e:
+                print(f"✗ {relative} [{feature}]: {e}", file=sys.stderr)
+                failures += 1
+                continue
+            if store:
+                store.save(passages, feature, params, data)
+            if output:
+                with output_lock:
+                    output.write(json.dumps({"file": relative, "feature": feature, "params": params, "data": data}) + "\n")
+                    output.flush()
+            checkpoint.mark_done(f"{relative}::{feature}", fingerprint)
+            print(f"✓ {relative} [{feature}]")
+
+    if output:
+        output.close()
+    ledger.rollup()
+    return 1 if failures else 0
+
+
+def main(argv=None) -> int:
+    load_env()
+    parser = argparse.ArgumentParser(description="Pre-generate study material for a directory of documents")
+    parser.add_argument("directory", help="Directory searched recursively for .pdf, .txt and .md files")
+    parser.add_argument("--features", default="flashcards,quiz,summary",
+                        help=f"Comma-separated list from: {', '.join(FEATURES)}")
+    parser.add_argument("--num", type=int, default=10, help="Flashcards / questions per document")
+    parser.add_argument("--output", help="Append results to this JSONL file")
+    parser.add_argument("--store", action="store_true", help="Save results to the artifact store")
+    parser.add_argument("--checkpoint", default=".batch_checkpoint.json", help="Progress file used to resume")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent generation requests")
+    parser.add_argument("--extract-workers", type=int, default=os.cpu_count() or 2, help="Extraction processes")
+    args = parser.parse_args(argv)
+    if not args.output and not args.store:
+        parser.error("choose at least one of --output or --store")
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Content-defined chunking of notes for incremental regeneration.
+
+Paragraphs are grouped into chunks whose boundaries depend only on the
+paragraphs themselves: a chunk ends after a paragraph whose fingerprint hits
+the boundary condition, once the chunk has its minimum size. Editing one
+paragraph therefore changes the hash of its own chunk (and at most the next
+one when the edit moves a boundary), while every other chunk keeps its hash
+and its cached partial result.
+
+Every chunk of the document is used, so long notes are covered to the
+end. Chunks are large enough that typical notes fit in one or two of them,
+which keeps the number of model calls of a first run low.
+"""
+
+import hashlib
+
+from study_engine.retrieval import chunk_paragraphs, estimate_tokens
+
+MIN_CHUNK_TOKENS = 1000
+# No larger than the context budget, so any single chunk fits in one prompt.
+MAX_CHUNK_TOKENS = 2500
+BOUNDARY_MODULUS = 3
+
+
+def _fingerprint(paragraph: str) -> int:
+    return int.from_bytes(hashlib.blake2b(" ".join(paragraph.split()).encode(), digest_size=8).digest(), "big")
+
+
+def chunk_hash(chunk: str) -> str:
+    """Stable key for a chunk; ignores differences in spacing."""
+    return hashlib.sha256(" ".join(chunk.split()).encode("utf-8", errors="ignore")).hexdigest()
+
+
+def content_chunks(text: str, min_tokens: int = MIN_CHUNK_TOKENS, max_tokens: int = MAX_CHUNK_TOKENS) -> list:
+    """Split text into chunks of whole paragraphs at content-defined boundaries."""
+    chunks = []
+    current = []
+    size = 0
+    for paragraph in chunk_paragraphs(text):
+        cost = estimate_tokens(paragraph)
+        if current and size + cost > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(paragraph)
+        size += cost
+        if size >= min_tokens and _fingerprint(paragraph) % BOUNDARY_MODULUS == 0:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
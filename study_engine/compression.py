@@ -0,0 +1,113 @@
+"""
+Input compression for prompts built from pasted notes and PDF text.
+
+Uploaded text carries a lot that costs tokens without informing the model:
+runs of spaces, PDF hard line breaks and hyphenation, page headers and
+footers repeated on every page, and paragraphs pasted twice. compress_notes
+strips those before passages are selected, and reports the token counts
+before and after so the savings are visible per request.
+"""
+
+import re
+from collections import Counter
+
+from study_engine.retrieval import estimate_tokens
+
+PAGE_BREAK = "\f"
+EDGE_LINES = 2
+MIN_DUPLICATE_LINE_CHARS = 30
+
+_SENTENCE_END = re.compile(r'[.!?:;)\]"”]$')
+_LIST_ITEM = re.compile(r'^([-*•▪◦‣]|\d+[.)]|[a-zA-Z][.)])\s')
+
+
+def _line_key(line: str) -> str:
+    """Form of a line that ignores case, spacing and page numbers."""
+    return re.sub(r'\d+', '#', " ".join(line.lower().split()))
+
+
+def _text_key(text: str) -> str:
+    """Form of a text that ignores case, spacing and punctuation."""
+    return " ".join(re.findall(r'\w+', text.lower()))
+
+
+def strip_boilerplate(text: str) -> str:
+    """
+    Remove headers and footers repeated across pages, keeping the page breaks.
+
+    With page breaks (form feeds from PDF extraction), a line near the top or
+    bottom of a page is boilerplate when it recurs at the edges of at least
+    half the pages. Without page breaks, short lines that only differ by a
+    number and recur three or more times ("Page 3 of 12") are removed.
+    """
+    pages = text.split(PAGE_BREAK)
+    if len(pages) >= 3:
+        edge_counts = Counter()
+        for page in pages:
+            lines = [line for line in page.splitlines() if line.strip()]
+            edges = lines[:EDGE_LINES] + lines[-EDGE_LINES:]
+            edge_counts.update({_line_key(line) for line in edges})
+        threshold = max(3, len(pages) // 2)
+        boilerplate = {key for key, count in edge_counts.items() if count >= threshold}
+    else:
+        counts = Counter(_line_key(line) for line in text.splitlines() if line.strip())
+        boilerplate = {
+            key for key, count in counts.items()
+            if count >= 3 and "#" in key and len(key) <= 60 and len(re.sub(r'[^a-z]', '', key)) <= 20
+        }
+    if not boilerplate:
+        return text
+    return PAGE_BREAK.join(
+        "\n".join(line for line in page.splitlines() if not line.strip() or _line_key(line) not in boilerplate)
+        for page in pages
+    )
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse spacing and rejoin lines that a PDF wrapped mid-sentence."""
+    text = text.replace(PAGE_BREAK, "\n\n").replace("\r\n", "\n").replace("\r", "\n")
+    text = re.sub(r'(\w)-\n(?=[a-z])', r'\1', text)
+    paragraphs = []
+    for para in re.split(r'\n\s*\n', text):
+        lines = [" ".join(line.split()) for line in para.splitlines()]
+        lines = [line for line in lines if line]
+        if not lines:
+            continue
+        merged = [lines[0]]
+        for line in lines[1:]:
+            previous = merged[-1]
+            if not _SENTENCE_END.search(previous) and not _LIST_ITEM.match(line) and line[0].islower():
+                merged[-1] = f"{previous} {line}"
+            else:
+                merged.append(line)
+        paragraphs.append("\n".join(merged))
+    return "\n\n".join(paragraphs)
+
+
+def dedupe(text: str) -> str:
+    """Drop repeated paragraphs, and long lines already seen earlier in the text."""
+    seen_paragraphs = set()
+    seen_lines = set()
+    paragraphs = []
+    for para in text.split("\n\n"):
+        key = _text_key(para)
+        if key in seen_paragraphs:
+            continue
+        seen_paragraphs.add(key)
+        lines = []
+        for line in para.split("\n"):
+            line_key = _text_key(line)
+            if len(line_key) >= MIN_DUPLICATE_LINE_CHARS:
+                if line_key in seen_lines:
+                    continue
+                seen_lines.add(line_key)
+            lines.append(line)
+        if lines:
+            paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs)
+
+
+def compress_notes(text: str) -> tuple:
+    """Run the compression pipeline; returns (text, tokens_before, tokens_after)."""
+    compressed = dedupe(normalize_whitespace(strip_boilerplate(text)))
+    return compressed, estimate_tokens(text), estimate_tokens(compressed)
@@ -0,0 +1,45 @@
+"""
+Paths and settings read from the environment.
+
+The .env file is loaded on first use rather than at import, so importing
+backend modules stays cheap during a cold start.
+"""
+
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ENV_PATH = BASE_DIR / ".env"
+CONTEXT_TOKEN_BUDGET = 2500
+
+_env_loaded = False
+
+
+def load_env():
+    """Load .env into the process environment once."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv(dotenv_path=ENV_PATH)
+        _env_loaded = True
+
+
+def db_path() -> Path:
+    """SQLite database for users, artifacts and question banks."""
+    load_env()
+    return Path(os.getenv("DATABASE_PATH") or BASE_DIR / "users.db")
+
+
+def database():
+    """
+    Database the stores open: the network database at DATABASE_URL when set,
+    so replicas on several hosts share it, otherwise the local db_path() file.
+    """
+    load_env()
+    return os.getenv("DATABASE_URL") or db_path()
+
+
+def output_format() -> str:
+    """Model output format: "compact" (short keys, expanded locally) or "verbose"."""
+    load_env()
+    return "verbose" if os.getenv("OUTPUT_FORMAT", "compact").lower() == "verbose" else "compact"
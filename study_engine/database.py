@@ -0,0 +1,167 @@
+"""
+Connections to the relational database shared by the stores.
+
+Stores are given either the path of a SQLite file or, when DATABASE_URL is
+set, the URL of a network database that every replica uses:
+
+    python -m study_engine.dbserver --port 8702 --db users.db --blobs uploads
+
+RemoteConnection speaks that server's protocol and offers the part of the
+sqlite3 connection API the stores use: execute, executemany, cursors with
+fetchone/fetchall/lastrowid/rowcount, commit, rollback, close and
+total_changes. Statements run inside a server-side session, so explicit
+transactions (``isolation_level=None`` with BEGIN IMMEDIATE ... COMMIT) and
+Python's implicit ones behave as they do on a local file. Errors are raised
+as the matching sqlite3 exception.
+"""
+
+import base64
+import json
+import sqlite3
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+
+def is_remote(database) -> bool:
+    return isinstance(database, str) and database.startswith(("http://", "https://"))
+
+
+def location(database):
+    """A store's database as given: a network database URL, or a Path to a SQLite file."""
+    return database.rstrip('/') if is_remote(database) else Path(database)
+
+
+def connect(database, isolation_level="", timeout: float = 5.0):
+    """Open a connection to a SQLite file or, for an http(s) URL, to the network database."""
+    if is_remote(database):
+        return RemoteConnection(database, isolation_level)
+    return sqlite3.connect(str(database), timeout=timeout, isolation_level=isolation_level)
+
+
+def encode_values(values):
+    """JSON-safe form of statement parameters or row values; BLOBs travel as base64."""
+    return [{"$blob": base64.b64encode(bytes(v)).decode()} if isinstance(v, (bytes, bytearray, memoryview)) else v
+            for v in values]
+
+
+def decode_values(values):
+    return tuple(base64.b64decode(v["$blob"]) if isinstance(v, dict) else v for v in values)
+
+
+def _error(payload: dict, default: str) -> sqlite3.Error:
+    kind = getattr(sqlite3, payload.get("error", ""), None)
+    if not (isinstance(kind, type) and issubclass(kind, sqlite3.Error)):
+        kind = sqlite3.OperationalError
+    return kind(payload.get("message", default))
+
+
+class RemoteCursor:
+    """Result of one statement run on the network database."""
+
+    def __init__(self, connection: "RemoteConnection"):
+        self.connection = connection
+        self.lastrowid = None
+        self.rowcount = -1
+        self._rows = []
+        self._next = 0
+
+    def execute(self, sql: str, params=()):
+        self._load(self.connection._execute(sql, encode_values(params), many=False))
+        return self
+
+    def executemany(self, sql: str, seq_of_params):
+        self._load(self.connection._execute(sql, [encode_values(p) for p in seq_of_params], many=True))
+        return self
+
+    def _load(self, result: dict):
+        self.lastrowid = result["lastrowid"]
+        self.rowcount = result["rowcount"]
+        self._rows = [decode_values(row) for row in result["rows"]]
+        self._next = 0
+
+    def fetchone(self):
+        if self._next >= len(self._rows):
+            return None
+        self._next += 1
+        return self._rows[self._next - 1]
+
+    def fetchall(self):
+        rows, self._next = self._rows[self._next:], len(self._rows)
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        self._rows = []
+
+
+class RemoteConnection:
+    """Connection to the network database; the server session opens on the first statement."""
+
+    def __init__(self, base_url: str, isolation_level="", timeout: float = 30.0):
+        self.base_url = base_url.rstrip('/')
+        self.isolation_level = isolation_level
+        self.timeout = timeout
+        self.total_changes = 0
+        self._session = None
+
+    def _request(self, path: str, body: dict = None, method: str = "POST"):
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(
+            self.base_url + path, data=data, method=method,
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = response.read()
+        except urllib.error.HTTPError as e:
+            try:
+                error = json.loads(e.read() or b"{}")
+            except ValueError:
+                error = {}
+            raise _error(error, f"database server error {e.code}") from None
+        except OSError as e:
+            raise sqlite3.OperationalError(f"database server unreachable: {e}") from None
+        return json.loads(payload) if payload else None
+
+    def _execute(self, sql: str, params, many: bool) -> dict:
+        if self._session is None:
+            self._session = self._request("/sql", {"isolation_level": self.isolation_level})["id"]
+        result = self._request(f"/sql/{self._session}/execute", {"sql": sql, "params": params, "many": many})
+        self.total_changes = result["total_changes"]
+        return result
+
+    def cursor(self) -> RemoteCursor:
+        return RemoteCursor(self)
+
+    def execute(self, sql: str, params=()) -> RemoteCursor:
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql: str, seq_of_params) -> RemoteCursor:
+        return self.cursor().executemany(sql, seq_of_params)
+
+    def commit(self):
+        if self._session is not None:
+            self._request(f"/sql/{self._session}/commit", {})
+
+    def rollback(self):
+        if self._session is not None:
+            self._request(f"/sql/{self._session}/rollback", {})
+
+    def close(self):
+        """End the session; like sqlite3, anything not committed is rolled back."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            try:
+                self._request(f"/sql/{session}", method="DELETE")
+            except sqlite3.Error:
+                pass  # the server rolls back and drops sessions left idle
+
+    def __del__(self):
+        # Like a collected sqlite3 connection, a dropped one ends its session and rolls back.
+        try:
+            self.close()
+        except Exception:
+            pass
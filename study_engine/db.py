@@ -0,0 +1,168 @@
+"""
+User accounts in SQLite.
+
+The admin listing reads one page at a time with keyset pagination, so a
+page costs the same at any depth: newest first on (created_at, id), or in
+alphabetical order on (email, id) or (name, id) when searching by prefix.
+Each order has an index. The total number of users is kept in a one-row
+table by triggers, and prefix counts are cached for COUNT_CACHE_SECONDS.
+Listing queries never select password hashes.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+from study_engine.config import database
+from study_engine.database import connect
+
+USER_PAGE_SIZE = 50
+COUNT_CACHE_SECONDS = 60
+SEARCH_FIELDS = ("email", "name")
+
+_count_cache = {}
+_count_lock = threading.Lock()
+
+
+def get_db_connection():
+    """Get a connection to the app database: the local file, or the DATABASE_URL server."""
+    return connect(database())
+
+
+def init_database():
+    """Initialize SQLite database for user storage."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_created ON users (created_at, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_email_nocase ON users (email COLLATE NOCASE, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_name_nocase ON users (name COLLATE NOCASE, id)')
+    cursor.execute('CREATE TABLE IF NOT EXISTS user_totals (id INTEGER PRIMARY KEY CHECK (id = 1), users INTEGER NOT NULL)')
+    # Seeded once from existing rows, then kept up to date by the triggers.
+    cursor.execute(
+        'INSERT INTO user_totals (id, users) SELECT 1, (SELECT COUNT(*) FROM users) '
+        'WHERE NOT EXISTS (SELECT 1 FROM user_totals)'
+    )
+    cursor.execute(
+        'CREATE TRIGGER IF NOT EXISTS users_counted AFTER INSERT ON users '
+        'BEGIN UPDATE user_totals SET users = users + 1 WHERE id = 1; END'
+    )
+    cursor.execute(
+        'CREATE TRIGGER IF NOT EXISTS users_uncounted AFTER DELETE ON users '
+        'BEGIN UPDATE user_totals SET users = users - 1 WHERE id = 1; END'
+    )
+    conn.commit()
+    conn.close()
+
+
+def add_user(email: str, name: str, password_hash: str) -> bool:
+    """Add a new user to the database."""
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            'INSERT INTO users (email, name, password_hash) VALUES (?, ?, ?)',
+            (email, name, password_hash)
+        )
+        conn.commit()
+        conn.close()
+        return True
+    except sqlite3.IntegrityError:
+        return False
+
+
+def get_user(email: str) -> dict:
+    """Get user by email."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT email, name, password_hash FROM users WHERE email = ?', (email,))
+    row = cursor.fetchone()
+    conn.close()
+    if row:
+        return {"email": row[0], "name": row[1], "password": row[2]}
+    return None
+
+
+def _prefix_range(query: str) -> tuple:
+    """Bounds (inclusive, exclusive) of the values that start with query under NOCASE ordering."""
+    return query, query + "\U0010ffff"
+
+
+def list_users(query: str = "", field: str = "email", after: list = None, limit: int = USER_PAGE_SIZE) -> tuple:
+    """
+    One page of users for the admin view, without password hashes.
+
+    Without a query users come newest first; with one, only users whose
+    field ("email" or "name") starts with it, ignoring case, in alphabetical
+    order. after is the cursor returned with the previous page. Returns
+    (users, cursor); the cursor is None on the last page.
+    """
+    if field not in SEARCH_FIELDS:
+        raise ValueError(f"Cannot search users by {field}")
+    columns = 'SELECT id, email, name, created_at FROM users'
+    conn = get_db_connection()
+    if query:
+        # Range bounds rather than LIKE, so the index seek starts at the cursor on later pages.
+        low, high = _prefix_range(query)
+        where = f'{field} COLLATE NOCASE >= ? AND {field} COLLATE NOCASE < ?'
+        params = [after[0] if after else low, high]
+        if after:
+            where += f' AND ({field} COLLATE NOCASE, id) > (?, ?)'
+            params += after
+        rows = conn.execute(
+            f'{columns} WHERE {where} ORDER BY {field} COLLATE NOCASE, id LIMIT ?', (*params, limit + 1)
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            f'{columns} {"WHERE (created_at, id) < (?, ?) " if after else ""}'
+            f'ORDER BY created_at DESC, id DESC LIMIT ?',
+            (*(after or ()), limit + 1)
+        ).fetchall()
+    conn.close()
+    users = [{"id": r[0], "email": r[1], "name": r[2], "created_at": r[3]} for r in rows[:limit]]
+    cursor = None
+    if len(rows) > limit:
+        last = users[-1]
+        cursor = [last[field] if query else last["created_at"], last["id"]]
+    return users, cursor
+
+
+def count_users(query: str = "", field: str = "email") -> int:
+    """Number of users, or of users whose field starts with query (cached briefly)."""
+    if field not in SEARCH_FIELDS:
+        raise ValueError(f"Cannot search users by {field}")
+    key = (str(database()), field, query.lower())
+    with _count_lock:
+        cached = _count_cache.get(key)
+    if query and cached and time.monotonic() - cached[1] < COUNT_CACHE_SECONDS:
+        return cached[0]
+    conn = get_db_connection()
+    if query:
+        count = conn.execute(
+            f'SELECT COUNT(*) FROM users WHERE {field} COLLATE NOCASE >= ? AND {field} COLLATE NOCASE < ?',
+            _prefix_range(query)
+        ).fetchone()[0]
+    else:
+        row = conn.execute('SELECT users FROM user_totals WHERE id = 1').fetchone()
+        count = row[0] if row else 0
+    conn.close()
+    if query:
+        with _count_lock:
+            if len(_count_cache) > 1000:
+                _count_cache.clear()
+            _count_cache[key] = (count, time.monotonic())
+    return count
+
+
+def hash_password(password):
+    """Hash password for storage."""
+    return hashlib.sha256(password.encode()).hexdigest()
@@ -0,0 +1,244 @@
+"""
+Stand-in network database and upload store for replicas on several hosts.
+
+Serves the protocol used by database.RemoteConnection on top of one SQLite
+file, and stores spooled uploads for uploads.HTTPBlobStore in a directory:
+
+    python -m study_engine.dbserver --port 8702 --db users.db --blobs uploads
+
+Point every replica at it with DATABASE_URL=http://host:8702 and
+UPLOAD_STORE_URL=http://host:8702. Each client connection gets a session
+holding its own SQLite connection, so transactions span several requests;
+a session left idle for SESSION_IDLE_SECONDS is rolled back and closed so
+a replica that died mid-transaction cannot keep the database locked.
+"""
+
+import argparse
+import json
+import os
+import secrets
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from study_engine.database import decode_values, encode_values
+
+SESSION_IDLE_SECONDS = 60
+BLOB_TTL_SECONDS = 24 * 3600
+CHUNK_BYTES = 1 << 20
+
+
+class Session:
+    def __init__(self, db_path: Path, isolation_level):
+        self.conn = sqlite3.connect(str(db_path), timeout=10, isolation_level=isolation_level,
+                                    check_same_thread=False)
+        self.lock = threading.Lock()
+        self.used = time.monotonic()
+
+
+class Database:
+    """Server-side sessions on one SQLite file."""
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def open(self, isolation_level) -> str:
+        self.reap()
+        session_id = secrets.token_urlsafe(16)
+        session = Session(self.db_path, isolation_level)
+        with self._lock:
+            self._sessions[session_id] = session
+        return session_id
+
+    def get(self, session_id: str) -> Session:
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def execute(self, session: Session, sql: str, params, many: bool) -> dict:
+        with session.lock:
+            session.used = time.monotonic()
+            if many:
+                cursor = session.conn.executemany(sql, [decode_values(p) for p in params])
+            else:
+                cursor = session.conn.execute(sql, decode_values(params))
+            rows = [encode_values(row) for row in cursor.fetchall()]
+            return {"rows": rows, "lastrowid": cursor.lastrowid, "rowcount": cursor.rowcount,
+                    "total_changes": session.conn.total_changes}
+
+    def finish(self, session: Session, action: str):
+        with session.lock:
+            session.used = time.monotonic()
+            getattr(session.conn, action)()
+
+    def close(self, session_id: str):
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session:
+            with session.lock:
+                session.conn.close()
+
+    def reap(self, idle: float = SESSION_IDLE_SECONDS):
+        """Close sessions nobody has used for idle seconds; closing rolls back their open transaction."""
+        cutoff = time.monotonic() - idle
+        with self._lock:
+            stale = [key for key, session in self._sessions.items() if session.used < cutoff]
+        for key in stale:
+            self.close(key)
+
+
+class BlobDirectory:
+    """Uploaded files by name, expiring when nobody has read or written them for a day."""
+
+    PURGE_EVERY = 100
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._writes = 0
+
+    def path(self, name: str):
+        if not name or "/" in name or "\\" in name or name.startswith("."):
+            return None
+        return self.root / name
+
+    def write(self, name: str, stream, length: int):
+        fd, part = tempfile.mkstemp(dir=self.root, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while length > 0:
+                    block = stream.read(min(CHUNK_BYTES, length))
+                    if not block:
+                        raise ValueError("upload ended early")
+                    out.write(block)
+                    length -= len(block)
+            os.replace(part, self.root / name)
+        finally:
+            if os.path.exists(part):
+                os.remove(part)
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            self.purge()
+
+    def purge(self, max_age: float = BLOB_TTL_SECONDS):
+        cutoff = time.time() - max_age
+        for path in self.root.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def make_handler(database: Database, blobs: BlobDirectory):
+    class Handler(BaseHTTPRequestHandler):
+        def _route(self):
+            parts = self.path.strip('/').split('/')
+            return parts[0], parts[1:]
+
+        def _body(self) -> dict:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length)) if length else {}
+
+        def _reply(self, status: int, payload=None):
+            data = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _blob(self, rest):
+            path = blobs.path(rest[0]) if len(rest) == 1 else None
+            if path is None or not path.exists():
+                return None
+            return path
+
+        def do_HEAD(self):
+            kind, rest = self._route()
+            path = self._blob(rest) if kind == "blobs" else None
+            self.send_response(200 if path else 404)
+            self.send_header("Content-Length", str(path.stat().st_size) if path else "0")
+            self.end_headers()
+
+        def do_GET(self):
+            kind, rest = self._route()
+            path = self._blob(rest) if kind == "blobs" else None
+            if path is None:
+                return self._reply(404)
+            try:
+                source = open(path, "rb")
+            except FileNotFoundError:
+                return self._reply(404)
+            with source:
+                os.utime(path)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(os.fstat(source.fileno()).st_size))
+                self.end_headers()
+                shutil.copyfileobj(source, self.wfile, CHUNK_BYTES)
+
+        def do_PUT(self):
+            kind, rest = self._route()
+            if kind != "blobs" or len(rest) != 1 or blobs.path(rest[0]) is None:
+                return self._reply(404)
+            blobs.write(rest[0], self.rfile, int(self.headers.get("Content-Length") or 0))
+            self._reply(204)
+
+        def do_POST(self):
+            kind, rest = self._route()
+            if kind != "sql":
+                return self._reply(404)
+            body = self._body()
+            if not rest:
+                return self._reply(200, {"id": database.open(body.get("isolation_level", ""))})
+            session = database.get(rest[0])
+            if session is None or len(rest) != 2:
+                return self._reply(404, {"error": "OperationalError", "message": "database session expired"})
+            try:
+                if rest[1] == "execute":
+                    return self._reply(200, database.execute(session, body["sql"], body["params"], body["many"]))
+                if rest[1] in ("commit", "rollback"):
+                    database.finish(session, rest[1])
+                    return self._reply(204)
+            except sqlite3.Error as e:
+                return self._reply(400, {"error": type(e).__name__, "message": str(e)})
+            self._reply(404)
+
+        def do_DELETE(self):
+            kind, rest = self._route()
+            if kind != "sql" or len(rest) != 1:
+                return self._reply(404)
+            database.close(rest[0])
+            self._reply(204)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(host: str, port: int, db_path: str, blob_root: str) -> ThreadingHTTPServer:
+    """Create a server bound to host:port; call serve_forever() to run it."""
+    return ThreadingHTTPServer((host, port), make_handler(Database(db_path), BlobDirectory(blob_root)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in network database and upload store for My Study Buddy replicas")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8702)
+    parser.add_argument("--db", default="users.db")
+    parser.add_argument("--blobs", default="uploads", help="Directory for spooled uploads")
+    args = parser.parse_args()
+    server = serve(args.host, args.port, args.db, args.blobs)
+    print(f"Database listening on {args.host}:{args.port} ({args.db}, uploads in {args.blobs})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
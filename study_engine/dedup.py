@@ -0,0 +1,112 @@
+"""
+Near-duplicate filtering inside a generated set of flashcards, questions or pairs.
+
+Models asked for 15-20 items often return two that ask the same thing in
+different words. Each item's text is turned into a hashed character-trigram
+vector in one NumPy pass over all items, and items whose cosine similarity to
+an earlier kept item reaches the threshold are dropped. Sets of a few hundred
+items take a few milliseconds, so the filter also runs on merged chunk output.
+"""
+
+import os
+import re
+import zlib
+
+import numpy as np
+
+from study_engine.retrieval import STOPWORDS
+
+DIMENSIONS = 1 << 10
+DEFAULT_THRESHOLD = 0.75
+WORD_WEIGHT = 3.0
+_HASH_MULTIPLIER = np.uint32(2654435761)
+# Question scaffolding that says nothing about what is asked.
+QUESTION_WORDS = {
+    "called", "define", "describe", "does", "explain", "function", "known", "main", "named", "role", "term", "why",
+}
+
+# Per feature: the list in the parsed response and the field compared for duplicates.
+ITEM_FIELDS = {
+    "flashcards": ("flashcards", "question"),
+    "quiz": ("questions", "question"),
+    "matching": ("pairs", "term"),
+}
+
+
+def dedup_threshold() -> float:
+    """Cosine similarity from which two items count as duplicates (DEDUP_THRESHOLD, 0 disables)."""
+    return float(os.getenv("DEDUP_THRESHOLD", DEFAULT_THRESHOLD))
+
+
+def _content_words(text: str) -> list:
+    """Words that carry the item's meaning; numbers are kept so "radius 3" and "radius 5" differ."""
+    words = re.findall(r'[a-z0-9]+', str(text).lower())
+    content = [w for w in words if w not in STOPWORDS and w not in QUESTION_WORDS and (len(w) > 1 or w.isdigit())]
+    return content or words
+
+
+def item_vectors(texts: list) -> np.ndarray:
+    """
+    L2-normalized feature vectors, one row per text.
+
+    Features are the hashed character trigrams and the whole words of the
+    text's content words, so paraphrases that reorder or inflect words stay
+    close while "mitosis" and "meiosis" stay apart.
+    """
+    words = [_content_words(text) for text in texts]
+    encoded = [(" " + " ".join(w) + " ").encode("ascii", errors="ignore") for w in words]
+    lengths = np.array([len(e) for e in encoded], dtype=np.int64)
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint32)
+    codes = (buffer[:-2] << 16) | (buffer[1:-1] << 8) | buffer[2:]
+    buckets = ((codes * _HASH_MULTIPLIER) >> np.uint32(22)) & np.uint32(DIMENSIONS - 1)
+    ends = np.cumsum(lengths)
+    rows = np.repeat(np.arange(len(texts)), lengths)[:codes.size]
+    inside = np.arange(codes.size) + 3 <= ends[rows]
+    word_rows = [i for i, w in enumerate(words) for _ in w]
+    word_buckets = [zlib.crc32(word.encode()) & (DIMENSIONS - 1) for w in words for word in w]
+    flat = np.concatenate([
+        rows[inside] * DIMENSIONS + buckets[inside].astype(np.int64),
+        np.array(word_rows, dtype=np.int64) * DIMENSIONS + np.array(word_buckets, dtype=np.int64),
+    ])
+    weights = np.ones(flat.size, dtype=np.float32)
+    weights[inside.sum():] = WORD_WEIGHT
+    matrix = np.bincount(flat, weights, minlength=len(texts) * DIMENSIONS).astype(np.float32)
+    matrix = matrix.reshape(len(texts), DIMENSIONS)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def duplicate_flags(texts: list, threshold: float) -> list:
+    """True for each text too similar to an earlier text that was kept."""
+    if len(texts) < 2 or threshold <= 0:
+        return [False] * len(texts)
+    vectors = item_vectors(texts)
+    similar = np.tril((vectors @ vectors.T) >= threshold, -1)
+    flags = [False] * len(texts)
+    candidates = np.flatnonzero(similar.any(axis=1))
+    if candidates.size:
+        kept = np.ones(len(texts), dtype=bool)
+        for i in candidates:
+            if (similar[i] & kept).any():
+                kept[i] = False
+                flags[i] = True
+    return flags
+
+
+def remove_duplicates(feature: str, data: dict, threshold: float = None, existing: list = None) -> tuple:
+    """
+    Drop near-duplicate items from a parsed response; returns (data, removed).
+
+    existing lists items already accepted elsewhere (e.g. the set a top-up is
+    added to); new items similar to them are dropped as well.
+    """
+    list_key, field = ITEM_FIELDS[feature]
+    threshold = dedup_threshold() if threshold is None else threshold
+    items = data.get(list_key) if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return data, 0
+    existing = existing or []
+    texts = [item.get(field, "") if isinstance(item, dict) else "" for item in existing + items]
+    flags = duplicate_flags(texts, threshold)[len(existing):]
+    kept = [item for item, duplicate in zip(items, flags) if not duplicate]
+    return dict(data, **{list_key: kept}), len(items) - len(kept)
@@ -0,0 +1,320 @@
+"""
+Streaming export of flashcards and quiz questions to Anki, CSV, JSONL and QTI.
+
+Every exporter takes an iterable of items and yields the file as byte
+chunks, so a library can be read from storage and written out a batch at a
+time. Memory use does not depend on the number of items:
+
+* CSV and JSONL rows are encoded one at a time. Question CSV uses the
+  question bank import columns, so an export can be imported again.
+* QTI 1.2 XML for LMS import is written one <item> at a time.
+* Anki .apkg is a zip holding a SQLite collection. The collection is built
+  in a temporary file with batched inserts, zipped next to it, and the zip
+  is read back in chunks. Both files are deleted when the stream ends.
+
+Items are flashcards ({"question", "answer"}) or quiz questions ({"question",
+"options", "explanation"}). An optional "deck" key puts an item in its own
+Anki sub-deck and tags it in the other formats.
+"""
+
+import csv
+import hashlib
+import io
+import itertools
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import zipfile
+from html import escape as html_escape
+from xml.sax.saxutils import escape, quoteattr
+
+from study_engine.schemas import OPTION_LABELS
+
+CHUNK_BYTES = 64 * 1024
+INSERT_BATCH = 500
+ROOT_DECK = "Study Buddy"
+
+# format -> (label, mime type, file extension, item kinds it supports)
+FORMATS = {
+    "apkg": ("Anki deck", "application/octet-stream", "apkg", ("flashcards", "questions")),
+    "csv": ("CSV", "text/csv", "csv", ("flashcards", "questions")),
+    "jsonl": ("JSON Lines", "application/jsonl", "jsonl", ("flashcards", "questions")),
+    "qti": ("QTI 1.2 (LMS)", "application/xml", "xml", ("questions",)),
+}
+
+
+def export_name(title: str, fmt: str) -> str:
+    stem = "".join(c if c.isalnum() or c in "-_" else "_" for c in (title or "export").strip())[:60] or "export"
+    return f"{stem}.{FORMATS[fmt][2]}"
+
+
+def card_sides(item: dict) -> tuple:
+    """(front, back) of a flashcard or a quiz question."""
+    if "answer" in item:
+        return str(item["question"]), str(item["answer"])
+    options = item.get("options") or []
+    correct = next((o for o in options if o.get("is_correct")), None)
+    front = str(item["question"]) + "".join(
+        f"\n{label}. {o.get('text', '')}" for label, o in zip(OPTION_LABELS, options)
+    )
+    back = ""
+    if correct:
+        back = f"{correct['label']}. {correct['text']}" if correct.get("label") else str(correct["text"])
+    if item.get("explanation"):
+        back += f"\n\n{item['explanation']}"
+    return front, back
+
+
+class _Rows:
+    """A write target for csv.writer that hands back what was written."""
+
+    def __init__(self):
+        self.buffer = io.StringIO()
+
+    def write(self, text: str):
+        self.buffer.write(text)
+
+    def take(self) -> bytes:
+        data = self.buffer.getvalue().encode("utf-8")
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data
+
+
+def _batched(chunks, size: int = CHUNK_BYTES):
+    """Join small byte strings into chunks of about size bytes."""
+    pending = []
+    length = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield b"".join(pending)
+            pending = []
+            length = 0
+    if pending:
+        yield b"".join(pending)
+
+
+def export_csv(items, kind: str):
+    def rows():
+        target = _Rows()
+        writer = csv.writer(target)
+        if kind == "flashcards":
+            writer.writerow(["question", "answer", "deck"])
+        else:
+            writer.writerow(["question", "a", "b", "c", "d", "correct", "explanation", "deck"])
+        yield target.take()
+        for item in items:
+            if kind == "flashcards":
+                front, back = card_sides(item)
+                writer.writerow([front, back, item.get("deck", "")])
+            else:
+                options = [o.get("text", "") for o in item.get("options") or []] + [""] * len(OPTION_LABELS)
+                correct = next((label for label, o in zip(OPTION_LABELS, item.get("options") or [])
+                                if o.get("is_correct")), "")
+                writer.writerow([item["question"], *options[:len(OPTION_LABELS)], correct,
+                                 item.get("explanation", ""), item.get("deck", "")])
+            yield target.take()
+    return _batched(rows())
+
+
+def export_jsonl(items, kind: str):
+    def lines():
+        for item in items:
+            if kind == "flashcards":
+                front, back = card_sides(item)
+                record = {"question": front, "answer": back}
+            else:
+                record = {"question": item["question"], "options": item.get("options") or [],
+                          "explanation": item.get("explanation", "")}
+            if item.get("deck"):
+                record["deck"] = item["deck"]
+            yield (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    return _batched(lines())
+
+
+def _qti_item(number: int, item: dict) -> str:
+    options = item.get("options") or []
+    correct = next((label for label, o in zip(OPTION_LABELS, options) if o.get("is_correct")), "")
+    choices = "".join(
+        f'<response_label ident="{label}"><material><mattext texttype="text/plain">{escape(str(o.get("text", "")))}'
+        f'</mattext></material></response_label>'
+        for label, o in zip(OPTION_LABELS, options)
+    )
+    feedback = ""
+    if item.get("explanation"):
+        feedback = (f'<itemfeedback ident="general_fb"><flow_mat><material><mattext texttype="text/plain">'
+                    f'{escape(str(item["explanation"]))}</mattext></material></flow_mat></itemfeedback>')
+    return (
+        f'<item ident="q{number}" title={quoteattr(str(item["question"])[:80])}>'
+        '<itemmetadata><qtimetadata><qtimetadatafield><fieldlabel>question_type</fieldlabel>'
+        '<fieldentry>multiple_choice_question</fieldentry></qtimetadatafield></qtimetadata></itemmetadata>'
+        f'<presentation><material><mattext texttype="text/plain">{escape(str(item["question"]))}</mattext></material>'
+        f'<response_lid ident="response1" rcardinality="Single"><render_choice>{choices}</render_choice>'
+        '</response_lid></presentation>'
+        '<resprocessing><outcomes><decvar maxvalue="100" minvalue="0" varname="SCORE" vartype="Decimal"/></outcomes>'
+        f'<respcondition continue="No"><conditionvar><varequal respident="response1">{correct}</varequal>'
+        '</conditionvar><setvar action="Set" varname="SCORE">100</setvar>'
+        + ('<displayfeedback feedbacktype="Response" linkrefid="general_fb"/>' if feedback else '')
+        + '</respcondition></resprocessing>'
+        f'{feedback}</item>\n'
+    )
+
+
+def export_qti(items, title: str = "Quiz"):
+    def parts():
+        yield (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<questestinterop xmlns="http://www.imsglobal.org/xsd/ims_qtiasiv1p2">\n'
+            f'<assessment ident="study_buddy_export" title={quoteattr(title)}><section ident="root_section">\n'
+        ).encode("utf-8")
+        for number, item in enumerate(items, 1):
+            yield _qti_item(number, item).encode("utf-8")
+        yield b'</section></assessment>\n</questestinterop>\n'
+    return _batched(parts())
+
+
+_ANKI_SCHEMA = '''
+    CREATE TABLE col (id integer primary key, crt integer not null, mod integer not null, scm integer not null,
+        ver integer not null, dty integer not null, usn integer not null, ls integer not null, conf text not null,
+        models text not null, decks text not null, dconf text not null, tags text not null);
+    CREATE TABLE notes (id integer primary key, guid text not null, mid integer not null, mod integer not null,
+        usn integer not null, tags text not null, flds text not null, sfld integer not null, csum integer not null,
+        flags integer not null, data text not null);
+    CREATE TABLE cards (id integer primary key, nid integer not null, did integer not null, ord integer not null,
+        mod integer not null, usn integer not null, type integer not null, queue integer not null, due integer not null,
+        ivl integer not null, factor integer not null, reps integer not null, lapses integer not null,
+        left integer not null, odue integer not null, odid integer not null, flags integer not null,
+        data text not null);
+    CREATE TABLE revlog (id integer primary key, cid integer not null, usn integer not null, ease integer not null,
+        ivl integer not null, lastIvl integer not null, factor integer not null, time integer not null,
+        type integer not null);
+    CREATE TABLE graves (usn integer not null, oid integer not null, type integer not null);
+    CREATE INDEX ix_notes_usn ON notes (usn);
+    CREATE INDEX ix_cards_usn ON cards (usn);
+    CREATE INDEX ix_revlog_usn ON revlog (usn);
+    CREATE INDEX ix_cards_nid ON cards (nid);
+    CREATE INDEX ix_cards_sched ON cards (did, queue, due);
+    CREATE INDEX ix_revlog_cid ON revlog (cid);
+    CREATE INDEX ix_notes_csum ON notes (csum);
+'''
+
+_DECK_CONF = {"1": {
+    "id": 1, "name": "Default", "mod": 0, "usn": 0, "maxTaken": 60, "autoplay": True, "timer": 0, "replayq": True,
+    "dyn": False,
+    "new": {"bury": True, "delays": [1, 10], "initialFactor": 2500, "ints": [1, 4, 7], "order": 1, "perDay": 20,
+            "separate": True},
+    "lapse": {"delays": [10], "leechAction": 0, "leechFails": 8, "minInt": 1, "mult": 0},
+    "rev": {"bury": True, "ease4": 1.3, "fuzz": 0.05, "ivlFct": 1, "maxIvl": 36500, "minSpace": 1, "perDay": 100},
+}}
+
+
+def _deck(deck_id: int, name: str, now: int) -> dict:
+    return {"id": deck_id, "name": name, "mod": now, "usn": -1, "desc": "", "dyn": 0, "conf": 1, "collapsed": False,
+            "extendNew": 0, "extendRev": 0, "newToday": [0, 0], "revToday": [0, 0], "lrnToday": [0, 0],
+            "timeToday": [0, 0]}
+
+
+def _model(model_id: int, deck_id: int, now: int) -> dict:
+    field = {"sticky": False, "rtl": False, "font": "Arial", "size": 20, "media": []}
+    return {
+        "id": model_id, "name": "Study Buddy Basic", "type": 0, "mod": now, "usn": -1, "sortf": 0, "did": deck_id,
+        "flds": [dict(field, name="Front", ord=0), dict(field, name="Back", ord=1)],
+        "tmpls": [{"name": "Card 1", "ord": 0, "qfmt": "{{Front}}", "afmt": "{{FrontSide}}<hr id=answer>{{Back}}",
+                   "did": None, "bqfmt": "", "bafmt": ""}],
+        "css": ".card { font-family: arial; font-size: 20px; text-align: left; color: black; background: white; }",
+        "latexPre": "\\documentclass[12pt]{article}\n\\special{papersize=3in,5in}\n\\usepackage[utf8]{inputenc}\n"
+                    "\\usepackage{amssymb,amsmath}\n\\pagestyle{empty}\n\\setlength{\\parindent}{0in}\n"
+                    "\\begin{document}\n",
+        "latexPost": "\\end{document}", "tags": [], "vers": [], "req": [[0, "all", [0]]],
+    }
+
+
+def _html(text: str) -> str:
+    return html_escape(text).replace("\n", "<br>")
+
+
+def _write_collection(path: str, items, title: str):
+    """Build an Anki collection at path from items, inserting in batches."""
+    now = int(time.time())
+    base_id = int(time.time() * 1000)
+    model_id = base_id
+    decks = {}
+
+    def deck_id(name: str) -> int:
+        full = f"{ROOT_DECK}::{title}" + (f"::{name}" if name else "")
+        if full not in decks:
+            decks[full] = base_id + len(decks) + 1
+        return decks[full]
+
+    def rows():
+        for n, item in enumerate(items):
+            front, back = card_sides(item)
+            fields = f"{_html(front)}\x1f{_html(back)}"
+            checksum = int(hashlib.sha1(front.encode("utf-8")).hexdigest()[:8], 16)
+            guid = hashlib.sha1(fields.encode("utf-8")).hexdigest()[:10]
+            note_id = base_id + n
+            yield ((note_id, guid, model_id, now, -1, "", fields, front, checksum, 0, ""),
+                   (note_id, note_id, deck_id(item.get("deck", "")), 0, now, -1, 0, 0, n, 0, 0, 0, 0, 0, 0, 0, 0, ""))
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(_ANKI_SCHEMA)
+        main_deck = deck_id("")
+        pending = rows()
+        while True:
+            batch = list(itertools.islice(pending, INSERT_BATCH))
+            if not batch:
+                break
+            conn.executemany('INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', [note for note, _ in batch])
+            conn.executemany('INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                             [card for _, card in batch])
+        all_decks = {"1": _deck(1, "Default", now)}
+        all_decks.update({str(did): _deck(did, name, now) for name, did in decks.items()})
+        conf = {"activeDecks": [main_deck], "curDeck": main_deck, "curModel": str(model_id), "nextPos": 1,
+                "newSpread": 0, "collapseTime": 1200, "timeLim": 0, "estTimes": True, "dueCounts": True,
+                "sortType": "noteFld", "sortBackwards": False, "addToCur": True}
+        conn.execute(
+            'INSERT INTO col VALUES (1, ?, ?, ?, 11, 0, 0, 0, ?, ?, ?, ?, ?)',
+            (now, now * 1000, now * 1000, json.dumps(conf), json.dumps({str(model_id): _model(model_id, main_deck, now)}),
+             json.dumps(all_decks), json.dumps(_DECK_CONF), "{}")
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def export_apkg(items, title: str = "Export"):
+    """Anki package: a zipped SQLite collection built on disk and streamed back in chunks."""
+    workdir = tempfile.mkdtemp(prefix="study_engine_export_")
+    collection = os.path.join(workdir, "collection.anki2")
+    package = os.path.join(workdir, "export.apkg")
+    try:
+        _write_collection(collection, items, title)
+        with zipfile.ZipFile(package, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.write(collection, "collection.anki2")
+            archive.writestr("media", "{}")
+        os.remove(collection)
+        with open(package, "rb") as f:
+            yield from iter(lambda: f.read(CHUNK_BYTES), b"")
+    finally:
+        for path in (collection, package):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(workdir)
+
+
+def export_stream(fmt: str, kind: str, items, title: str = "Export"):
+    """Byte chunks of items exported in fmt; kind is "flashcards" or "questions"."""
+    if fmt not in FORMATS or kind not in FORMATS[fmt][3]:
+        raise ValueError(f"Cannot export {kind} as {fmt}")
+    if fmt == "apkg":
+        return export_apkg(items, title)
+    if fmt == "csv":
+        return export_csv(items, kind)
+    if fmt == "jsonl":
+        return export_jsonl(items, kind)
+    return export_qti(items, title)
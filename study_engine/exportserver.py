@@ -0,0 +1,109 @@
+"""
+Incremental download endpoint for large exports.
+
+Streamlit download buttons hold the whole file in memory, so exports of
+stored question banks are served by this small server instead:
+
+    python -m study_engine.exportserver --port 8701
+
+The app creates a short-lived ticket in the shared state store naming the
+owner, what to export and the format, and links to EXPORT_URL/export/<ticket>.
+The server reads the items from the database a batch at a time and sends the
+file with chunked transfer encoding, so memory use does not depend on the
+size of the export.
+"""
+
+import argparse
+import os
+import secrets
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from study_engine import config
+from study_engine.database import is_remote
+from study_engine.exports import FORMATS, export_name, export_stream
+from study_engine.kvstore import KeyValueStore, open_store
+from study_engine.question_banks import QuestionBankStore
+
+TICKET_SECONDS = 600
+
+
+def create_ticket(store: KeyValueStore, owner: str, source: dict, fmt: str) -> str:
+    """Allow owner to download source ({"type": "bank", "bank_id": ...} or {"type": "library"}) as fmt."""
+    token = secrets.token_urlsafe(24)
+    store.set(f"export:{token}", {"owner": owner, "source": source, "format": fmt}, ttl=TICKET_SECONDS)
+    return token
+
+
+def open_export(ticket: dict, banks: QuestionBankStore) -> tuple:
+    """(title, byte chunks) for a ticket; raises LookupError for banks the owner does not have."""
+    source = ticket["source"]
+    if source["type"] == "library":
+        title, items = "Question banks", banks.iter_library(ticket["owner"])
+    else:
+        title = banks.bank_name(source["bank_id"], ticket["owner"])
+        if title is None:
+            raise LookupError("No such question bank")
+        items = banks.iter_questions(source["bank_id"])
+    return title, export_stream(ticket["format"], "questions", items, title)
+
+
+def make_handler(store: KeyValueStore, banks: QuestionBankStore):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status: int):
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            parts = self.path.split('/')
+            if len(parts) != 3 or parts[1] != "export":
+                return self._reply(404)
+            ticket = store.get(f"export:{parts[2]}")
+            if not ticket:
+                return self._reply(404)
+            try:
+                title, chunks = open_export(ticket, banks)
+            except (LookupError, ValueError):
+                return self._reply(404)
+            self.send_response(200)
+            self.send_header("Content-Type", FORMATS[ticket["format"]][1])
+            self.send_header("Content-Disposition", f'attachment; filename="{export_name(title, ticket["format"])}"')
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for chunk in chunks:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True
+            finally:
+                chunks.close()
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(host: str, port: int, database: str = None) -> ThreadingHTTPServer:
+    """Create a server bound to host:port; call serve_forever() to run it."""
+    database = database or config.database()
+    store = open_store(os.getenv("STATE_STORE_URL"), config.db_path() if is_remote(database) else database)
+    return ThreadingHTTPServer((host, port), make_handler(store, QuestionBankStore(database)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming export downloads for My Study Buddy")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8701)
+    parser.add_argument("--db", default=None, help="App database (default: DATABASE_URL, DATABASE_PATH or users.db)")
+    args = parser.parse_args()
+    server = serve(args.host, args.port, args.db)
+    print(f"Export server listening on {args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+"""
+Generation routines that run on job workers, outside any Streamlit script run.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from study_engine.artifacts import ArtifactStore, content_hash
+from study_engine.config import CONTEXT_TOKEN_BUDGET
+from study_engine.chunking import MAX_CHUNK_TOKENS, chunk_hash, content_chunks
+from study_engine.dedup import ITEM_FIELDS, remove_duplicates
+from study_engine.jobs import JobManager, job_key
+from study_engine.prompts import (
+    FLASHCARD_SYSTEM, MATCHING_SYSTEM, QUIZ_SYSTEM, STUDY_GUIDE_SYSTEM, STUDY_PACK_SYSTEM, SUMMARY_SYSTEM,
+    TOP_UP_NOTE, TOPIC_NOTE, format_user_prompt,
+)
+from study_engine.question_banks import DocumentQuestionBank
+from study_engine.retrieval import estimate_tokens, select_passages
+from study_engine.schemas import VALIDATORS, split_study_pack, validate_question
+from study_engine.singleflight import generation_flights
+
+CHUNK_WORKERS = 4
+GUIDE_SECTIONS = ("summary", "takeaways", "facts")
+
+
+def remove_duplicates_and_top_up(provider, feature: str, system_prompt: str, user_prompt: str, data) -> tuple:
+    """
+    Drop near-duplicate items and ask once for as many replacements; returns (data, [removed, added]).
+
+    Features without item lists pass through unchanged.
+    """
+    if feature not in ITEM_FIELDS:
+        return data, None
+    data, removed = remove_duplicates(feature, data)
+    if not removed:
+        return data, None
+    list_key, field = ITEM_FIELDS[feature]
+    items = data[list_key]
+    note = TOP_UP_NOTE.format(num=removed, items="\n".join(f"- {item.get(field, '')}" for item in items))
+    try:
+        extra = VALIDATORS[feature](provider.generate_json(system_prompt, f"{user_prompt}\n\n{note}", feature))
+        extra, _ = remove_duplicates(feature, extra, existing=items)
+        added = extra[list_key][:removed]
+    except Exception:
+        added = []
+    items = [dict(item, id=number) for number, item in enumerate(items + added, 1)]
+    return dict(data, **{list_key: items}), [removed, len(added)]
+
+
+def run_generation(provider, system_prompt: str, user_prompt: str, store: ArtifactStore = None,
+                   kind: str = "", content: str = "", params: str = "", reuse: bool = False,
+                   selection: list = None, feature: str = "", compression: list = None, cite=None) -> dict:
+    """
+    Generate and parse one response; runs on a job worker, so no Streamlit calls.
+
+    Near-duplicate flashcards, questions and pairs are replaced by a top-up
+    request before the result is stored. cite, when given, is called as cite(feature, data) on the parsed response
+    and returns it with sources added; the stored artifact stays uncited.
+    """
+    feature = feature or kind
+    reused = None
+    data = None
+    deduplicated = None
+    if store and reuse:
+        match = store.find_similar(content, kind, params)
+        if match:
+            data, reused = match
+    if data is None:
+        data, deduplicated = generation_flights.do(
+            job_key(system_prompt, user_prompt),
+            lambda: remove_duplicates_and_top_up(
+                provider, feature, system_prompt, user_prompt,
+                provider.generate_json(system_prompt, user_prompt, feature)
+            )
+        )
+        if store:
+            store.save(content, kind, params, data)
+    if cite:
+        data = cite(feature, data)
+    return {"data": data, "reused": reused, "selection": selection, "compression": compression,
+            "deduplicated": deduplicated}
+
+
+def run_bank_quiz(provider, content: str, num_questions: int, bank: DocumentQuestionBank, owner: str,
+                  document: str, topic: str = "", use_bank: bool = True, compression: list = None,
+                  cite=None) -> dict:
+    """
+    Serve a quiz from the document's question bank, generating only what is missing.
+
+    Questions owner has not seen are sampled from the bank for (document,
+    topic). The model is asked only for the remaining questions, which are
+    added to the bank. Everything served is marked as seen by owner. Without
+    a document fingerprint the bank is not used.
+    """
+    if not document:
+        bank = None
+    banked = bank.sample_unseen(owner, document, topic, num_questions) if bank and use_bank else []
+    questions = [q for _, q in banked]
+    gap = num_questions - len(questions)
+    title = bank.title(document, topic) if bank else ""
+    fresh = []
+    deduplicated = None
+    if gap > 0:
+        user_prompt = format_user_prompt("quiz", num=gap, content=content)
+        if topic:
+            user_prompt += "\n\n" + TOPIC_NOTE.format(topic=topic)
+        if questions:
+            user_prompt += "\n\n" + TOP_UP_NOTE.format(num=gap, items="\n".join(f"- {q['question']}" for q in questions))
+        data, deduplicated = generation_flights.do(
+            job_key(QUIZ_SYSTEM, user_prompt),
+            lambda: remove_duplicates_and_top_up(
+                provider, "quiz", QUIZ_SYSTEM, user_prompt, provider.generate_json(QUIZ_SYSTEM, user_prompt, "quiz")
+            )
+        )
+        data, _ = remove_duplicates("quiz", data, existing=questions)
+        for number, question in enumerate(data.get("questions") or [], 1):
+            try:
+                fresh.append(validate_question(question, number))
+            except ValueError:
+                continue
+        fresh = fresh[:gap]
+        if not fresh and not questions:
+            raise ValueError("No valid questions found in response")
+        title = title or topic or str(data.get("title") or "Quiz")
+        if bank:
+            bank.mark_seen(owner, document, topic, bank.add(document, topic, title, fresh))
+    if banked:
+        bank.mark_seen(owner, document, topic, [position for position, _ in banked])
+    data = {"title": title or topic or "Quiz",
+            "questions": [dict(q, id=number) for number, q in enumerate(questions + fresh, 1)]}
+    if cite:
+        data = cite("quiz", data)
+    return {"data": data, "reused": None, "banked": [len(questions), len(fresh)], "selection": None,
+            "compression": compression, "deduplicated": deduplicated}
+
+
+def run_study_pack(provider, content: str, num_cards: int, num_questions: int, num_pairs: int,
+                   store: ArtifactStore, jobs: JobManager, owner: str, compression: list = None) -> dict:
+    """
+    Generate every artifact type from one upload; runs on a job worker.
+
+    All sections are requested in one combined response. Sections that are
+    missing or invalid are regenerated concurrently from the same passages.
+    Near-duplicate items are replaced once per section, either here or by
+    run_generation for regenerated sections. Each section is then recorded
+    as a finished job for its feature page. A section whose regeneration
+    fails is reported in "failed" and the others are still published.
+    """
+    user_prompt = format_user_prompt(
+        "study_pack", content=content, num_cards=num_cards, num_questions=num_questions, num_pairs=num_pairs
+    )
+    try:
+        pack = generation_flights.do(
+            job_key(STUDY_PACK_SYSTEM, user_prompt),
+            lambda: provider.generate_json(STUDY_PACK_SYSTEM, user_prompt, "study_pack")
+        )
+    except Exception:
+        pack = {}
+    sections = split_study_pack(pack)
+    
+    fallback_prompts = {
+        "flashcards": (FLASHCARD_SYSTEM, format_user_prompt("flashcards", num=num_cards, content=content)),
+        "quiz": (QUIZ_SYSTEM, format_user_prompt("quiz", num=num_questions, content=content)),
+        "matching": (MATCHING_SYSTEM, format_user_prompt("matching", num=num_pairs, content=content)),
+        "summary": (SUMMARY_SYSTEM, format_user_prompt("summary", content=content)),
+    }
+    missing = [feature for feature, data in sections.items() if data is None]
+    failed = {}
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            futures = {
+                feature: pool.submit(run_generation, provider, *fallback_prompts[feature], feature=feature)
+                for feature in missing
+            }
+            for feature, future in futures.items():
+                try:
+                    sections[feature] = VALIDATORS[feature](future.result()["data"])
+                except Exception as e:
+                    failed[feature] = str(e)
+    if len(failed) == len(sections):
+        raise RuntimeError(f"The study pack could not be generated: {next(iter(failed.values()))}")
+    
+    # Regenerated sections went through run_generation, which already deduplicated and topped them up.
+    for feature in ITEM_FIELDS:
+        if feature not in missing:
+            sections[feature], _ = remove_duplicates_and_top_up(
+                provider, feature, *fallback_prompts[feature], sections[feature]
+            )
+    
+    params = {"flashcards": f"num={num_cards}", "quiz": f"num={num_questions}", "matching": f"num={num_pairs}", "summary": ""}
+    for feature, data in sections.items():
+        if feature in failed:
+            continue
+        store.save(content, feature, params[feature], data)
+        jobs.record(owner, feature, {
+            "data": data, "reused": None, "selection": None, "original_words": len(content.split())
+        })
+    return {
+        "counts": {
+            feature: len(sections[feature][ITEM_FIELDS[feature][0]]) if feature not in failed else 0
+            for feature in ("flashcards", "quiz", "matching")
+        },
+        "regenerated": [feature for feature in missing if feature not in failed],
+        "failed": failed,
+        "compression": compression,
+    }
+
+
+def _generate_validated(provider, feature: str, system_prompt: str, user_prompt: str) -> dict:
+    return generation_flights.do(
+        job_key(system_prompt, user_prompt),
+        lambda: VALIDATORS[feature](provider.generate_json(system_prompt, user_prompt, feature))
+    )
+
+
+def _chunk_partials(store: ArtifactStore, kind: str, chunks: list, generate, usable) -> tuple:
+    """
+    Partial result per chunk, cached under the chunk's hash; returns (partials, regenerated).
+
+    A chunk's cached partial is used when usable(partial) accepts it. The
+    others are generated concurrently with generate(chunk) and cached.
+    """
+    keys = [chunk_hash(chunk) for chunk in chunks]
+    partials = [store.get(key, f"{kind}:chunk") for key in keys]
+    missing = [i for i, partial in enumerate(partials) if partial is None or not usable(i, partial)]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(CHUNK_WORKERS, len(missing))) as pool:
+            for i, data in zip(missing, pool.map(lambda i: generate(i, chunks[i]), missing)):
+                store.put(keys[i], f"{kind}:chunk", "", data)
+                partials[i] = data
+    return partials, len(missing)
+
+
+def _notes_chunks(content: str, token_budget: int) -> list:
+    """All content-defined chunks of the notes, each small enough for one prompt."""
+    return content_chunks(content, max_tokens=min(MAX_CHUNK_TOKENS, token_budget)) or [content]
+
+
+def run_incremental_flashcards(provider, content: str, num_cards: int, store: ArtifactStore,
+                               reuse: bool = False, token_budget: int = CONTEXT_TOKEN_BUDGET,
+                               compression: list = None) -> dict:
+    """
+    Generate flashcards chunk by chunk, reusing the cards of unchanged chunks.
+
+    content is the whole of the notes, cut into chunks of at most
+    token_budget tokens. The cards are spread evenly over all the chunks in
+    document order, so they cover the notes to the end. After an edit only
+    the chunks whose text changed are sent to the model again.
+    """
+    params = f"num={num_cards}"
+    chunks = _notes_chunks(content, token_budget)
+    if reuse:
+        match = store.find_similar(content, "flashcards", params)
+        if match:
+            return {"data": match[0], "reused": match[1], "selection": None, "compression": compression}
+    quotas = [(i + 1) * num_cards // len(chunks) - i * num_cards // len(chunks) for i in range(len(chunks))]
+    wanted = [i for i, quota in enumerate(quotas) if quota]
+    per_chunk = max(quotas)
+    
+    def generate(i, chunk):
+        user_prompt = format_user_prompt("flashcards", num=per_chunk, content=chunk)
+        return dict(_generate_validated(provider, "flashcards", FLASHCARD_SYSTEM, user_prompt), requested=per_chunk)
+    
+    # A chunk's cards are reused when at least this many were asked for, even if the model returned fewer.
+    partials, regenerated = _chunk_partials(
+        store, "flashcards", [chunks[i] for i in wanted], generate,
+        lambda i, partial: partial.get("requested", 0) >= quotas[wanted[i]]
+    )
+    cards = []
+    for i, partial in zip(wanted, partials):
+        cards.extend(partial["flashcards"][:quotas[i]])
+    data = {
+        "title": partials[0]["title"] if partials else "Flashcards",
+        "flashcards": [dict(card, id=number) for number, card in enumerate(cards, 1)],
+    }
+    # Sections can repeat each other's cards; only the merged set is checked, so cached partials stay as generated.
+    # Replacements are asked for from the passages that best represent the notes, within the budget.
+    passages, _, _ = select_passages(content, token_budget=token_budget)
+    data, deduplicated = remove_duplicates_and_top_up(
+        provider, "flashcards", FLASHCARD_SYSTEM,
+        format_user_prompt("flashcards", num=num_cards, content=passages), data
+    )
+    store.save(content, "flashcards", params, data)
+    return {"data": data, "reused": None, "selection": None, "compression": compression,
+            "chunks": [len(wanted) - regenerated, len(wanted)], "deduplicated": deduplicated}
+
+
+def _summary_notes(summary: dict) -> str:
+    lines = [summary["overview"]]
+    lines += [f"- {point}" for point in summary["key_points"]]
+    lines += [f"{term['term']}: {term.get('definition', '')}" for term in summary["terms"]]
+    lines += [f"- {takeaway}" for takeaway in summary["takeaways"]]
+    return "\n".join(lines)
+
+
+def _combine_summaries(provider, store: ArtifactStore, partials: list, token_budget: int) -> dict:
+    """
+    Merge partial summaries into one, in rounds: consecutive partials are
+    grouped up to token_budget and each group is summarized again until one
+    is left. Every combined summary is cached under a hash of its input.
+    """
+    def combine(group):
+        notes = "\n\n".join(_summary_notes(partial) for partial in group)
+        key = content_hash(notes)
+        data = store.get(key, "summary:combine")
+        if data is None:
+            data = _generate_validated(provider, "summary", SUMMARY_SYSTEM, format_user_prompt("summary", content=notes))
+            data["terms"] = data["terms"] or [term for partial in group for term in partial["terms"]]
+            store.put(key, "summary:combine", "", data)
+        return data
+
+    while len(partials) > 1:
+        groups = [[]]
+        size = 0
+        for partial in partials:
+            cost = estimate_tokens(_summary_notes(partial))
+            # At least two per group, so every round leaves fewer summaries.
+            if len(groups[-1]) > 1 and size + cost > token_budget:
+                groups.append([])
+                size = 0
+            groups[-1].append(partial)
+            size += cost
+        with ThreadPoolExecutor(max_workers=min(CHUNK_WORKERS, len(groups))) as pool:
+            partials = list(pool.map(lambda group: combine(group) if len(group) > 1 else group[0], groups))
+    return partials[0]
+
+
+def run_incremental_summary(provider, content: str, store: ArtifactStore, reuse: bool = False,
+                            token_budget: int = CONTEXT_TOKEN_BUDGET, compression: list = None, cite=None) -> dict:
+    """
+    Summarize each chunk, then combine the partial summaries into one.
+
+    Every chunk of the notes is summarized, as in run_incremental_flashcards;
+    notes that fit in one chunk take a single call. Partial summaries are
+    cached per chunk, so after an edit only the changed chunks and the short
+    combining steps go to the model. cite works as in run_generation.
+    """
+    reused = None
+    data = None
+    chunks = _notes_chunks(content, token_budget)
+    if reuse:
+        match = store.find_similar(content, "summary")
+        if match:
+            data, reused = match
+    counts = None
+    if data is None:
+        def generate(i, chunk):
+            return _generate_validated(provider, "summary", SUMMARY_SYSTEM, format_user_prompt("summary", content=chunk))
+        
+        partials, regenerated = _chunk_partials(store, "summary", chunks, generate, lambda i, partial: True)
+        counts = [len(chunks) - regenerated, len(chunks)]
+        data = _combine_summaries(provider, store, partials, token_budget)
+        store.save(content, "summary", "", data)
+    if cite:
+        data = cite("summary", data)
+    return {"data": data, "reused": reused, "selection": None, "compression": compression, "chunks": counts}
+
+
+def study_guide_id(subject: str, content: str) -> str:
+    return content_hash(f"{subject}\n{content}")
+
+
+def run_study_guide_outline(provider, subject: str, content: str, store: ArtifactStore,
+                            selection: list = None, compression: list = None) -> dict:
+    """
+    First phase of a study guide: the outline and key topics only.
+
+    The remaining sections are generated by run_study_guide_section when
+    they are first needed. Every part is cached under the guide's id.
+    """
+    guide_id = study_guide_id(subject, content)
+    data = store.get(guide_id, "study_guide:outline")
+    if data is None:
+        user_prompt = format_user_prompt("study_guide_outline", subject=subject, content=content)
+        data = generation_flights.do(
+            job_key(STUDY_GUIDE_SYSTEM, user_prompt),
+            lambda: provider.generate_json(STUDY_GUIDE_SYSTEM, user_prompt, "study_guide_outline")
+        )
+        store.put(guide_id, "study_guide:outline", "", data)
+    return {"data": dict(data, guide_id=guide_id), "reused": None, "selection": selection, "compression": compression}
+
+
+def run_study_guide_section(provider, section: str, subject: str, content: str, outline: dict,
+                            store: ArtifactStore) -> dict:
+    """Generate one of GUIDE_SECTIONS for a guide whose outline exists, or return it from the cache."""
+    guide_id = study_guide_id(subject, content)
+    data = store.get(guide_id, f"study_guide:{section}")
+    if data is None:
+        titles = "; ".join(str(o.get("title", "")) for o in outline.get("outlines", [])) or subject
+        feature = f"study_guide_{section}"
+        user_prompt = format_user_prompt(feature, subject=subject, content=content, sections=titles)
+        data = generation_flights.do(
+            job_key(STUDY_GUIDE_SYSTEM, user_prompt),
+            lambda: provider.generate_json(STUDY_GUIDE_SYSTEM, user_prompt, feature)
+        )
+        store.put(guide_id, f"study_guide:{section}", "", data)
+    return {"data": data, "guide_id": guide_id}
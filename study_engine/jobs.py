@@ -0,0 +1,112 @@
+"""
+Background generation jobs that outlive Streamlit reruns and reconnects.
+
+Generation calls run on a worker pool instead of inside button handlers.
+Job state and results live in the shared key-value store keyed by job id, so
+any rerun, reconnected session or other replica can find the job again and
+pick up its result.
+"""
+
+import hashlib
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from study_engine.kvstore import KeyValueStore
+
+ACTIVE_STATUSES = ("queued", "running")
+JOB_RETENTION_SECONDS = 24 * 3600
+
+
+def job_key(*parts: str) -> str:
+    """Hash the inputs that make two submissions duplicates of each other."""
+    return hashlib.sha256("\x1f".join(parts).encode('utf-8', errors='ignore')).hexdigest()
+
+
+class JobManager:
+    """Run generation tasks on a worker pool and persist their state."""
+
+    def __init__(self, store: KeyValueStore, max_workers: int = 4, job_timeout: float = 600):
+        self.store = store
+        self.job_timeout = job_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="study-job")
+
+    def _save(self, job: dict):
+        self.store.set(f"job:{job['id']}", job, ttl=JOB_RETENTION_SECONDS)
+
+    def _new_job(self, owner: str, feature: str, status: str) -> dict:
+        now = time.time()
+        return {
+            "id": uuid.uuid4().hex,
+            "owner": owner,
+            "feature": feature,
+            "status": status,
+            "result": None,
+            "error": None,
+            "dismissed": False,
+            "created_at": now,
+            "updated_at": now,
+            "expires_at": now + self.job_timeout,
+        }
+
+    def submit(self, owner: str, feature: str, task, dedupe_key: str) -> str:
+        """
+        Queue task() for owner and return its job id.
+
+        If the same owner already has an active job with the same dedupe_key,
+        that job's id is returned and nothing new is scheduled.
+        """
+        job = self._new_job(owner, feature, "queued")
+        active_key = f"job_active:{owner}:{dedupe_key}"
+        if not self.store.add(active_key, job["id"], ttl=self.job_timeout):
+            existing = self.get(self.store.get(active_key) or "")
+            if existing and existing["status"] in ACTIVE_STATUSES:
+                return existing["id"]
+            self.store.set(active_key, job["id"], ttl=self.job_timeout)
+        self._save(job)
+        self.store.set(f"job_latest:{owner}:{feature}", job["id"], ttl=JOB_RETENTION_SECONDS)
+        self._executor.submit(self._run, job, task, active_key)
+        return job["id"]
+
+    def record(self, owner: str, feature: str, result: dict) -> str:
+        """Store an already finished result as a done job for owner's feature."""
+        job = self._new_job(owner, feature, "done")
+        job["result"] = result
+        self._save(job)
+        self.store.set(f"job_latest:{owner}:{feature}", job["id"], ttl=JOB_RETENTION_SECONDS)
+        return job["id"]
+
+    def _run(self, job: dict, task, active_key: str):
+        job.update(status="running", updated_at=time.time())
+        self._save(job)
+        try:
+            result = task()
+        except Exception as e:
+            job.update(status="failed", error=str(e))
+        else:
+            job.update(status="done", result=result)
+        job["updated_at"] = time.time()
+        self._save(job)
+        self.store.delete(active_key)
+
+    def get(self, job_id: str) -> dict:
+        """Return a job by id, or None."""
+        job = self.store.get(f"job:{job_id}") if job_id else None
+        if job and job["status"] in ACTIVE_STATUSES and job["expires_at"] < time.time():
+            # The replica running it restarted or the call hung.
+            job.update(status="failed", error="The job was interrupted, please try again")
+        return job
+
+    def latest(self, owner: str, feature: str, max_age_seconds: float = 1800) -> dict:
+        """Return the owner's most recent, undismissed job for a feature."""
+        job = self.get(self.store.get(f"job_latest:{owner}:{feature}"))
+        if not job or job["dismissed"] or job["created_at"] < time.time() - max_age_seconds:
+            return None
+        return job
+
+    def dismiss(self, job_id: str):
+        """Stop offering a finished job when a session reattaches."""
+        job = self.store.get(f"job:{job_id}")
+        if job:
+            job["dismissed"] = True
+            self._save(job)
@@ -0,0 +1,96 @@
+"""
+Stand-in network key-value store for multi-replica deployments and testing.
+
+Serves the protocol used by HTTPKeyValueStore on top of a SQLite file:
+
+    python -m study_engine.kvserver --port 8700 --db state.db
+
+Point every replica at it with STATE_STORE_URL=http://host:8700.
+"""
+
+import argparse
+import json
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from study_engine.kvstore import SQLiteKeyValueStore
+
+
+def make_handler(store: SQLiteKeyValueStore):
+    class Handler(BaseHTTPRequestHandler):
+        def _route(self):
+            parts = self.path.split('/', 2)
+            if len(parts) != 3 or parts[1] not in ("kv", "buckets"):
+                return None, None
+            return parts[1], urllib.parse.unquote(parts[2])
+
+        def _body(self) -> dict:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length)) if length else {}
+
+        def _reply(self, status: int, payload=None):
+            data = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            kind, key = self._route()
+            if kind != "kv":
+                return self._reply(404)
+            value = store.get(key)
+            if value is None:
+                return self._reply(404)
+            self._reply(200, {"value": value})
+
+        def do_PUT(self):
+            kind, key = self._route()
+            if kind != "kv":
+                return self._reply(404)
+            body = self._body()
+            store.set(key, body["value"], body.get("ttl"))
+            self._reply(204)
+
+        def do_POST(self):
+            kind, key = self._route()
+            body = self._body()
+            if kind == "kv":
+                return self._reply(200, {"added": store.add(key, body["value"], body.get("ttl"))})
+            if kind == "buckets":
+                wait = store.take_tokens(key, body["rate"], body["capacity"], body.get("tokens", 1))
+                return self._reply(200, {"wait": wait})
+            self._reply(404)
+
+        def do_DELETE(self):
+            kind, key = self._route()
+            if kind != "kv":
+                return self._reply(404)
+            store.delete(key)
+            self._reply(204)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(host: str, port: int, db_path: str) -> ThreadingHTTPServer:
+    """Create a server bound to host:port; call serve_forever() to run it."""
+    return ThreadingHTTPServer((host, port), make_handler(SQLiteKeyValueStore(db_path)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in key-value store for My Study Buddy replicas")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8700)
+    parser.add_argument("--db", default="state.db")
+    args = parser.parse_args()
+    server = serve(args.host, args.port, args.db)
+    print(f"Key-value store listening on {args.host}:{args.port} ({args.db})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
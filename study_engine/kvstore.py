@@ -0,0 +1,206 @@
+"""
+Pluggable key-value storage for state shared between app replicas.
+
+SQLiteKeyValueStore keeps everything in a local file for single-node
+deployments. HTTPKeyValueStore talks to a network store so several replicas
+behind a load balancer see the same sessions, jobs and rate-limit buckets;
+``python -m study_engine.kvserver`` is a small stand-in for that store.
+Values must be JSON-serializable.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+
+class KeyValueStore:
+    """Interface shared by the storage backends."""
+
+    def get(self, key: str):
+        """Return the value for key, or None if missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value, ttl: float = None):
+        """Store value under key, optionally expiring after ttl seconds."""
+        raise NotImplementedError
+
+    def add(self, key: str, value, ttl: float = None) -> bool:
+        """Store value only if key is absent; return whether it was stored."""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def take_tokens(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        """
+        Take tokens from the token bucket at key.
+
+        The bucket refills at rate tokens per second up to capacity, and rate
+        must be positive. Returns 0 when the tokens were taken, otherwise the
+        seconds to wait before enough tokens are available (nothing is taken
+        in that case).
+        """
+        raise NotImplementedError
+
+
+class SQLiteKeyValueStore(KeyValueStore):
+    """Key-value store in a local SQLite file."""
+
+    PURGE_EVERY = 500
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._writes = 0
+        self._lock = threading.Lock()
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS kv_store (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS kv_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def _connect(self):
+        return sqlite3.connect(str(self.db_path), timeout=10, isolation_level=None)
+
+    def _expiry(self, ttl):
+        return time.time() + ttl if ttl else None
+
+    def _maybe_purge(self, conn):
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            conn.execute('DELETE FROM kv_store WHERE expires_at IS NOT NULL AND expires_at < ?', (time.time(),))
+
+    def get(self, key: str):
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT value FROM kv_store WHERE key = ? AND (expires_at IS NULL OR expires_at >= ?)',
+            (key, time.time())
+        ).fetchone()
+        conn.close()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value, ttl: float = None):
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR REPLACE INTO kv_store (key, value, expires_at) VALUES (?, ?, ?)',
+            (key, json.dumps(value), self._expiry(ttl))
+        )
+        self._maybe_purge(conn)
+        conn.close()
+
+    def add(self, key: str, value, ttl: float = None) -> bool:
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM kv_store WHERE key = ? AND expires_at < ?', (key, time.time()))
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO kv_store (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, json.dumps(value), self._expiry(ttl))
+            )
+            conn.execute('COMMIT')
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def delete(self, key: str):
+        conn = self._connect()
+        conn.execute('DELETE FROM kv_store WHERE key = ?', (key,))
+        conn.close()
+
+    def take_tokens(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            now = time.time()
+            row = conn.execute('SELECT tokens, updated_at FROM kv_buckets WHERE key = ?', (key,)).fetchone()
+            available = capacity if row is None else min(capacity, row[0] + (now - row[1]) * rate)
+            wait = 0.0
+            if available >= tokens:
+                available -= tokens
+            else:
+                wait = (tokens - available) / rate
+            conn.execute(
+                'INSERT OR REPLACE INTO kv_buckets (key, tokens, updated_at) VALUES (?, ?, ?)',
+                (key, available, now)
+            )
+            conn.execute('COMMIT')
+            return wait
+        finally:
+            conn.close()
+
+
+class HTTPKeyValueStore(KeyValueStore):
+    """Client for a network key-value store speaking the kvserver protocol."""
+
+    def __init__(self, base_url: str, timeout: float = 5.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, body: dict = None):
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(
+            self.base_url + path, data=data, method=method,
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = response.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return json.loads(payload) if payload else None
+
+    def _path(self, prefix: str, key: str) -> str:
+        return f"/{prefix}/{urllib.parse.quote(key, safe='')}"
+
+    def get(self, key: str):
+        response = self._request("GET", self._path("kv", key))
+        return response["value"] if response else None
+
+    def set(self, key: str, value, ttl: float = None):
+        self._request("PUT", self._path("kv", key), {"value": value, "ttl": ttl})
+
+    def add(self, key: str, value, ttl: float = None) -> bool:
+        return self._request("POST", self._path("kv", key), {"value": value, "ttl": ttl})["added"]
+
+    def delete(self, key: str):
+        self._request("DELETE", self._path("kv", key))
+
+    def take_tokens(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        body = {"rate": rate, "capacity": capacity, "tokens": tokens}
+        return self._request("POST", self._path("buckets", key), body)["wait"]
+
+
+def open_store(url: str, default_path) -> KeyValueStore:
+    """
+    Open the store named by url.
+
+    ``http://`` and ``https://`` URLs use the network store, ``sqlite:///path``
+    a specific SQLite file, and an empty url the SQLite file at default_path.
+    """
+    if url and url.startswith(("http://", "https://")):
+        return HTTPKeyValueStore(url)
+    if url and url.startswith("sqlite:///"):
+        return SQLiteKeyValueStore(url[len("sqlite:///"):])
+    if url:
+        raise ValueError(f"Unsupported state store URL: {url}")
+    return SQLiteKeyValueStore(default_path)
@@ -0,0 +1,183 @@
+"""
+MinHash / LSH index for spotting near-duplicate study content.
+
+Students upload the same slides with slightly different extraction artifacts
+(hyphenation, page breaks, pasted excerpts), so exact hashes rarely match.
+Signatures are kept in memory for fast lookup and persisted to SQLite so the
+index survives restarts. Replicas sharing the database pick up each other's
+signatures by periodically loading rows added since their last refresh.
+"""
+
+import hashlib
+import random
+import re
+import threading
+import time
+from array import array
+
+import numpy as np
+
+from study_engine.database import connect, location
+
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+REFRESH_SECONDS = 30
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20240611)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+_P = np.uint64(_MERSENNE_PRIME)
+_A = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)
+_B = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)
+_A_HI, _A_LO = _A >> np.uint64(32), _A & np.uint64(0xFFFFFFFF)
+# Shingles hashed per block, so the (shingles x permutations) arrays stay around 1 MB.
+SHINGLE_BLOCK = 1024
+
+
+def normalize_text(text: str) -> list:
+    """Lowercase, join hyphenated line breaks and split into words."""
+    text = re.sub(r'-\s*\n\s*', '', text.lower())
+    return re.findall(r'[a-z0-9]+', text)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Return the set of word n-gram shingles for the text."""
+    words = normalize_text(text)
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _stable_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'little')
+
+
+def _mod_mersenne(x: np.ndarray) -> np.ndarray:
+    """x mod 2**61 - 1 for x below 2**63, using 2**61 = 1 (mod 2**61 - 1)."""
+    x = (x & _P) + (x >> np.uint64(61))
+    return np.where(x >= _P, x - _P, x)
+
+
+def _permute(x: np.ndarray) -> np.ndarray:
+    """
+    (a * x + b) mod 2**61 - 1 for a column of hashes against every permutation.
+
+    a * x needs up to 122 bits, so both are split into 32-bit halves and the
+    partial products are folded with 2**61 = 1 and 2**64 = 8 (mod 2**61 - 1).
+    Every intermediate fits in 64 bits, so the result is exact.
+    """
+    x_hi, x_lo = x >> np.uint64(32), x & np.uint64(0xFFFFFFFF)
+    high = (_A_HI * x_hi) << np.uint64(3)
+    middle = _A_HI * x_lo + _A_LO * x_hi
+    middle = (middle >> np.uint64(29)) + ((middle & np.uint64((1 << 29) - 1)) << np.uint64(32))
+    low = _A_LO * x_lo
+    low = (low & _P) + (low >> np.uint64(61))
+    return _mod_mersenne(_mod_mersenne(high + middle + low) + _B)
+
+
+def minhash_signature(text: str) -> array:
+    """Compute the MinHash signature of the text's shingle set."""
+    hashes = np.fromiter((_stable_hash(s) % _MERSENNE_PRIME for s in shingles(text)), dtype=np.uint64)
+    if not hashes.size:
+        return array('Q', [_MERSENNE_PRIME] * NUM_PERM)
+    signature = np.full(NUM_PERM, _P, dtype=np.uint64)
+    for start in range(0, hashes.size, SHINGLE_BLOCK):
+        block = _permute(hashes[start:start + SHINGLE_BLOCK, None])
+        np.minimum(signature, block.min(axis=0), out=signature)
+    return array('Q', signature.tolist())
+
+
+def estimate_similarity(sig_a: array, sig_b: array) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def _band_keys(signature: array) -> list:
+    return [(band, hash(tuple(signature[band * ROWS:(band + 1) * ROWS]))) for band in range(BANDS)]
+
+
+class NearDuplicateIndex:
+    """In-memory LSH table over MinHash signatures, persisted to SQLite."""
+
+    def __init__(self, db_path):
+        self.db_path = location(db_path)
+        self._lock = threading.Lock()
+        self._signatures = {}
+        self._buckets = {}
+        self._last_rowid = 0
+        self._refreshed_at = 0.0
+        self._init_table()
+        self.refresh()
+
+    def _connect(self):
+        return connect(self.db_path)
+
+    def _init_table(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS minhash_signatures (
+                doc_id TEXT PRIMARY KEY,
+                signature BLOB NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def refresh(self):
+        """Load signatures added since the last refresh, including other replicas'."""
+        conn = self._connect()
+        rows = conn.execute(
+            'SELECT rowid, doc_id, signature FROM minhash_signatures WHERE rowid > ? ORDER BY rowid',
+            (self._last_rowid,)
+        ).fetchall()
+        conn.close()
+        with self._lock:
+            for rowid, doc_id, blob in rows:
+                signature = array('Q')
+                signature.frombytes(blob)
+                self._insert(doc_id, signature)
+                self._last_rowid = rowid
+            self._refreshed_at = time.monotonic()
+
+    def _insert(self, doc_id: str, signature: array):
+        self._signatures[doc_id] = signature
+        for key in _band_keys(signature):
+            self._buckets.setdefault(key, set()).add(doc_id)
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def add(self, doc_id: str, signature: array):
+        """Index a signature under doc_id and persist it."""
+        with self._lock:
+            if doc_id in self._signatures:
+                return
+            self._insert(doc_id, signature)
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR IGNORE INTO minhash_signatures (doc_id, signature) VALUES (?, ?)',
+            (doc_id, signature.tobytes())
+        )
+        conn.commit()
+        conn.close()
+
+    def query(self, signature: array, threshold: float = 0.9) -> list:
+        """Return (doc_id, similarity) pairs at or above threshold, best first."""
+        if time.monotonic() - self._refreshed_at > REFRESH_SECONDS:
+            self.refresh()
+        with self._lock:
+            candidates = set()
+            for key in _band_keys(signature):
+                candidates.update(self._buckets.get(key, ()))
+            matches = []
+            for doc_id in candidates:
+                similarity = estimate_similarity(signature, self._signatures[doc_id])
+                if similarity >= threshold:
+                    matches.append((doc_id, similarity))
+        matches.sort(key=lambda m: m[1], reverse=True)
+        return matches
@@ -0,0 +1,295 @@
+"""
+Prompt templates shared by the Streamlit pages and the batch CLI.
+"""
+
+from study_engine import config
+
+FLASHCARD_SYSTEM = """You are an expert flashcard creator. Create flashcards DIRECTLY from the provided content.
+RULES:
+1. Questions and answers MUST come from the content provided
+2. Make questions clear and answers accurate
+3. Output ONLY valid JSON - no explanations, no markdown"""
+
+FLASHCARD_USER = """Read this content and create {num} flashcards based ONLY on the information given:
+
+CONTENT:
+{content}
+
+Create question-answer pairs that help memorize key facts from the above content.
+
+Output ONLY this JSON:
+{{"title": "Flashcards", "flashcards": [{{"id": 1, "question": "Question from content?", "answer": "Answer from content"}}]}}"""
+
+QUIZ_SYSTEM = """You are an expert quiz creator. Your job is to create quiz questions DIRECTLY from the provided content.
+RULES:
+1. Questions MUST be based on facts from the content provided
+2. All answer options must be plausible but only ONE is correct
+3. Output ONLY valid JSON - no explanations, no markdown"""
+
+QUIZ_USER = """Read this content carefully and create {num} multiple-choice questions based ONLY on the information given:
+
+CONTENT:
+{content}
+
+Create questions that test understanding of the above content. Each question must have exactly 4 options with only ONE correct answer.
+
+Output ONLY this JSON:
+{{"title": "Quiz", "questions": [{{"id": 1, "question": "...", "options": [{{"label": "A", "text": "...", "is_correct": false}}, ...], "explanation": "why the answer is correct"}}]}}
+options: labels A-D, exactly one with "is_correct": true"""
+
+MATCHING_SYSTEM = """You are an educational game creator. Generate matching pairs as JSON.
+IMPORTANT: Output ONLY valid JSON. No explanations, no markdown, no extra text."""
+
+MATCHING_USER = """Create {num} term-definition pairs from this content:
+
+{content}
+
+Output this exact JSON structure:
+{{"title": "Matching Game", "pairs": [{{"id": 1, "term": "Term 1", "definition": "Definition 1"}}, {{"id": 2, "term": "Term 2", "definition": "Definition 2"}}]}}"""
+
+STUDY_GUIDE_SYSTEM = """You are a study guide creator. Generate study materials as JSON.
+IMPORTANT: Output ONLY valid JSON. No explanations, no markdown, no extra text."""
+
+STUDY_GUIDE_USER = """Create a study guide from this content:
+
+{content}
+
+Subject: {subject}
+
+Output this exact JSON structure:
+{{"title": "Study Guide", "subject": "{subject}", "summary": "2-3 paragraphs", "outlines": [{{"id": 1, "title": "...", "content": "...", "sub_items": ["..."]}}], "bullet_takeaways": ["..."], "key_topics": [{{"id": 1, "topic": "...", "importance": "high|medium|low"}}], "facts": [{{"id": 1, "fact": "...", "category": "..."}}]}}"""
+
+# Two-phase study guide: a quick outline first, then each remaining section when its tab is opened.
+
+STUDY_GUIDE_OUTLINE_USER = """Create the outline of a study guide from this content:
+
+{content}
+
+Subject: {subject}
+
+Output this exact JSON structure:
+{{"title": "Study Guide", "subject": "{subject}", "outlines": [{{"id": 1, "title": "...", "content": "...", "sub_items": ["..."]}}], "key_topics": [{{"id": 1, "topic": "...", "importance": "high|medium|low"}}]}}"""
+
+STUDY_GUIDE_SUMMARY_USER = """Write the summary section of a study guide from this content:
+
+{content}
+
+Subject: {subject}
+Guide sections: {sections}
+
+Output this exact JSON structure:
+{{"summary": "2-3 paragraphs"}}"""
+
+STUDY_GUIDE_TAKEAWAYS_USER = """Write the key takeaways of a study guide from this content:
+
+{content}
+
+Subject: {subject}
+Guide sections: {sections}
+
+Output this exact JSON structure:
+{{"bullet_takeaways": ["..."]}}"""
+
+STUDY_GUIDE_FACTS_USER = """List the important facts for a study guide from this content:
+
+{content}
+
+Subject: {subject}
+Guide sections: {sections}
+
+Output this exact JSON structure:
+{{"facts": [{{"id": 1, "fact": "...", "category": "..."}}]}}"""
+
+EVAL_SYSTEM = """You are an answer evaluator. Assess student answers as JSON.
+IMPORTANT: Output ONLY valid JSON. No explanations, no markdown, no extra text."""
+
+EVAL_USER = """Evaluate this answer:
+
+Question: {question}
+Correct Answer: {correct}
+Student Answer: {user_answer}
+
+Output this exact JSON structure:
+{{"is_correct": true, "score": 0.85, "feedback": "Feedback text", "suggestions": ["Suggestion 1", "Suggestion 2"]}}"""
+
+SUMMARY_SYSTEM = """You are an expert note summarizer. Create concise, informative summaries that preserve key concepts.
+RULES:
+1. Identify and preserve the most important concepts
+2. Use clear, concise language
+3. Organize information logically
+4. Output ONLY valid JSON - no explanations, no markdown"""
+
+SUMMARY_USER = """Summarize these study notes into a concise summary while preserving all key concepts:
+
+NOTES:
+{content}
+
+Create a summary with:
+- A brief overview (2-3 sentences)
+- Key points (bullet points)
+- Important terms and definitions
+- Main takeaways
+
+Output ONLY this JSON:
+{{"title": "Summary", "overview": "Brief 2-3 sentence overview of the content", "key_points": ["Key point 1", "Key point 2", "Key point 3"], "terms": [{{"term": "Important Term", "definition": "What it means"}}], "takeaways": ["Main takeaway 1", "Main takeaway 2"], "word_count_original": 0, "word_count_summary": 0}}"""
+
+STUDY_PACK_SYSTEM = """You are an expert study pack creator. Create a summary, flashcards, a quiz and a matching game DIRECTLY from the provided content in one response.
+RULES:
+1. Everything MUST come from the content provided
+2. Each quiz question has exactly 4 options and only ONE is correct
+3. Output ONLY valid JSON - no explanations, no markdown"""
+
+STUDY_PACK_USER = """Read this content and create a complete study pack based ONLY on the information given:
+
+CONTENT:
+{content}
+
+Create:
+- A summary with a 2-3 sentence overview, key points, important terms and main takeaways
+- {num_cards} flashcards
+- {num_questions} multiple-choice questions
+- {num_pairs} term-definition matching pairs
+
+Output ONLY this JSON:
+{{"summary": {{"title": "Summary", "overview": "Brief overview", "key_points": ["Key point"], "terms": [{{"term": "Term", "definition": "Meaning"}}], "takeaways": ["Takeaway"]}}, "flashcards": [{{"id": 1, "question": "Question?", "answer": "Answer"}}], "questions": [{{"id": 1, "question": "Question?", "options": [{{"label": "A", "text": "Option", "is_correct": false}}, ...], "explanation": "Why"}}], "pairs": [{{"id": 1, "term": "Term", "definition": "Definition"}}]}}
+options: labels A-D, exactly one with "is_correct": true"""
+
+# Appended to a generation prompt to replace near-duplicate items that were filtered out.
+TOP_UP_NOTE = """You already created the items below. Create exactly {num} NEW items in the same JSON format.
+None of them may repeat or rephrase these:
+{items}"""
+
+TOPIC_NOTE = """Only ask about this topic from the content: {topic}"""
+
+# Compact output formats: short keys and positional arrays, expanded locally by study_engine.wire.
+
+FLASHCARD_USER_COMPACT = """Read this content and create {num} flashcards based ONLY on the information given:
+
+CONTENT:
+{content}
+
+Create question-answer pairs that help memorize key facts from the above content.
+
+Output ONLY this compact JSON, one [question, answer] array per card:
+{{"t": "Flashcards", "c": [["Question from content?", "Answer from content"]]}}"""
+
+QUIZ_USER_COMPACT = """Read this content carefully and create {num} multiple-choice questions based ONLY on the information given:
+
+CONTENT:
+{content}
+
+Create questions that test understanding of the above content. Each question must have exactly 4 options with only ONE correct answer.
+
+Output ONLY this compact JSON, one [question, [4 options], index of the correct option 0-3, explanation] array per question:
+{{"t": "Quiz", "q": [["Question?", ["Option", "Option", "Option", "Option"], 1, "Why it is correct"]]}}"""
+
+MATCHING_USER_COMPACT = """Create {num} term-definition pairs from this content:
+
+{content}
+
+Output ONLY this compact JSON, one [term, definition] array per pair:
+{{"t": "Matching Game", "p": [["Term 1", "Definition 1"]]}}"""
+
+STUDY_GUIDE_USER_COMPACT = """Create a study guide from this content:
+
+{content}
+
+Subject: {subject}
+
+Output ONLY this compact JSON (s: 2-3 paragraph summary, o: [title, overview, [points]] per section, b: takeaways, k: [topic, high|medium|low], f: [fact, category]):
+{{"t": "Study Guide", "j": "{subject}", "s": "...", "o": [["Section", "Overview", ["Point"]]], "b": ["Takeaway"], "k": [["Topic", "high"]], "f": [["Fact", "Category"]]}}"""
+
+STUDY_GUIDE_OUTLINE_USER_COMPACT = """Create the outline of a study guide from this content:
+
+{content}
+
+Subject: {subject}
+
+Output ONLY this compact JSON (o: [title, overview, [points]] per section, k: [topic, high|medium|low]):
+{{"t": "Study Guide", "j": "{subject}", "o": [["Section", "Overview", ["Point"]]], "k": [["Topic", "high"]]}}"""
+
+STUDY_GUIDE_SUMMARY_USER_COMPACT = """Write the summary section of a study guide from this content:
+
+{content}
+
+Subject: {subject}
+Guide sections: {sections}
+
+Output ONLY this compact JSON (s: 2-3 paragraph summary):
+{{"s": "..."}}"""
+
+STUDY_GUIDE_TAKEAWAYS_USER_COMPACT = """Write the key takeaways of a study guide from this content:
+
+{content}
+
+Subject: {subject}
+Guide sections: {sections}
+
+Output ONLY this compact JSON (b: takeaways):
+{{"b": ["Takeaway"]}}"""
+
+STUDY_GUIDE_FACTS_USER_COMPACT = """List the important facts for a study guide from this content:
+
+{content}
+
+Subject: {subject}
+Guide sections: {sections}
+
+Output ONLY this compact JSON (f: [fact, category]):
+{{"f": [["Fact", "Category"]]}}"""
+
+EVAL_USER_COMPACT = """Evaluate this answer:
+
+Question: {question}
+Correct Answer: {correct}
+Student Answer: {user_answer}
+
+Output ONLY this compact JSON (c: is correct, s: score 0-1, f: feedback, g: suggestions):
+{{"c": true, "s": 0.85, "f": "Feedback text", "g": ["Suggestion"]}}"""
+
+SUMMARY_USER_COMPACT = """Summarize these study notes into a concise summary while preserving all key concepts:
+
+NOTES:
+{content}
+
+Create a summary with:
+- A brief overview (2-3 sentences)
+- Key points (bullet points)
+- Important terms and definitions
+- Main takeaways
+
+Output ONLY this compact JSON (o: overview, k: key points, d: [term, definition], w: takeaways):
+{{"t": "Summary", "o": "Brief overview", "k": ["Key point"], "d": [["Term", "Meaning"]], "w": ["Takeaway"]}}"""
+
+STUDY_PACK_USER_COMPACT = """Read this content and create a complete study pack based ONLY on the information given:
+
+CONTENT:
+{content}
+
+Create:
+- A summary with a 2-3 sentence overview, key points, important terms and main takeaways
+- {num_cards} flashcards
+- {num_questions} multiple-choice questions
+- {num_pairs} term-definition matching pairs
+
+Output ONLY this compact JSON (s: summary with o overview, k key points, d [term, definition], w takeaways; c: [question, answer]; q: [question, [4 options], index of the correct option 0-3, explanation]; p: [term, definition]):
+{{"s": {{"o": "Brief overview", "k": ["Key point"], "d": [["Term", "Meaning"]], "w": ["Takeaway"]}}, "c": [["Question?", "Answer"]], "q": [["Question?", ["Option", "Option", "Option", "Option"], 0, "Why"]], "p": [["Term", "Definition"]]}}"""
+
+USER_TEMPLATES = {
+    "flashcards": {"verbose": FLASHCARD_USER, "compact": FLASHCARD_USER_COMPACT},
+    "quiz": {"verbose": QUIZ_USER, "compact": QUIZ_USER_COMPACT},
+    "matching": {"verbose": MATCHING_USER, "compact": MATCHING_USER_COMPACT},
+    "study_guide": {"verbose": STUDY_GUIDE_USER, "compact": STUDY_GUIDE_USER_COMPACT},
+    "study_guide_outline": {"verbose": STUDY_GUIDE_OUTLINE_USER, "compact": STUDY_GUIDE_OUTLINE_USER_COMPACT},
+    "study_guide_summary": {"verbose": STUDY_GUIDE_SUMMARY_USER, "compact": STUDY_GUIDE_SUMMARY_USER_COMPACT},
+    "study_guide_takeaways": {"verbose": STUDY_GUIDE_TAKEAWAYS_USER, "compact": STUDY_GUIDE_TAKEAWAYS_USER_COMPACT},
+    "study_guide_facts": {"verbose": STUDY_GUIDE_FACTS_USER, "compact": STUDY_GUIDE_FACTS_USER_COMPACT},
+    "evaluation": {"verbose": EVAL_USER, "compact": EVAL_USER_COMPACT},
+    "summary": {"verbose": SUMMARY_USER, "compact": SUMMARY_USER_COMPACT},
+    "study_pack": {"verbose": STUDY_PACK_USER, "compact": STUDY_PACK_USER_COMPACT},
+}
+
+
+def format_user_prompt(feature: str, output_format: str = "", **fields) -> str:
+    """User prompt for a feature in the configured (or given) output format."""
+    return USER_TEMPLATES[feature][output_format or config.output_format()].format(**fields)
@@ -0,0 +1,325 @@
+"""
+OpenAI-compatible chat endpoints with circuit breaking and hedged requests.
+
+Endpoints are tried in the configured order. Each has a circuit breaker: after
+a few consecutive failures it is skipped for a cool-down, then a single probe
+request decides whether it is healthy again. When the primary fails, the
+request fails over to the next endpoint.
+
+With hedging on, a request whose primary has not streamed its first token
+within the primary's observed p90 time-to-first-token is also sent to the
+next endpoint, and whichever answer completes first wins; the other stream
+is closed. Every race is reported with the endpoint that won, so the hedge
+threshold can be tuned from data.
+"""
+
+import json
+import math
+import os
+import queue
+import threading
+import time
+import urllib.request
+from collections import deque
+
+from study_engine.routing import model_tiers
+
+GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+FIRST_TOKEN_PERCENTILE = 0.9
+MIN_HEDGE_SAMPLES = 5
+
+
+class ProviderError(RuntimeError):
+    pass
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class Endpoint:
+    """One OpenAI-compatible /chat/completions endpoint."""
+
+    def __init__(self, name: str, base_url: str, api_key: str = "", models: dict = None,
+                 timeout: float = 60.0, usage_in_stream: bool = True):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.models = models or {}
+        self.timeout = timeout
+        self.usage_in_stream = usage_in_stream
+
+    def model_for(self, tier: str) -> str:
+        return self.models.get(tier) or model_tiers()[tier]
+
+    def stream_chat(self, model: str, messages: list, first_token: threading.Event = None,
+                    cancelled: threading.Event = None) -> tuple:
+        """Stream one completion; returns (text, usage dict or None)."""
+        body = {"model": model, "messages": messages, "temperature": 0.5, "max_tokens": 4096, "stream": True}
+        if self.usage_in_stream:
+            body["stream_options"] = {"include_usage": True}
+        headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        request = urllib.request.Request(
+            f"{self.base_url}/chat/completions", data=json.dumps(body).encode(), headers=headers
+        )
+        parts = []
+        usage = None
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            for raw in response:
+                if cancelled is not None and cancelled.is_set():
+                    raise _Cancelled()
+                line = raw.decode("utf-8", errors="ignore").strip()
+                if not line.startswith("data:"):
+                    continue
+                payload = line[5:].strip()
+                if payload == "[DONE]":
+                    break
+                chunk = json.loads(payload)
+                usage = chunk.get("usage") or (chunk.get("x_groq") or {}).get("usage") or usage
+                for choice in chunk.get("choices") or []:
+                    piece = (choice.get("delta") or {}).get("content")
+                    if piece:
+                        if not parts and first_token is not None:
+                            first_token.set()
+                        parts.append(piece)
+        return "".join(parts), usage
+
+
+def load_endpoints() -> list:
+    """
+    Endpoints from AI_ENDPOINTS, a JSON list of objects with name, base_url,
+    api_key_env (or api_key), and optional models ({"small": ..., "large": ...})
+    and timeout. Without it, Groq is the only endpoint. Endpoints whose key
+    variable is unset are left out.
+    """
+    raw = os.getenv("AI_ENDPOINTS")
+    configs = json.loads(raw) if raw else [{"name": "groq", "base_url": GROQ_BASE_URL, "api_key_env": "GROQ_API_KEY"}]
+    endpoints = []
+    for config in configs:
+        key = os.getenv(config["api_key_env"], "") if config.get("api_key_env") else config.get("api_key", "")
+        if config.get("api_key_env") and not key:
+            continue
+        endpoints.append(Endpoint(
+            config["name"], config["base_url"], key, config.get("models"),
+            float(config.get("timeout", 60)), bool(config.get("usage_in_stream", True))
+        ))
+    return endpoints
+
+
+class CircuitBreaker:
+    """Closed until failure_threshold failures in a row, then open for open_seconds, then one probe."""
+
+    def __init__(self, failure_threshold: int = 3, open_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def state(self) -> str:
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if self.probing or time.monotonic() - self.opened_at >= self.open_seconds:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.probing or time.monotonic() - self.opened_at < self.open_seconds:
+                return False
+            self.probing = True
+            return True
+
+    def record(self, ok: bool):
+        with self._lock:
+            self.probing = False
+            if ok:
+                self.failures = 0
+                self.opened_at = None
+            else:
+                self.failures += 1
+                if self.failures >= self.failure_threshold or self.opened_at is not None:
+                    self.opened_at = time.monotonic()
+
+    def release(self):
+        """End a probe that was cancelled before it could tell anything."""
+        with self._lock:
+            self.probing = False
+
+
+class _FirstToken(threading.Event):
+    """Event that also remembers when it was set."""
+
+    at = None
+
+    def set(self):
+        self.at = time.monotonic()
+        super().set()
+
+
+class _Attempt:
+    def __init__(self, endpoint: Endpoint, model: str, hedge: bool):
+        self.endpoint = endpoint
+        self.model = model
+        self.hedge = hedge
+        self.started = time.monotonic()
+        self.first_token = _FirstToken()
+        self.cancelled = threading.Event()
+
+    def time_to_first_token(self) -> float:
+        """Seconds until the first token, or the time waited so far when none arrived."""
+        return (self.first_token.at or time.monotonic()) - self.started
+
+
+class ProviderPool:
+    """Ordered endpoints with failover, circuit breakers and optional hedging."""
+
+    def __init__(self, endpoints: list, hedge: bool = False, default_hedge_seconds: float = 3.0,
+                 failure_threshold: int = 3, open_seconds: float = 30.0, window: int = 200):
+        self.endpoints = endpoints
+        self.hedge = hedge
+        self.default_hedge_seconds = default_hedge_seconds
+        self.breakers = {e.name: CircuitBreaker(failure_threshold, open_seconds) for e in endpoints}
+        self._lock = threading.Lock()
+        self._first_tokens = {e.name: deque(maxlen=window) for e in endpoints}
+        self._counts = {e.name: {"requests": 0, "failures": 0, "wins": 0, "hedges": 0, "hedge_wins": 0}
+                        for e in endpoints}
+
+    def hedge_delay(self, endpoint: Endpoint) -> float:
+        """Seconds to wait for endpoint's first token before hedging: its observed p90."""
+        with self._lock:
+            samples = sorted(self._first_tokens[endpoint.name])
+        if len(samples) < MIN_HEDGE_SAMPLES:
+            return self.default_hedge_seconds
+        return samples[min(len(samples) - 1, math.ceil(FIRST_TOKEN_PERCENTILE * len(samples)) - 1)]
+
+    def _run(self, attempt: _Attempt, messages: list, done: queue.Queue):
+        breaker = self.breakers[attempt.endpoint.name]
+        try:
+            text, usage = attempt.endpoint.stream_chat(attempt.model, messages, attempt.first_token, attempt.cancelled)
+        except Exception as e:
+            if attempt.cancelled.is_set():
+                # A lost race still says how long this endpoint took to start answering (at least).
+                self._record_first_token(attempt)
+                breaker.release()
+                return
+            breaker.record(False)
+            with self._lock:
+                self._counts[attempt.endpoint.name]["failures"] += 1
+            done.put((attempt, None, None, e))
+            return
+        self._record_first_token(attempt)
+        breaker.record(True)
+        done.put((attempt, text, usage, None))
+
+    def _record_first_token(self, attempt: _Attempt):
+        with self._lock:
+            self._first_tokens[attempt.endpoint.name].append(attempt.time_to_first_token())
+
+    def complete(self, tier: str, messages: list) -> dict:
+        """
+        Run one chat completion across the endpoints.
+
+        Returns text, usage, and the race details: the endpoint and model that
+        answered, the primary endpoint, whether a hedge was sent, the hedge
+        delay used, the winner's time to first token and the total latency.
+        """
+        # Breakers are asked only right before an endpoint is launched: allow()
+        # claims the single probe of a half-open breaker, and a claim for an
+        # endpoint that never runs would keep it out of rotation for good.
+        candidates = list(self.endpoints)
+        done = queue.Queue()
+        attempts = []
+
+        def next_endpoint():
+            while candidates:
+                endpoint = candidates.pop(0)
+                if self.breakers[endpoint.name].allow():
+                    return endpoint
+            return None
+
+        def launch(endpoint: Endpoint, hedge: bool = False):
+            attempt = _Attempt(endpoint, endpoint.model_for(tier), hedge)
+            attempts.append(attempt)
+            with self._lock:
+                self._counts[endpoint.name]["requests"] += 1
+                if hedge:
+                    self._counts[endpoint.name]["hedges"] += 1
+            threading.Thread(target=self._run, args=(attempt, messages, done), daemon=True).start()
+
+        start = time.monotonic()
+        endpoint = next_endpoint()
+        if endpoint is None:
+            raise ProviderError("All AI providers are failing right now, please try again in a minute")
+        launch(endpoint)
+        primary = leader = attempts[0]
+        hedge_delay = self.hedge_delay(primary.endpoint) if self.hedge and candidates else None
+        hedged = False
+        running = 1
+        while True:
+            timeout = None
+            if hedge_delay is not None and not hedged and candidates and not leader.first_token.is_set():
+                timeout = max(0.0, hedge_delay - (time.monotonic() - leader.started))
+            try:
+                attempt, text, usage, error = done.get(timeout=timeout)
+            except queue.Empty:
+                endpoint = next_endpoint() if not leader.first_token.is_set() else None
+                if endpoint is not None:
+                    launch(endpoint, hedge=True)
+                    hedged = True
+                    running += 1
+                else:
+                    hedge_delay = None
+                continue
+            running -= 1
+            if error is None:
+                break
+            if running == 0:
+                endpoint = next_endpoint()
+                if endpoint is None:
+                    raise ProviderError(f"All AI providers failed; last error: {error}") from error
+                launch(endpoint)
+                leader = attempts[-1]
+                if hedge_delay is not None and not hedged:
+                    hedge_delay = self.hedge_delay(leader.endpoint) if candidates else None
+                running += 1
+
+        for other in attempts:
+            if other is not attempt:
+                other.cancelled.set()
+        latency = time.monotonic() - start
+        with self._lock:
+            counts = self._counts[attempt.endpoint.name]
+            counts["wins"] += 1
+            if attempt.hedge:
+                counts["hedge_wins"] += 1
+        return {
+            "text": text, "usage": usage, "endpoint": attempt.endpoint.name, "model": attempt.model,
+            "primary": primary.endpoint.name, "hedged": hedged, "hedge_delay": hedge_delay if hedged else None,
+            "first_token": attempt.time_to_first_token(), "latency": latency,
+        }
+
+    def snapshot(self) -> dict:
+        """Health and race counts per endpoint, for monitoring."""
+        result = {}
+        for endpoint in self.endpoints:
+            with self._lock:
+                counts = dict(self._counts[endpoint.name])
+            counts["state"] = self.breakers[endpoint.name].state()
+            counts["hedge_after"] = self.hedge_delay(endpoint)
+            result[endpoint.name] = counts
+        return result
+
+
+def default_pool() -> ProviderPool:
+    """Pool of the configured endpoints; HEDGE_REQUESTS=1 turns hedging on."""
+    return ProviderPool(
+        load_endpoints(), hedge=os.getenv("HEDGE_REQUESTS") == "1",
+        default_hedge_seconds=float(os.getenv("HEDGE_DEFAULT_SECONDS", "3")),
+    )
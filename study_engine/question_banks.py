@@ -0,0 +1,614 @@
+"""
+Persistent question banks with streaming CSV / JSON / GIFT import, and
+banks of generated questions per source document.
+
+Imports are parsed as a stream and validated row by row into the quiz
+question schema, then written in batched transactions. Each bank numbers its
+questions with contiguous positions, so a random sample is a handful of
+primary-key lookups instead of a scan of the whole bank.
+
+Generated quiz questions are kept the same way under the fingerprint of the
+document they came from and an optional topic. Each user's seen questions
+are recorded, so a later quiz on the same document can be served from
+questions that user has not had yet.
+"""
+
+import csv
+import json
+import random
+import re
+import threading
+
+from study_engine.attempts import question_key
+from study_engine.database import connect, location
+from study_engine.schemas import OPTION_LABELS, validate_question
+
+BATCH_SIZE = 200
+MAX_REPORTED_ERRORS = 100
+SAMPLE_ROUNDS = 4
+IMPORT_FORMATS = {"csv": "CSV", "json": "JSON", "jsonl": "JSON", "gift": "GIFT", "txt": "GIFT"}
+
+
+def _question_from_mapping(item: dict, number: int) -> dict:
+    """Accept the quiz schema or the simpler {"options": [...], "answer": "B"} form."""
+    if not isinstance(item, dict):
+        raise ValueError("Expected an object")
+    options = item.get("options")
+    answer = item.get("answer", item.get("correct"))
+    if isinstance(options, list) and options and not isinstance(options[0], dict):
+        answer = str(answer or "").strip().upper()
+        if answer.isdigit():
+            answer = OPTION_LABELS[int(answer) - 1] if 1 <= int(answer) <= len(OPTION_LABELS) else ""
+        options = [
+            {"text": text, "is_correct": label == answer}
+            for label, text in zip(OPTION_LABELS, options)
+        ]
+    return validate_question(dict(item, options=options), number)
+
+
+def parse_csv(lines):
+    """
+    Yield (row_number, question or error) from CSV lines.
+
+    Expected columns: question, a, b, c, d, correct, explanation. Options C
+    and D are optional; correct is a letter.
+    """
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None:
+        return
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    for row_number, row in enumerate(reader, 2):
+        try:
+            options = [row.get(label.lower()) or "" for label in OPTION_LABELS]
+            while options and not options[-1].strip():
+                options.pop()
+            item = {
+                "question": (row.get("question") or "").strip(),
+                "options": options,
+                "answer": row.get("correct") or "",
+                "explanation": row.get("explanation") or "",
+            }
+            yield row_number, _question_from_mapping(item, row_number)
+        except ValueError as e:
+            yield row_number, e
+
+
+def _json_array_items(lines):
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    for line in lines:
+        buffer += line
+        while True:
+            buffer = buffer.lstrip()
+            if not started:
+                if not buffer:
+                    break
+                buffer = buffer[1:]
+                started = True
+                continue
+            buffer = buffer.lstrip(", \t\r\n")
+            if not buffer or buffer.startswith("]"):
+                break
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                break
+            buffer = buffer[end:]
+            yield item
+    if buffer.strip() not in ("", "]"):
+        raise ValueError("Unexpected data at the end of the JSON array")
+
+
+def parse_json(lines):
+    """
+    Yield (item_number, question or error) from a JSON array or JSON Lines.
+
+    The array is decoded one element at a time, so the whole file is never
+    held as a single Python object.
+    """
+    lines = iter(lines)
+    first = ""
+    for first in lines:
+        if first.strip():
+            break
+    if first.lstrip().startswith("["):
+        items = _json_array_items(_chain(first, lines))
+        number = 0
+        try:
+            for number, item in enumerate(items, 1):
+                try:
+                    yield number, _question_from_mapping(item, number)
+                except ValueError as e:
+                    yield number, e
+        except ValueError as e:
+            yield number + 1, e
+        return
+    for number, line in enumerate(_chain(first, lines), 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, _question_from_mapping(json.loads(line), number)
+        except (ValueError, TypeError) as e:
+            yield number, ValueError(str(e))
+
+
+def _chain(first, rest):
+    if first:
+        yield first
+    yield from rest
+
+
+_GIFT_ESCAPE = re.compile(r'\\([~=#{}:])')
+
+
+def _gift_question(block: str, number: int) -> dict:
+    block = re.sub(r'^::.*?::', '', block.strip(), flags=re.DOTALL).strip()
+    match = re.match(r'(?s)(.*?)(?<!\\)\{(.*?)(?<!\\)\}(.*)', block)
+    if not match:
+        raise ValueError("Missing {answers} block")
+    question = _GIFT_ESCAPE.sub(r'\1', (match.group(1) + " " + match.group(3)).strip())
+    answers = match.group(2).strip()
+    if answers.upper() in ("T", "TRUE", "F", "FALSE"):
+        truth = answers.upper().startswith("T")
+        return validate_question({
+            "question": question,
+            "options": [{"text": "True", "is_correct": truth}, {"text": "False", "is_correct": not truth}],
+        }, number)
+    options = []
+    explanation = ""
+    for marker, text in re.findall(r'(?<!\\)([=~])((?:\\.|[^=~\\])*)', answers):
+        text, *feedback = re.split(r'(?<!\\)#', text, maxsplit=1)
+        feedback = feedback[0] if feedback else ""
+        if marker == "=" and feedback and not explanation:
+            explanation = _GIFT_ESCAPE.sub(r'\1', feedback.strip())
+        options.append({"text": _GIFT_ESCAPE.sub(r'\1', text.strip()), "is_correct": marker == "="})
+    if not options:
+        raise ValueError("Only multiple-choice and true/false GIFT questions are supported")
+    return validate_question({"question": question, "options": options, "explanation": explanation}, number)
+
+
+def parse_gift(lines):
+    """Yield (question_number, question or error) from Moodle GIFT text."""
+    block = []
+    number = 0
+    for line in _chain("", lines):
+        stripped = line.strip()
+        if stripped.startswith("//") or stripped.startswith("$CATEGORY"):
+            continue
+        if stripped:
+            block.append(line)
+            continue
+        if block:
+            number += 1
+            try:
+                yield number, _gift_question("".join(block), number)
+            except ValueError as e:
+                yield number, e
+            block = []
+    if block:
+        number += 1
+        try:
+            yield number, _gift_question("".join(block), number)
+        except ValueError as e:
+            yield number, e
+
+
+PARSERS = {"CSV": parse_csv, "JSON": parse_json, "GIFT": parse_gift}
+
+
+class ImportFailed(RuntimeError):
+    pass
+
+
+class QuestionBankStore:
+    """SQLite-backed question banks that can be sampled without loading them."""
+
+    def __init__(self, db_path):
+        self.db_path = location(db_path)
+        self._lock = threading.Lock()
+        self._init_tables()
+
+    def _connect(self):
+        return connect(self.db_path)
+
+    def _init_tables(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS question_banks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                owner TEXT NOT NULL,
+                name TEXT NOT NULL,
+                question_count INTEGER NOT NULL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_question_banks_owner ON question_banks (owner)')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS bank_questions (
+                bank_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                question TEXT NOT NULL,
+                options TEXT NOT NULL,
+                explanation TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (bank_id, position)
+            ) WITHOUT ROWID
+        ''')
+        conn.commit()
+        conn.close()
+
+    def create_bank(self, owner: str, name: str) -> int:
+        conn = self._connect()
+        cursor = conn.execute('INSERT INTO question_banks (owner, name) VALUES (?, ?)', (owner, name))
+        conn.commit()
+        conn.close()
+        return cursor.lastrowid
+
+    def list_banks(self, owner: str) -> list:
+        """Return (id, name, question_count) for the owner's non-empty banks."""
+        conn = self._connect()
+        rows = conn.execute(
+            'SELECT id, name, question_count FROM question_banks '
+            'WHERE owner = ? AND question_count > 0 ORDER BY created_at DESC',
+            (owner,)
+        ).fetchall()
+        conn.close()
+        return rows
+
+    def delete_bank(self, bank_id: int):
+        conn = self._connect()
+        conn.execute('DELETE FROM bank_questions WHERE bank_id = ?', (bank_id,))
+        conn.execute('DELETE FROM question_banks WHERE id = ?', (bank_id,))
+        conn.commit()
+        conn.close()
+
+    def add_questions(self, bank_id: int, questions: list):
+        """
+        Append validated questions to a bank in one transaction. The write lock
+        is taken before the count is read, so processes sharing the database
+        cannot claim the same positions.
+        """
+        if not questions:
+            return
+        with self._lock:
+            conn = connect(self.db_path, isolation_level=None)
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                start = conn.execute(
+                    'SELECT question_count FROM question_banks WHERE id = ?', (bank_id,)
+                ).fetchone()[0]
+                conn.executemany(
+                    'INSERT INTO bank_questions (bank_id, position, question, options, explanation) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    [
+                        (bank_id, start + i, q["question"], json.dumps(q["options"]), q["explanation"])
+                        for i, q in enumerate(questions)
+                    ]
+                )
+                conn.execute(
+                    'UPDATE question_banks SET question_count = question_count + ? WHERE id = ?',
+                    (len(questions), bank_id)
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            finally:
+                conn.close()
+
+    def import_stream(self, bank_id: int, lines, fmt: str, batch_size: int = BATCH_SIZE) -> tuple:
+        """
+        Parse lines in the given format into the bank.
+
+        Returns (imported_count, errors) where errors is a list of
+        (row, message) pairs, capped at MAX_REPORTED_ERRORS. Batches are
+        committed as they are parsed, so the database is not locked for the
+        whole file. If the file itself cannot be read (e.g. malformed CSV), the
+        questions this import added are removed again and ImportFailed is
+        raised.
+        """
+        start = self._question_count(bank_id)
+        imported = 0
+        errors = []
+        batch = []
+        try:
+            for row, parsed in PARSERS[fmt](lines):
+                if isinstance(parsed, Exception):
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append((row, str(parsed)))
+                    continue
+                batch.append(parsed)
+                if len(batch) >= batch_size:
+                    self.add_questions(bank_id, batch)
+                    imported += len(batch)
+                    batch = []
+        except (csv.Error, ValueError) as e:
+            self._truncate(bank_id, start)
+            raise ImportFailed(f"The file could not be read: {e}") from e
+        self.add_questions(bank_id, batch)
+        imported += len(batch)
+        return imported, errors
+
+    def _question_count(self, bank_id: int) -> int:
+        conn = self._connect()
+        row = conn.execute('SELECT question_count FROM question_banks WHERE id = ?', (bank_id,)).fetchone()
+        conn.close()
+        return row[0] if row else 0
+
+    def _truncate(self, bank_id: int, count: int):
+        """Drop a bank's questions from position count on."""
+        with self._lock:
+            conn = connect(self.db_path, isolation_level=None)
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.execute('DELETE FROM bank_questions WHERE bank_id = ? AND position >= ?', (bank_id, count))
+                conn.execute('UPDATE question_banks SET question_count = ? WHERE id = ?', (count, bank_id))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            finally:
+                conn.close()
+
+    def sample(self, bank_id: int, n: int) -> list:
+        """Return up to n random questions from a bank, numbered from 1."""
+        conn = self._connect()
+        row = conn.execute('SELECT question_count FROM question_banks WHERE id = ?', (bank_id,)).fetchone()
+        count = row[0] if row else 0
+        positions = random.sample(range(count), min(n, count))
+        rows = []
+        for i in range(0, len(positions), 500):
+            chunk = positions[i:i + 500]
+            rows += conn.execute(
+                f'SELECT question, options, explanation FROM bank_questions '
+                f'WHERE bank_id = ? AND position IN ({",".join("?" * len(chunk))})',
+                (bank_id, *chunk)
+            ).fetchall()
+        conn.close()
+        random.shuffle(rows)
+        return [
+            {"id": i, "question": q, "options": json.loads(options), "explanation": explanation}
+            for i, (q, options, explanation) in enumerate(rows, 1)
+        ]
+
+    def bank_name(self, bank_id: int, owner: str) -> str:
+        """The bank's name if owner owns it, else None."""
+        conn = self._connect()
+        row = conn.execute('SELECT name FROM question_banks WHERE id = ? AND owner = ?', (bank_id, owner)).fetchone()
+        conn.close()
+        return row[0] if row else None
+
+    def iter_questions(self, bank_id: int, batch_size: int = BATCH_SIZE):
+        """Yield a bank's questions in order, reading batch_size rows per query."""
+        position = -1
+        while True:
+            conn = self._connect()
+            rows = conn.execute(
+                'SELECT position, question, options, explanation FROM bank_questions '
+                'WHERE bank_id = ? AND position > ? ORDER BY position LIMIT ?',
+                (bank_id, position, batch_size)
+            ).fetchall()
+            conn.close()
+            for position, q, options, explanation in rows:
+                yield {"id": position + 1, "question": q, "options": json.loads(options), "explanation": explanation}
+            if len(rows) < batch_size:
+                return
+
+    def iter_library(self, owner: str, batch_size: int = BATCH_SIZE):
+        """Yield every question in owner's banks, each tagged with its bank's name as "deck"."""
+        for bank_id, name, _ in self.list_banks(owner):
+            for question in self.iter_questions(bank_id, batch_size):
+                question["deck"] = name
+                yield question
+
+
+def topic_key(topic: str) -> str:
+    """Case- and whitespace-insensitive key for a quiz topic; "" is the whole document."""
+    return " ".join((topic or "").lower().split())
+
+
+class DocumentQuestionBank:
+    """Generated questions per (document fingerprint, topic), with the positions each user has seen."""
+
+    def __init__(self, db_path):
+        self.db_path = location(db_path)
+        self._lock = threading.Lock()
+        self._init_tables()
+
+    def _connect(self):
+        return connect(self.db_path)
+
+    def _init_tables(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS document_banks (
+                document TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                title TEXT NOT NULL,
+                question_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (document, topic)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS document_questions (
+                document TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                question_key TEXT NOT NULL,
+                question TEXT NOT NULL,
+                options TEXT NOT NULL,
+                explanation TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (document, topic, position)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute(
+            'CREATE UNIQUE INDEX IF NOT EXISTS idx_document_questions_key '
+            'ON document_questions (document, topic, question_key)'
+        )
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS seen_questions (
+                owner TEXT NOT NULL,
+                document TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                PRIMARY KEY (owner, document, topic, position)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS seen_counts (
+                owner TEXT NOT NULL,
+                document TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                seen INTEGER NOT NULL,
+                PRIMARY KEY (owner, document, topic)
+            ) WITHOUT ROWID
+        ''')
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _count(conn, document: str, topic: str) -> tuple:
+        row = conn.execute(
+            'SELECT question_count, title FROM document_banks WHERE document = ? AND topic = ?', (document, topic)
+        ).fetchone()
+        return row if row else (0, "")
+
+    def coverage(self, owner: str, document: str, topic: str = "") -> tuple:
+        """(questions in the bank, questions owner has seen) for a document and topic."""
+        topic = topic_key(topic)
+        conn = self._connect()
+        count, _ = self._count(conn, document, topic)
+        row = conn.execute(
+            'SELECT seen FROM seen_counts WHERE owner = ? AND document = ? AND topic = ?', (owner, document, topic)
+        ).fetchone()
+        conn.close()
+        return count, row[0] if row else 0
+
+    def title(self, document: str, topic: str = "") -> str:
+        conn = self._connect()
+        _, title = self._count(conn, document, topic_key(topic))
+        conn.close()
+        return title
+
+    def add(self, document: str, topic: str, title: str, questions: list) -> list:
+        """
+        Append validated questions; ones already banked under the same text are
+        not added again. Returns the position of every given question.
+        """
+        topic = topic_key(topic)
+        positions = []
+        with self._lock:
+            conn = connect(self.db_path, isolation_level=None)
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.execute(
+                    'INSERT OR IGNORE INTO document_banks (document, topic, title) VALUES (?, ?, ?)',
+                    (document, topic, title)
+                )
+                count, _ = self._count(conn, document, topic)
+                for q in questions:
+                    key = question_key(q["question"])
+                    row = conn.execute(
+                        'SELECT position FROM document_questions WHERE document = ? AND topic = ? AND question_key = ?',
+                        (document, topic, key)
+                    ).fetchone()
+                    if row:
+                        positions.append(row[0])
+                        continue
+                    conn.execute(
+                        'INSERT INTO document_questions (document, topic, position, question_key, question, options, '
+                        'explanation) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (document, topic, count, key, q["question"], json.dumps(q["options"]), q.get("explanation", ""))
+                    )
+                    positions.append(count)
+                    count += 1
+                conn.execute(
+                    'UPDATE document_banks SET question_count = ? WHERE document = ? AND topic = ?',
+                    (count, document, topic)
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            finally:
+                conn.close()
+        return positions
+
+    def mark_seen(self, owner: str, document: str, topic: str, positions: list):
+        topic = topic_key(topic)
+        if not positions:
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                before = conn.total_changes
+                conn.executemany(
+                    'INSERT OR IGNORE INTO seen_questions (owner, document, topic, position) VALUES (?, ?, ?, ?)',
+                    [(owner, document, topic, p) for p in set(positions)]
+                )
+                added = conn.total_changes - before
+                if added:
+                    conn.execute('''
+                        INSERT INTO seen_counts (owner, document, topic, seen) VALUES (?, ?, ?, ?)
+                        ON CONFLICT (owner, document, topic) DO UPDATE SET seen = seen + excluded.seen
+                    ''', (owner, document, topic, added))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _unseen_positions(self, conn, owner: str, document: str, topic: str, n: int, count: int, seen: int) -> list:
+        found = []
+        if seen * 2 <= count:
+            # Mostly unseen: draw random positions and drop the seen ones with a primary-key lookup.
+            tried = set()
+            for _ in range(SAMPLE_ROUNDS):
+                need = n - len(found)
+                if need <= 0 or len(tried) >= count:
+                    break
+                draw = random.sample(range(count), min(count, 2 * need + len(tried)))
+                batch = [p for p in draw if p not in tried][:2 * need]
+                tried.update(batch)
+                seen_now = {row[0] for row in conn.execute(
+                    f'SELECT position FROM seen_questions WHERE owner = ? AND document = ? AND topic = ? '
+                    f'AND position IN ({",".join("?" * len(batch))})',
+                    (owner, document, topic, *batch)
+                )}
+                found += [p for p in batch if p not in seen_now][:need]
+        if len(found) < n:
+            # Mostly seen: let the index walk the bank's positions and skip the seen ones.
+            rows = conn.execute(
+                f'SELECT q.position FROM document_questions q WHERE q.document = ? AND q.topic = ? '
+                f'AND q.position NOT IN ({",".join("?" * len(found))}) '
+                f'AND NOT EXISTS (SELECT 1 FROM seen_questions s WHERE s.owner = ? AND s.document = q.document '
+                f'AND s.topic = q.topic AND s.position = q.position) ORDER BY random() LIMIT ?',
+                (document, topic, *found, owner, n - len(found))
+            ).fetchall()
+            found += [row[0] for row in rows]
+        return found
+
+    def sample_unseen(self, owner: str, document: str, topic: str, n: int) -> list:
+        """Up to n random (position, question) pairs from the bank that owner has not seen yet."""
+        topic = topic_key(topic)
+        conn = self._connect()
+        count, _ = self._count(conn, document, topic)
+        if not count:
+            conn.close()
+            return []
+        row = conn.execute(
+            'SELECT seen FROM seen_counts WHERE owner = ? AND document = ? AND topic = ?', (owner, document, topic)
+        ).fetchone()
+        positions = self._unseen_positions(conn, owner, document, topic, n, count, row[0] if row else 0)
+        rows = []
+        for i in range(0, len(positions), 500):
+            chunk = positions[i:i + 500]
+            rows += conn.execute(
+                f'SELECT position, question, options, explanation FROM document_questions '
+                f'WHERE document = ? AND topic = ? AND position IN ({",".join("?" * len(chunk))})',
+                (document, topic, *chunk)
+            ).fetchall()
+        conn.close()
+        random.shuffle(rows)
+        return [
+            (position, {"question": q, "options": json.loads(options), "explanation": explanation})
+            for position, q, options, explanation in rows
+        ]
@@ -0,0 +1,37 @@
+"""
+Token-bucket rate limiting shared through the key-value store.
+
+Every replica draws from the same bucket, so the deployment as a whole stays
+within the upstream API's request limit.
+"""
+
+import time
+
+from study_engine.kvstore import KeyValueStore
+
+
+class RateLimitExceeded(RuntimeError):
+    pass
+
+
+class RateLimiter:
+    """Allow at most per_minute calls per minute, with bursts up to burst; 0 means unlimited."""
+
+    def __init__(self, store: KeyValueStore, name: str, per_minute: float, burst: float = None):
+        self.store = store
+        self.key = f"ratelimit:{name}"
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst is not None else max(1.0, per_minute / 6.0)
+
+    def acquire(self, timeout: float = 60.0):
+        """Block until a call is allowed, or raise RateLimitExceeded after timeout."""
+        if self.rate <= 0:
+            return
+        deadline = time.monotonic() + timeout
+        while True:
+            wait = self.store.take_tokens(self.key, self.rate, self.capacity)
+            if wait <= 0:
+                return
+            if time.monotonic() + wait > deadline:
+                raise RateLimitExceeded("Too many requests right now, please try again in a moment")
+            time.sleep(wait)
@@ -0,0 +1,130 @@
+"""
+Local BM25 retrieval over paragraph chunks of uploaded study material.
+
+Long notes are split into paragraph-sized chunks and only the passages most
+relevant to the request are sent to the model, within a token budget.
+"""
+
+import math
+import re
+from collections import Counter
+
+K1 = 1.5
+B = 0.75
+CHARS_PER_TOKEN = 4
+MAX_CHUNK_CHARS = 1200
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "can", "for", "from",
+    "has", "have", "he", "her", "his", "how", "i", "if", "in", "into", "is", "it",
+    "its", "not", "of", "on", "or", "our", "she", "so", "that", "the", "their",
+    "them", "then", "there", "these", "they", "this", "to", "was", "we", "were",
+    "what", "when", "which", "who", "will", "with", "you", "your",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+def tokenize(text: str) -> list:
+    """Lowercase word tokens without stopwords."""
+    return [w for w in re.findall(r'[a-z0-9]+', text.lower()) if w not in STOPWORDS and len(w) > 1]
+
+
+def chunk_paragraphs(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list:
+    """Split text into paragraph chunks no longer than max_chars."""
+    chunks = []
+    for para in re.split(r'\n\s*\n', text):
+        para = para.strip()
+        if not para:
+            continue
+        if len(para) <= max_chars:
+            chunks.append(para)
+            continue
+        current = ""
+        for sentence in re.split(r'(?<=[.!?])\s+|\n', para):
+            if current and len(current) + len(sentence) + 1 > max_chars:
+                chunks.append(current)
+                current = ""
+            while len(sentence) > max_chars:
+                chunks.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            current = f"{current} {sentence}".strip()
+        if current:
+            chunks.append(current)
+    return chunks
+
+
+class BM25Index:
+    """Okapi BM25 index over a list of text chunks."""
+
+    def __init__(self, chunks: list):
+        self.chunks = chunks
+        self.term_freqs = [Counter(tokenize(chunk)) for chunk in chunks]
+        self.lengths = [sum(tf.values()) for tf in self.term_freqs]
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0
+        doc_freq = Counter()
+        for tf in self.term_freqs:
+            doc_freq.update(tf.keys())
+        n = len(chunks)
+        self.idf = {term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+
+    def scores(self, query_terms: list) -> list:
+        """BM25 score of every chunk for the query terms."""
+        results = []
+        for tf, length in zip(self.term_freqs, self.lengths):
+            norm = K1 * (1 - B + B * length / self.avg_length) if self.avg_length else K1
+            score = 0.0
+            for term in query_terms:
+                freq = tf.get(term)
+                if freq:
+                    score += self.idf[term] * freq * (K1 + 1) / (freq + norm)
+            results.append(score)
+        return results
+
+    def salient_terms(self, n: int = 20) -> list:
+        """Terms with the highest overall TF-IDF weight, used when there is no query."""
+        weights = Counter()
+        for tf in self.term_freqs:
+            for term, freq in tf.items():
+                weights[term] += freq * self.idf[term]
+        return [term for term, _ in weights.most_common(n)]
+
+
+def select_chunks(chunks: list, query: str = "", token_budget: int = 2500) -> list:
+    """
+    Indices of the chunks most relevant to the query that fit in token_budget,
+    in document order. Query terms are weighted above the chunks' most
+    salient terms, which keep the selection on its main themes when there is
+    no query.
+    """
+    index = BM25Index(chunks)
+    terms = tokenize(query) * 3 + index.salient_terms()
+    scores = index.scores(terms)
+    ranked = sorted(range(len(chunks)), key=lambda i: scores[i], reverse=True)
+    chosen = []
+    used = 0
+    for i in ranked:
+        cost = estimate_tokens(chunks[i])
+        if used + cost > token_budget:
+            continue
+        chosen.append(i)
+        used += cost
+    return sorted(chosen)
+
+
+def select_passages(content: str, query: str = "", token_budget: int = 2500) -> tuple:
+    """
+    Pick the paragraph chunks most relevant to the query that fit in
+    token_budget (see select_chunks). Selected passages keep their original
+    order. Returns (text, selected, total).
+    """
+    if estimate_tokens(content) <= token_budget:
+        return content, 1, 1
+    chunks = chunk_paragraphs(content)
+    chosen = select_chunks(chunks, query, token_budget)
+    if not chosen:
+        return content[:token_budget * CHARS_PER_TOKEN], 1, len(chunks)
+    return "\n\n".join(chunks[i] for i in chosen), len(chosen), len(chunks)
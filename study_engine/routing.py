@@ -0,0 +1,159 @@
+"""
+Latency-aware routing of generation requests to model tiers.
+
+Each feature maps to a tier by input size: short, simple tasks go to a small
+instant model and long or structured ones to the large model. Latency, error
+and parse-failure rates are tracked per model over a rolling window. When a
+tier degrades, its routes move to the other tier for a cool-down period and
+then return, with fresh statistics, to be judged again.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+
+from study_engine.config import load_env
+
+DEFAULT_MODELS = {"small": "llama-3.1-8b-instant", "large": "llama-3.3-70b-versatile"}
+TIER_VARIABLES = {"small": "GROQ_SMALL_MODEL", "large": "GROQ_LARGE_MODEL"}
+FALLBACK_TIER = {"small": "large", "large": "small"}
+
+# Per feature: (max input tokens, tier) pairs tried in order; None means no limit.
+ROUTES = {
+    "evaluation": [(2000, "small"), (None, "large")],
+    "matching": [(3000, "small"), (None, "large")],
+    "flashcards": [(1500, "small"), (None, "large")],
+    "summary": [(1500, "small"), (None, "large")],
+    "quiz": [(None, "large")],
+    "study_guide": [(None, "large")],
+    "study_guide_outline": [(None, "large")],
+    "study_guide_summary": [(1500, "small"), (None, "large")],
+    "study_guide_takeaways": [(1500, "small"), (None, "large")],
+    "study_guide_facts": [(1500, "small"), (None, "large")],
+    "study_pack": [(None, "large")],
+}
+DEFAULT_TIER = "large"
+
+# p95 latency in seconds above which a tier counts as degraded
+LATENCY_SLO = {"small": 8.0, "large": 30.0}
+MAX_ERROR_RATE = 0.3
+MAX_PARSE_FAILURE_RATE = 0.3
+
+
+def model_tiers() -> dict:
+    """
+    Model per tier, read on every call so overrides in .env apply even
+    though it is loaded after this module is imported.
+    """
+    load_env()
+    return {tier: os.getenv(variable, DEFAULT_MODELS[tier]) for tier, variable in TIER_VARIABLES.items()}
+
+
+def tier_of(model: str, default: str = None) -> str:
+    """The tier a model is configured for, or default."""
+    return next((t for t, m in model_tiers().items() if m == model), default)
+
+
+class ModelStats:
+    """Rolling latency, error and parse-failure samples for one model."""
+
+    def __init__(self, window_seconds: float, max_samples: int = 200):
+        self.window_seconds = window_seconds
+        self.requests = deque(maxlen=max_samples)
+        self.parses = deque(maxlen=max_samples)
+
+    def _trim(self, now: float):
+        for samples in (self.requests, self.parses):
+            while samples and samples[0][0] < now - self.window_seconds:
+                samples.popleft()
+
+    def record_request(self, latency: float, ok: bool):
+        self.requests.append((time.monotonic(), latency, ok))
+
+    def record_parse(self, ok: bool):
+        self.parses.append((time.monotonic(), ok))
+
+    def clear(self):
+        self.requests.clear()
+        self.parses.clear()
+
+    def summary(self) -> dict:
+        self._trim(time.monotonic())
+        latencies = sorted(latency for _, latency, ok in self.requests if ok)
+        p95 = latencies[min(len(latencies) - 1, math.ceil(0.95 * len(latencies)) - 1)] if latencies else 0.0
+        errors = sum(1 for _, _, ok in self.requests if not ok)
+        parse_failures = sum(1 for _, ok in self.parses if not ok)
+        return {
+            "requests": len(self.requests),
+            "p95_latency": p95,
+            "error_rate": errors / len(self.requests) if self.requests else 0.0,
+            "parse_failure_rate": parse_failures / len(self.parses) if self.parses else 0.0,
+        }
+
+
+class ModelRouter:
+    """Pick a model per request and reroute away from degraded tiers."""
+
+    def __init__(self, window_seconds: float = 300.0, cooldown_seconds: float = 120.0, min_samples: int = 5):
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._stats = {model: ModelStats(window_seconds) for model in model_tiers().values()}
+        self._rerouted_until = {}
+
+    def preferred_tier(self, feature: str, input_tokens: int) -> str:
+        for limit, tier in ROUTES.get(feature, []):
+            if limit is None or input_tokens <= limit:
+                return tier
+        return DEFAULT_TIER
+
+    def choose(self, feature: str, input_tokens: int) -> str:
+        """Model for a request, moving to the other tier while the preferred one is degraded."""
+        tier = self.preferred_tier(feature, input_tokens)
+        with self._lock:
+            now = time.monotonic()
+            if self._rerouted_until.get(tier, 0) > now:
+                fallback = FALLBACK_TIER[tier]
+                if self._rerouted_until.get(fallback, 0) <= now:
+                    tier = fallback
+        return model_tiers()[tier]
+
+    def record_request(self, model: str, latency: float, ok: bool):
+        with self._lock:
+            self._stats.setdefault(model, ModelStats(self.window_seconds)).record_request(latency, ok)
+            self._check(model)
+
+    def record_parse(self, model: str, ok: bool):
+        with self._lock:
+            self._stats.setdefault(model, ModelStats(self.window_seconds)).record_parse(ok)
+            self._check(model)
+
+    def _check(self, model: str):
+        tier = tier_of(model)
+        if tier is None:
+            return
+        stats = self._stats[model]
+        summary = stats.summary()
+        if summary["requests"] < self.min_samples:
+            return
+        if (summary["error_rate"] > MAX_ERROR_RATE
+                or summary["parse_failure_rate"] > MAX_PARSE_FAILURE_RATE
+                or summary["p95_latency"] > LATENCY_SLO[tier]):
+            # Start over after the cool-down so old samples cannot keep the tier out.
+            self._rerouted_until[tier] = time.monotonic() + self.cooldown_seconds
+            stats.clear()
+
+    def snapshot(self) -> dict:
+        """Current statistics per model, for monitoring."""
+        with self._lock:
+            now = time.monotonic()
+            result = {}
+            for tier, model in model_tiers().items():
+                summary = self._stats.setdefault(model, ModelStats(self.window_seconds)).summary()
+                summary["tier"] = tier
+                summary["rerouted_for"] = max(0.0, self._rerouted_until.get(tier, 0) - now)
+                result[model] = summary
+            return result
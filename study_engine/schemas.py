@@ -0,0 +1,120 @@
+"""
+Validation for the JSON structures the pages render.
+
+Each validator accepts loosely shaped model output, checks the fields the
+rendering code relies on and returns a normalized copy. Invalid input raises
+ValueError with a message that can be shown to the user.
+"""
+
+OPTION_LABELS = ["A", "B", "C", "D"]
+
+
+def _items(data, key: str) -> list:
+    items = data.get(key) if isinstance(data, dict) else data
+    if not isinstance(items, list) or not items:
+        raise ValueError(f"No {key} found in response")
+    return items
+
+
+def _title(data, default: str) -> str:
+    return str(data.get("title") or default) if isinstance(data, dict) else default
+
+
+def validate_flashcard(card, number: int) -> dict:
+    if not isinstance(card, dict) or not card.get("question") or not card.get("answer"):
+        raise ValueError(f"Flashcard {number} needs a question and an answer")
+    return {"id": number, "question": str(card["question"]), "answer": str(card["answer"])}
+
+
+def validate_flashcards(data) -> dict:
+    cards = _items(data, "flashcards")
+    return {
+        "title": _title(data, "Flashcards"),
+        "flashcards": [validate_flashcard(card, i) for i, card in enumerate(cards, 1)],
+    }
+
+
+def validate_question(question, number: int) -> dict:
+    if not isinstance(question, dict) or not question.get("question"):
+        raise ValueError(f"Question {number} has no question text")
+    options = question.get("options")
+    if not isinstance(options, list) or not 2 <= len(options) <= len(OPTION_LABELS):
+        raise ValueError(f"Question {number} needs between 2 and {len(OPTION_LABELS)} options")
+    normalized = []
+    for label, option in zip(OPTION_LABELS, options):
+        if not isinstance(option, dict) or not str(option.get("text", "")).strip():
+            raise ValueError(f"Question {number} option {label} has no text")
+        normalized.append({"label": label, "text": str(option["text"]), "is_correct": bool(option.get("is_correct"))})
+    if sum(o["is_correct"] for o in normalized) != 1:
+        raise ValueError(f"Question {number} must have exactly one correct option")
+    return {
+        "id": number,
+        "question": str(question["question"]),
+        "options": normalized,
+        "explanation": str(question.get("explanation") or ""),
+    }
+
+
+def validate_quiz(data) -> dict:
+    questions = _items(data, "questions")
+    return {
+        "title": _title(data, "Quiz"),
+        "questions": [validate_question(q, i) for i, q in enumerate(questions, 1)],
+    }
+
+
+def validate_matching(data) -> dict:
+    pairs = _items(data, "pairs")
+    normalized = []
+    for i, pair in enumerate(pairs, 1):
+        if not isinstance(pair, dict) or not pair.get("term") or not pair.get("definition"):
+            raise ValueError(f"Pair {i} needs a term and a definition")
+        normalized.append({"id": i, "term": str(pair["term"]), "definition": str(pair["definition"])})
+    return {"title": _title(data, "Matching Game"), "pairs": normalized}
+
+
+def validate_summary(data) -> dict:
+    if not isinstance(data, dict) or not data.get("overview"):
+        raise ValueError("Summary has no overview")
+    for key in ("key_points", "takeaways"):
+        if not isinstance(data.get(key, []), list):
+            raise ValueError(f"Summary {key} must be a list")
+    terms = [t for t in data.get("terms") or [] if isinstance(t, dict) and t.get("term")]
+    return {
+        "title": _title(data, "Summary"),
+        "overview": str(data["overview"]),
+        "key_points": [str(p) for p in data.get("key_points", [])],
+        "terms": terms,
+        "takeaways": [str(t) for t in data.get("takeaways", [])],
+    }
+
+
+VALIDATORS = {
+    "flashcards": validate_flashcards,
+    "quiz": validate_quiz,
+    "matching": validate_matching,
+    "summary": validate_summary,
+}
+
+
+def split_study_pack(pack) -> dict:
+    """
+    Split a combined study pack response into per-feature payloads.
+
+    Sections that are missing or fail validation map to None so the caller
+    can regenerate just those.
+    """
+    pack = pack if isinstance(pack, dict) else {}
+    raw = {
+        "flashcards": {"flashcards": pack.get("flashcards")},
+        "quiz": {"questions": pack.get("questions")},
+        "matching": {"pairs": pack.get("pairs")},
+        "summary": pack.get("summary"),
+    }
+    sections = {}
+    for feature, data in raw.items():
+        try:
+            sections[feature] = VALIDATORS[feature](data)
+        except ValueError:
+            sections[feature] = None
+    return sections
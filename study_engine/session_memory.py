@@ -0,0 +1,85 @@
+"""
+Approximate memory accounting for Streamlit sessions.
+
+Each session reports the estimated size of its state after every run and
+while it sits idle. The meter keeps the latest report per session so the
+admin page can show how much memory sessions hold and which ones are
+largest. Reports stop when a tab is closed, and the meter forgets sessions
+whose last report is older than stale_seconds.
+"""
+
+import sys
+import threading
+import time
+
+MAX_DEPTH = 8
+
+
+def approx_size(value, _depth: int = 0) -> int:
+    """Rough deep size of a value in bytes, following containers a few levels down."""
+    size = sys.getsizeof(value)
+    if _depth >= MAX_DEPTH:
+        return size
+    if isinstance(value, dict):
+        size += sum(approx_size(k, _depth + 1) + approx_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(v, _depth + 1) for v in value)
+    return size
+
+
+class SessionMeter:
+    """Latest state-size report per session in this process."""
+
+    def __init__(self, stale_seconds: float = 300.0):
+        self.stale_seconds = stale_seconds
+        self._lock = threading.Lock()
+        self._sessions = {}
+
+    def report(self, token: str, owner: str, sizes: dict, spilled_bytes: int, last_active: float):
+        with self._lock:
+            self._sessions[token] = {
+                "owner": owner,
+                "bytes": sum(sizes.values()),
+                "largest": sorted(sizes.items(), key=lambda kv: kv[1], reverse=True)[:3],
+                "spilled_bytes": spilled_bytes,
+                "last_active": last_active,
+                "reported_at": time.time(),
+            }
+
+    def forget(self, token: str):
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def sessions(self) -> list:
+        """Live sessions, largest first."""
+        cutoff = time.time() - self.stale_seconds
+        with self._lock:
+            for token in [t for t, s in self._sessions.items() if s["reported_at"] < cutoff]:
+                del self._sessions[token]
+            rows = [dict(s, token=token) for token, s in self._sessions.items()]
+        return sorted(rows, key=lambda s: s["bytes"], reverse=True)
+
+    def totals(self) -> dict:
+        rows = self.sessions()
+        return {
+            "sessions": len(rows),
+            "bytes": sum(s["bytes"] for s in rows),
+            "spilled_bytes": sum(s["spilled_bytes"] for s in rows),
+        }
+
+
+def process_rss() -> int:
+    """Resident set size of this process in bytes, or 0 where it cannot be read."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return 0
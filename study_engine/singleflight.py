@@ -0,0 +1,90 @@
+"""
+Process-wide coalescing of identical in-flight generation requests.
+
+When many sessions ask for the same prompt at once, one caller (the leader)
+makes the upstream call and the others wait for its result instead of
+firing their own. A failed leader does not hand its error to the waiting
+callers; they start a fresh flight instead. A leader that runs past the
+timeout is abandoned the same way, so one hung call cannot hold a key.
+"""
+
+import copy
+import threading
+import time
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key."""
+
+    def __init__(self, default_timeout: float = 120.0):
+        self.default_timeout = default_timeout
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def in_flight(self) -> int:
+        """Number of keys currently being computed."""
+        with self._lock:
+            return len(self._flights)
+
+    def do(self, key: str, fn, timeout: float = None):
+        """
+        Return a copy of fn()'s result, sharing one call among concurrent callers of key.
+
+        Every caller gives up with TimeoutError after timeout seconds, the
+        leader included: its call is then abandoned and the key evicted, so
+        later callers start a fresh flight. If the leader raises, its error
+        goes only to the leader and the waiting callers retry with whatever
+        time they have left. Each caller gets its own deep copy, so none can
+        change what the others see.
+        """
+        deadline = time.monotonic() + (timeout if timeout is not None else self.default_timeout)
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = _Flight()
+                    self._flights[key] = flight
+            if leader:
+                return self._lead(key, flight, fn, deadline)
+            if not flight.done.wait(max(0.0, deadline - time.monotonic())):
+                raise TimeoutError("Timed out waiting for an identical request already in progress")
+            if flight.error is None:
+                return copy.deepcopy(flight.result)
+
+    def _land(self, key: str, flight: _Flight, result=None, error: BaseException = None):
+        """Record a flight's outcome and evict its key; only the first outcome counts."""
+        with self._lock:
+            if flight.done.is_set():
+                return
+            flight.result, flight.error = result, error
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            flight.done.set()
+
+    def _lead(self, key: str, flight: _Flight, fn, deadline: float):
+        def run():
+            try:
+                result = fn()
+            except BaseException as e:
+                self._land(key, flight, error=e)
+            else:
+                self._land(key, flight, result=result)
+
+        # On its own thread, so a call that hangs can be abandoned at the deadline.
+        threading.Thread(target=run, name="singleflight-leader", daemon=True).start()
+        if not flight.done.wait(max(0.0, deadline - time.monotonic())):
+            self._land(key, flight, error=TimeoutError("The request took too long and was abandoned"))
+        if flight.error is not None:
+            raise flight.error
+        return copy.deepcopy(flight.result)
+
+
+generation_flights = SingleFlight()
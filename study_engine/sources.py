@@ -0,0 +1,88 @@
+"""
+Merge several uploads into one study source that remembers where each chunk came from.
+
+Each file's text is cleaned of page headers and footers, split into
+paragraph chunks page by page, and appended in upload order. A chunk seen
+earlier in any file (same words, ignoring case and punctuation) is dropped,
+so slides pasted into two decks only count once. The merged text is spooled
+like a single upload; next to it the spool keeps one (file, page) entry per
+chunk, which SourceIndex uses to cite the chunk a generated item is based on.
+"""
+
+from study_engine.compression import PAGE_BREAK, _text_key, normalize_whitespace, strip_boilerplate
+from study_engine.retrieval import BM25Index, chunk_paragraphs, tokenize
+from study_engine.uploads import UploadError, UploadSpool
+
+CHUNK_SEPARATOR = "\n\n"
+# Generated items that get a source, and the fields matched against the chunks.
+CITED_ITEMS = {
+    "flashcards": ("flashcards", ("question", "answer")),
+    "quiz": ("questions", ("question", "explanation")),
+    "matching": ("pairs", ("term", "definition")),
+    "summary": ("terms", ("term", "definition")),
+}
+
+
+def merge_uploads(spool: UploadSpool, handles: list, session: str) -> dict:
+    """Spool the deduplicated merge of handles and return its handle."""
+    chunks, provenance, seen = [], [], set()
+    for number, handle in enumerate(handles):
+        with spool.open_text(handle, session) as text:
+            pages = strip_boilerplate(text).split(PAGE_BREAK)
+        for page_number, page in enumerate(pages, 1):
+            for chunk in chunk_paragraphs(normalize_whitespace(page)):
+                key = _text_key(chunk)
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                chunks.append(chunk)
+                provenance.append([number, page_number if handle["pages"] else None])
+        del pages
+    files = [handle["name"] for handle in handles]
+    merged = spool.spool_text(CHUNK_SEPARATOR.join(chunks), name=files[0] if len(files) == 1 else f"{len(files)} files")
+    spool.write_meta(merged, {"files": files, "chunks": provenance})
+    merged["files"] = files
+    merged["pages"] = sum(handle["pages"] or 0 for handle in handles) or None
+    return merged
+
+
+def source_label(files: list, entry: list) -> str:
+    number, page = entry
+    return f"{files[number]}, p. {page}" if page else files[number]
+
+
+class SourceIndex:
+    """Finds the merged chunk a generated item most likely came from."""
+
+    def __init__(self, text: str, meta: dict):
+        self.files = meta["files"]
+        self.provenance = meta["chunks"]
+        self.index = BM25Index(text.split(CHUNK_SEPARATOR))
+
+    def cite(self, text: str) -> str:
+        """Label like "week3.pdf, p. 4" for the best-matching chunk, or "" when nothing matches."""
+        scores = self.index.scores(tokenize(text))
+        if not scores or max(scores) <= 0:
+            return ""
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return source_label(self.files, self.provenance[best])
+
+
+def cite_output(spool: UploadSpool, handle: dict, session: str, feature: str, data: dict) -> dict:
+    """Copy of a parsed response whose items carry a "source" label from the merged upload."""
+    list_key, fields = CITED_ITEMS.get(feature, (None, ()))
+    meta = spool.read_meta(handle)
+    if not meta or not isinstance(data, dict) or not isinstance(data.get(list_key), list):
+        return data
+    try:
+        with spool.open_text(handle, session) as text:
+            index = SourceIndex(text, meta)
+    except UploadError:
+        return data
+    items = []
+    for item in data[list_key]:
+        if isinstance(item, dict):
+            source = index.cite(" ".join(str(item.get(field) or "") for field in fields))
+            item = dict(item, source=source) if source else item
+        items.append(item)
+    return dict(data, **{list_key: items})
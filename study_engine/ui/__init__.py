@@ -0,0 +1,3 @@
+"""
+Streamlit user interface for My Study Buddy.
+"""
@@ -0,0 +1,217 @@
+"""
+Small UI helpers shared by the pages: mascot art, uploads, job polling and
+export downloads.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
+
+import streamlit as st
+
+from study_engine.exports import FORMATS, export_name, export_stream
+from study_engine.jobs import job_key
+from study_engine.sources import cite_output, merge_uploads
+from study_engine.ui.resources import get_job_manager, get_upload_spool
+from study_engine.uploads import UploadError
+
+JOB_POLL_SECONDS = 1.0
+MAX_UPLOAD_FILES = 10
+MAX_UPLOAD_HANDLES = 2 * MAX_UPLOAD_FILES + 4
+UPLOAD_WORKERS = 4
+
+
+def robot_svg(size=100):
+    """Return robot mascot SVG."""
+    scale = size / 100
+    return f"""
+    <div style="text-align: center;">
+        <svg width="{int(120*scale)}" height="{int(140*scale)}" viewBox="0 0 120 140" fill="none" xmlns="http://www.w3.org/2000/svg">
+            <circle cx="60" cy="12" r="8" fill="#8B7EC8"/>
+            <rect x="57" y="18" width="6" height="15" fill="#8B7EC8"/>
+            <rect x="20" y="30" width="80" height="60" rx="12" fill="#B8ACE0"/>
+            <rect x="25" y="35" width="70" height="50" rx="8" fill="#E8E4F0"/>
+            <circle cx="45" cy="55" r="10" fill="white"/>
+            <circle cx="75" cy="55" r="10" fill="white"/>
+            <circle cx="45" cy="55" r="5" fill="#2D2D2D"/>
+            <circle cx="75" cy="55" r="5" fill="#2D2D2D"/>
+            <rect x="40" y="72" width="40" height="6" rx="3" fill="#2D2D2D"/>
+            <rect x="30" y="95" width="60" height="40" rx="8" fill="#8B7EC8"/>
+            <rect x="10" y="100" width="18" height="8" rx="4" fill="#B8ACE0"/>
+            <rect x="92" y="100" width="18" height="8" rx="4" fill="#B8ACE0"/>
+        </svg>
+    </div>
+    """
+
+
+def dots_indicator(current, total):
+    """Return dots indicator HTML."""
+    dots = ""
+    for i in range(total):
+        active = "active" if i == current else ""
+        dots += f'<div class="dot {active}"></div>'
+    return f'<div class="dots-container">{dots}</div>'
+
+
+def spool_upload(uploaded) -> dict:
+    """Spool an upload to disk once per file and return its handle; reruns reuse the handle."""
+    spool = get_upload_spool()
+    handles = st.session_state.setdefault("upload_handles", {})
+    handle = handles.get(uploaded.file_id)
+    if handle is None or not spool.exists(handle):
+        uploaded.seek(0)
+        handle = spool.spool(uploaded, uploaded.name)
+        _remember_handle(uploaded.file_id, handle)
+    return handle
+
+
+def _remember_handle(key: str, handle: dict):
+    handles = st.session_state.setdefault("upload_handles", {})
+    while len(handles) >= MAX_UPLOAD_HANDLES:
+        handles.pop(next(iter(handles)))
+    handles[key] = handle
+
+
+def spool_uploads(files: list) -> dict:
+    """
+    Spool several uploads concurrently and merge them into one source handle.
+
+    Files not seen before are extracted in a small thread pool, each with its
+    own status line. The merged handle is cached on the set of files, so
+    reruns only look it up.
+    """
+    spool = get_upload_spool()
+    files = files[:MAX_UPLOAD_FILES]
+    handles = st.session_state.setdefault("upload_handles", {})
+    merge_key = "merge:" + ",".join(f.file_id for f in files)
+    merged = handles.get(merge_key)
+    if merged is not None and spool.exists(merged):
+        return merged
+
+    pending = [f for f in files if f.file_id not in handles or not spool.exists(handles[f.file_id])]
+    if pending:
+        status = {f.file_id: st.empty() for f in pending}
+        for f in pending:
+            status[f.file_id].caption(f"⏳ {f.name}")
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+            futures = {}
+            for f in pending:
+                f.seek(0)
+                futures[pool.submit(spool.spool, f, f.name)] = f
+            for future in as_completed(futures):
+                f = futures[future]
+                try:
+                    handle = future.result()
+                except Exception as e:
+                    status[f.file_id].caption(f"❌ {f.name}: {e}")
+                    continue
+                _remember_handle(f.file_id, handle)
+                pages = f", {handle['pages']} pages" if handle["pages"] else ""
+                status[f.file_id].caption(f"✅ {f.name}: {handle['words']:,} words{pages}")
+
+    parts = [handles[f.file_id] for f in files if f.file_id in handles]
+    if not parts:
+        raise UploadError("None of the files could be read")
+    merged = merge_uploads(spool, parts, st.session_state.session_token)
+    _remember_handle(merge_key, merged)
+    return merged
+
+
+@contextmanager
+def document_text(source):
+    """Text of pasted notes or of a spooled upload handle, held in memory only inside the block."""
+    if isinstance(source, dict):
+        with get_upload_spool().open_text(source, st.session_state.session_token) as text:
+            yield text
+    else:
+        yield source or ""
+
+
+def source_citer(source):
+    """Citation step for run_generation when the source is a merged upload, else None."""
+    if isinstance(source, dict) and source.get("files"):
+        return partial(cite_output, get_upload_spool(), source, st.session_state.session_token)
+    return None
+
+
+def job_owner() -> str:
+    """Key jobs by the logged-in account so a reconnected session finds them."""
+    return st.session_state.user_email or st.session_state.username
+
+
+def start_job(feature: str, task, system_prompt: str, user_prompt: str):
+    """Submit a generation job; duplicate submissions attach to the running job."""
+    job_id = get_job_manager().submit(job_owner(), feature, task, job_key(feature, system_prompt, user_prompt))
+    st.session_state[f"{feature}_job_id"] = job_id
+
+
+def attached_job(feature: str) -> dict:
+    """
+    Return this session's job for a feature, reattaching after a reconnect.
+
+    A newer job of the same account replaces the session's, so results that
+    another job published for this page (a study pack) are shown here too.
+    """
+    jobs = get_job_manager()
+    job_id = st.session_state.get(f"{feature}_job_id")
+    job = jobs.get(job_id) if job_id else None
+    latest = jobs.latest(job_owner(), feature)
+    if latest and (job is None or latest["created_at"] > job["created_at"]):
+        job = latest
+    if job:
+        st.session_state[f"{feature}_job_id"] = job["id"]
+    return job
+
+
+def dismiss_job(feature: str):
+    """Forget a feature's job once its result has been used."""
+    job_id = st.session_state.pop(f"{feature}_job_id", None)
+    if job_id:
+        get_job_manager().dismiss(job_id)
+
+
+def job_result(feature: str, message: str) -> dict:
+    """Poll the feature's job and return its result once it has finished."""
+    job = attached_job(feature)
+    if not job:
+        return None
+    if job["status"] in ("queued", "running"):
+        with st.spinner(message):
+            time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+    if job["status"] == "failed":
+        st.error(f"Error: {job['error']}")
+        dismiss_job(feature)
+        return None
+    return job["result"]
+
+
+def show_generation_notes(result: dict, label: str):
+    """Explain passage selection and reuse for a finished generation."""
+    selection = result.get("selection")
+    if selection and selection[0] < selection[1]:
+        st.caption(f"📎 Using the {selection[0]} most relevant of {selection[1]} passages to stay within the AI's context budget")
+    if result.get("reused"):
+        st.info(f"♻️ Reused {label} from {int(result['reused'] * 100)}% similar content")
+    deduplicated = result.get("deduplicated")
+    if deduplicated:
+        st.caption(f"🧹 Removed {deduplicated[0]} near-duplicate item(s) and generated {deduplicated[1]} replacement(s)")
+    chunks = result.get("chunks")
+    if chunks and chunks[0]:
+        st.caption(f"⚡ {chunks[0]} of {chunks[1]} sections were unchanged and reused from your last run")
+    compression = result.get("compression")
+    if compression and compression[1] < compression[0]:
+        st.caption(f"🗜️ Notes compressed from {compression[0]:,} to {compression[1]:,} tokens")
+
+
+def export_buttons(kind: str, items: list, title: str, key: str):
+    """Download the items shown on a page; kind is "flashcards" or "questions"."""
+    formats = [fmt for fmt, spec in FORMATS.items() if kind in spec[3]]
+    c1, c2 = st.columns([2, 1])
+    fmt = c1.selectbox("Export format", formats, format_func=lambda f: FORMATS[f][0], key=f"{key}_export_format")
+    with c2:
+        st.download_button(
+            "📤 Export", lambda: b"".join(export_stream(fmt, kind, items, title)),
+            file_name=export_name(title, fmt), mime=FORMATS[fmt][1], key=f"{key}_export", on_click="ignore",
+        )
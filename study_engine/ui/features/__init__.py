@@ -0,0 +1,3 @@
+"""
+One module per sidebar page, imported only when the page is opened.
+"""
@@ -0,0 +1,75 @@
+"""
+Answer evaluation page.
+"""
+
+from functools import partial
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.generation import run_generation
+from study_engine.prompts import EVAL_SYSTEM, format_user_prompt
+from study_engine.ui.components import job_result, start_job
+
+
+def render_evaluation(data: dict):
+    col1, col2 = st.columns(2)
+    with col1:
+        score = data.get('score', 0)
+        st.metric("Score", f"{int(score * 100)}%")
+    with col2:
+        is_correct = data.get('is_correct', False)
+        st.metric("Status", "✅ Correct" if is_correct else "❌ Needs Work")
+    
+    st.markdown("### 💬 Feedback")
+    st.write(data.get('feedback', 'No feedback available'))
+    
+    if "suggestions" in data and data["suggestions"]:
+        st.markdown("### 💡 Suggestions for Improvement")
+        for suggestion in data["suggestions"]:
+            st.markdown(f"• {suggestion}")
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">✅ Answer Evaluation</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Get AI feedback on your answers</p>', unsafe_allow_html=True)
+    
+    if not provider.is_configured():
+        st.error("❌ AI Provider not configured. Set GROQ_API_KEY environment variable.")
+    else:
+        question = st.text_area(
+            "❓ Question",
+            height=80,
+            placeholder="Enter the question...",
+            key="eval_question"
+        )
+        
+        correct_answer = st.text_area(
+            "✅ Correct Answer",
+            height=80,
+            placeholder="Enter the correct/expected answer...",
+            key="eval_correct"
+        )
+        
+        user_answer = st.text_area(
+            "📝 Your Answer",
+            height=80,
+            placeholder="Enter your answer to evaluate...",
+            key="eval_user"
+        )
+        
+        if st.button("✅ Evaluate Answer", disabled=not all([question, correct_answer, user_answer])):
+            user_prompt = format_user_prompt(
+                "evaluation",
+                question=question,
+                correct=correct_answer,
+                user_answer=user_answer
+            )
+            start_job("evaluation", partial(run_generation, provider, EVAL_SYSTEM, user_prompt, feature="evaluation"), EVAL_SYSTEM, user_prompt)
+        
+        result = job_result("evaluation", "Evaluating...")
+        if result:
+            try:
+                render_evaluation(result["data"])
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
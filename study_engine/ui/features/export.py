@@ -0,0 +1,55 @@
+"""
+Export page: download whole question banks for Anki or an LMS.
+"""
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.exports import FORMATS, export_name, export_stream
+from study_engine.exportserver import create_ticket
+from study_engine.ui.components import job_owner
+from study_engine.ui.resources import export_url, get_question_bank_store, get_state_store
+
+LIBRARY = (None, "All my question banks", None)
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">📤 Export</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Take your question banks to Anki or your LMS</p>', unsafe_allow_html=True)
+
+    store = get_question_bank_store()
+    banks = store.list_banks(job_owner())
+    if not banks:
+        st.info("Import a question bank on the ❓ Quiz page first. "
+                "Flashcards and quizzes can be exported from their own pages.")
+        return
+
+    choices = banks + [LIBRARY] if len(banks) > 1 else banks
+    c1, c2 = st.columns(2)
+    bank = c1.selectbox(
+        "What to export", choices,
+        format_func=lambda b: b[1] if b[0] is None else f"{b[1]} ({b[2]} questions)", key="export_source"
+    )
+    fmt = c2.selectbox("Format", list(FORMATS), format_func=lambda f: FORMATS[f][0], key="export_format")
+    source = {"type": "library"} if bank[0] is None else {"type": "bank", "bank_id": bank[0]}
+    title = "Question banks" if bank[0] is None else bank[1]
+
+    url = export_url()
+    if url:
+        # The export server streams the file from the database; the ticket expires after a few minutes.
+        if st.button("Prepare download", type="primary"):
+            ticket = create_ticket(get_state_store(), job_owner(), source, fmt)
+            st.session_state.export_link = [bank[0], fmt, f"{url}/export/{ticket}"]
+        link = st.session_state.get("export_link")
+        if link and link[:2] == [bank[0], fmt]:
+            st.link_button(f"⬇️ Download {export_name(title, fmt)}", link[2])
+    else:
+        def build() -> bytes:
+            items = store.iter_library(job_owner()) if bank[0] is None else store.iter_questions(bank[0])
+            return b"".join(export_stream(fmt, "questions", items, title))
+
+        st.download_button(
+            f"⬇️ Download {export_name(title, fmt)}", build,
+            file_name=export_name(title, fmt), mime=FORMATS[fmt][1], type="primary", on_click="ignore",
+        )
+        st.caption("The file is built on the server when you click. Set EXPORT_URL to stream large banks instead.")
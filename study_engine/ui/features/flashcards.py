@@ -0,0 +1,61 @@
+"""
+Flashcard generation page.
+"""
+
+from functools import partial
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.compression import compress_notes
+from study_engine.generation import run_incremental_flashcards
+from study_engine.prompts import FLASHCARD_SYSTEM, format_user_prompt
+from study_engine.ui.components import export_buttons, job_result, show_generation_notes, start_job
+from study_engine.ui.resources import get_artifact_store
+
+
+def render_flashcards(data: dict):
+    st.success(f"✅ Generated: {data.get('title', 'Flashcards')}")
+    
+    if "flashcards" in data:
+        for card in data["flashcards"]:
+            with st.expander(f"Card {card['id']}: {card['question'][:50]}..."):
+                st.markdown(f"**Question:** {card['question']}")
+                st.markdown(f"**Answer:** {card['answer']}")
+        export_buttons("flashcards", data["flashcards"], data.get("title", "Flashcards"), "flashcards")
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">🎴 Flashcard Generation</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Generate question-answer pairs from your study material</p>', unsafe_allow_html=True)
+    
+    if not provider.is_configured():
+        st.error("❌ AI Provider not configured. Set GROQ_API_KEY environment variable.")
+    else:
+        content = st.text_area(
+            "📝 Enter your study content",
+            height=150,
+            placeholder="Paste your notes, textbook content, or any study material here..."
+        )
+        
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            num_cards = st.number_input("Number of flashcards", min_value=1, max_value=20, value=5)
+        with col2:
+            reuse = st.checkbox("♻️ Reuse results from similar content", value=True, key="flashcard_reuse")
+        
+        if st.button("🎴 Generate Flashcards", disabled=not content):
+            notes, before, after = compress_notes(content)
+            user_prompt = format_user_prompt("flashcards", num=num_cards, content=notes)
+            start_job("flashcards", partial(
+                run_incremental_flashcards, provider, notes, num_cards, get_artifact_store(),
+                reuse=reuse, compression=[before, after]
+            ), FLASHCARD_SYSTEM, user_prompt)
+        
+        result = job_result("flashcards", "Creating flashcards...")
+        if result:
+            try:
+                show_generation_notes(result, "flashcards")
+                render_flashcards(result["data"])
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
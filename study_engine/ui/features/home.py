@@ -0,0 +1,66 @@
+"""
+Home page with an overview of the features.
+"""
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.ui.components import robot_svg
+
+
+def show(provider: AIProvider):
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(robot_svg(100), unsafe_allow_html=True)
+    
+    st.markdown('<h1 class="main-title">My Study Buddy</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-title">Turn your notes into flashcards, quizzes, study guides, and fun study games.</p>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="feature-box">
+            <h4>🎴 Flashcards</h4>
+            <p>Generate question-answer pairs for effective memorization.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="feature-box">
+            <h4>🔗 Matching Sprint</h4>
+            <p>Create term-definition matching games.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="feature-box">
+            <h4>📝 Notes Summary</h4>
+            <p>Summarize long notes while preserving key concepts.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="feature-box">
+            <h4>❓ Quiz Race</h4>
+            <p>Create multiple-choice quizzes to test knowledge.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="feature-box">
+            <h4>📖 Study Guide</h4>
+            <p>Transform notes into organized summaries.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="feature-box">
+            <h4>✅ Evaluation</h4>
+            <p>Get AI feedback on your answers.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("")
+    st.info("👈 Select a feature from the sidebar to get started!")
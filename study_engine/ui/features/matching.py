@@ -0,0 +1,75 @@
+"""
+Matching Sprint page.
+"""
+
+from functools import partial
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.compression import compress_notes
+from study_engine.config import CONTEXT_TOKEN_BUDGET
+from study_engine.generation import run_generation
+from study_engine.prompts import MATCHING_SYSTEM, format_user_prompt
+from study_engine.retrieval import select_passages
+from study_engine.ui.components import job_result, show_generation_notes, start_job
+
+
+def render_matching(data: dict):
+    st.success(f"✅ Generated: {data.get('title', 'Matching Game')}")
+    
+    if "pairs" in data:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("### 📝 Terms")
+            for pair in data["pairs"]:
+                st.markdown(f"""
+                <div style="background: #8B7EC8; color: white; padding: 0.75rem; border-radius: 8px; margin-bottom: 0.5rem;">
+                    {pair['term']}
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("### 📖 Definitions")
+            for pair in data["pairs"]:
+                st.markdown(f"""
+                <div style="background: white; border: 2px solid #E5DDD0; padding: 0.75rem; border-radius: 8px; margin-bottom: 0.5rem; color: #333;">
+                    {pair['definition']}
+                </div>
+                """, unsafe_allow_html=True)
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">🔗 Matching Sprint</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Create term-definition matching games</p>', unsafe_allow_html=True)
+    
+    if not provider.is_configured():
+        st.error("❌ AI Provider not configured. Set GROQ_API_KEY environment variable.")
+    else:
+        content = st.text_area(
+            "📝 Enter your study content",
+            height=150,
+            placeholder="Paste your notes with key terms and concepts...",
+            key="matching_content"
+        )
+        
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            num_pairs = st.number_input("Number of pairs", min_value=2, max_value=15, value=5)
+        
+        if st.button("🔗 Generate Matching Game", disabled=not content):
+            notes, before, after = compress_notes(content)
+            passages, selected, total = select_passages(notes, token_budget=CONTEXT_TOKEN_BUDGET)
+            user_prompt = format_user_prompt("matching", num=num_pairs, content=passages)
+            start_job("matching", partial(
+                run_generation, provider, MATCHING_SYSTEM, user_prompt, selection=[selected, total],
+                compression=[before, after], feature="matching"
+            ), MATCHING_SYSTEM, user_prompt)
+        
+        result = job_result("matching", "Creating matching pairs...")
+        if result:
+            try:
+                show_generation_notes(result, "matching pairs")
+                render_matching(result["data"])
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
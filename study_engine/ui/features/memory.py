@@ -0,0 +1,53 @@
+"""
+Admin page: memory held by sessions and uploads in this server process.
+"""
+
+import time
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.session_memory import process_rss
+from study_engine.ui.resources import admin_emails, get_session_meter, get_upload_spool
+from study_engine.ui.session import idle_seconds
+
+
+def _mb(size: int) -> str:
+    if size < 1_000_000:
+        return f"{size / 1000:,.0f} KB"
+    return f"{size / 1_000_000:,.1f} MB"
+
+
+def show(provider: AIProvider):
+    if st.session_state.user_email.lower() not in admin_emails():
+        st.error("This page is only available to admins.")
+        return
+
+    st.markdown('<p class="page-title">🧠 Memory</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">What open sessions keep in server memory</p>', unsafe_allow_html=True)
+
+    meter = get_session_meter()
+    sessions = meter.sessions()
+    totals = meter.totals()
+    uploads = get_upload_spool().budget.usage()
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Process RSS", _mb(process_rss()))
+    c2.metric("Session state", _mb(totals["bytes"]))
+    c3.metric("Open sessions", totals["sessions"])
+    c4.metric("Spilled to disk", _mb(totals["spilled_bytes"]))
+    st.caption(f"Upload text loaded right now: {_mb(uploads['total'])} across {len(uploads['sessions'])} session(s). "
+               f"Large values of sessions idle for {int(idle_seconds() // 60)} min are moved to disk.")
+
+    st.markdown("### 📋 Sessions")
+    if sessions:
+        now = time.time()
+        st.dataframe([
+            {"User": s["owner"], "State": _mb(s["bytes"]), "Spilled": _mb(s["spilled_bytes"]),
+             "Largest keys": ", ".join(f"{key} ({_mb(size)})" for key, size in s["largest"]),
+             "Idle (min)": int((now - s["last_active"]) // 60)}
+            for s in sessions
+        ], use_container_width=True, hide_index=True)
+    else:
+        st.info("No sessions have reported yet.")
+    st.caption("Sizes are estimates of Python object sizes for this server process.")
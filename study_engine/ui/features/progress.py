@@ -0,0 +1,60 @@
+"""
+Progress page: quiz accuracy and timing per topic and per question.
+"""
+
+import time
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.attempts import grade
+from study_engine.ui.components import job_owner
+from study_engine.ui.resources import get_attempt_store
+
+
+def _ago(timestamp: float) -> str:
+    minutes = int((time.time() - timestamp) // 60)
+    if minutes < 60:
+        return f"{minutes} min ago"
+    if minutes < 24 * 60:
+        return f"{minutes // 60} h ago"
+    return f"{minutes // (24 * 60)} days ago"
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">📈 Progress</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">How your quiz results are developing</p>', unsafe_allow_html=True)
+
+    progress = get_attempt_store().progress(job_owner())
+    totals = progress["totals"]
+    if not totals:
+        st.info("Finish a quiz on the ❓ Quiz page and your results will show up here.")
+        return
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Quizzes", f"{totals['attempts']:,}")
+    c2.metric("Accuracy", f"{totals['accuracy']:.0%}")
+    c3.metric("Time per question", f"{totals['seconds_per_question']:.0f} s")
+    c4.metric("Best score", f"{totals['best_pct']}% ({grade(totals['best_pct'])})")
+    st.caption(f"{totals['questions']:,} questions answered, last quiz {_ago(totals['last_at'])}")
+
+    recent = progress["recent"]
+    if len(recent) > 1:
+        st.markdown("### 📅 Recent Quizzes")
+        st.line_chart({"Score %": [a["pct"] for a in recent]})
+
+    st.markdown("### 📚 Topics")
+    st.dataframe([
+        {"Topic": t["topic"], "Quizzes": t["attempts"], "Accuracy": f"{t['accuracy']:.0%}",
+         "Time per question (s)": round(t["seconds_per_question"], 1), "Last score": f"{t['last_pct']}%",
+         "Last played": _ago(t["last_at"])}
+        for t in progress["topics"]
+    ], use_container_width=True, hide_index=True)
+
+    if progress["missed"]:
+        st.markdown("### 🎯 Questions to Review")
+        st.dataframe([
+            {"Question": q["question"], "Topic": q["topic"], "Missed": f"{q['misses']} of {q['attempts']}",
+             "Time (s)": round(q["seconds_per_question"], 1), "Last time": "✅" if q["last_correct"] else "❌"}
+            for q in progress["missed"]
+        ], use_container_width=True, hide_index=True)
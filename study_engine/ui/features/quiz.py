@@ -0,0 +1,369 @@
+"""
+Quiz Race page: AI, manual and question-bank quizzes.
+"""
+
+from functools import partial
+import io
+import time
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.attempts import grade
+from study_engine.compression import compress_notes
+from study_engine.generation import run_bank_quiz
+from study_engine.prompts import QUIZ_SYSTEM, format_user_prompt
+from study_engine.question_banks import IMPORT_FORMATS, ImportFailed, topic_key
+from study_engine.ui.components import (
+    attached_job, dismiss_job, document_text, export_buttons, job_owner, job_result, source_citer, spool_uploads,
+    start_job,
+)
+from study_engine.ui.resources import (
+    get_attempt_store, get_document_bank, get_question_bank_store, get_upload_spool,
+)
+from study_engine.uploads import UploadError
+
+
+def _mark_answer(qid):
+    """Charge the time since the previous answer (or the start) to question qid."""
+    timing = st.session_state.quiz_timing
+    now = time.time()
+    times = timing.setdefault("times", {})
+    times[str(qid)] = times.get(str(qid), 0.0) + now - timing.get("last", now)
+    timing["last"] = now
+
+
+def _graded(questions: list) -> list:
+    """(question, chosen label, is right) for each question."""
+    graded = []
+    for q in questions:
+        user_ans = st.session_state.quiz_answers.get(q['id'], '')
+        correct_opt = next((o for o in q['options'] if o['is_correct']), None)
+        graded.append((q, user_ans, user_ans == correct_opt['label'] if correct_opt else False))
+    return graded
+
+
+def _record_attempt(title: str, questions: list):
+    """Save the submitted answers; questions never answered share the time left over."""
+    timing = st.session_state.quiz_timing
+    times = timing.get("times", {})
+    untouched = [q for q in questions if str(q['id']) not in times]
+    leftover = max(0.0, time.time() - timing.get("last", time.time()))
+    share = leftover / len(untouched) if untouched else 0.0
+    get_attempt_store().record_attempt(job_owner(), title, [
+        (q['question'], user_ans, is_right, times.get(str(q['id']), share))
+        for q, user_ans, is_right in _graded(questions)
+    ])
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">❓ Quiz Race</p>', unsafe_allow_html=True)
+    
+    if 'quiz_step' not in st.session_state:
+        st.session_state.quiz_step = 'menu'
+    if 'quiz_data' not in st.session_state:
+        st.session_state.quiz_data = None
+    if 'quiz_answers' not in st.session_state:
+        st.session_state.quiz_answers = {}
+    if 'quiz_submitted' not in st.session_state:
+        st.session_state.quiz_submitted = False
+    if 'custom_questions' not in st.session_state:
+        st.session_state.custom_questions = []
+    if 'quiz_content' not in st.session_state:
+        st.session_state.quiz_content = ""
+    if 'quiz_reused' not in st.session_state:
+        st.session_state.quiz_reused = None
+    if 'quiz_banked' not in st.session_state:
+        st.session_state.quiz_banked = None
+    if not st.session_state.get('quiz_timing'):
+        st.session_state.quiz_timing = {"last": time.time(), "times": {}}
+    
+    # A quiz published by a study pack can arrive while any other step is open.
+    if st.session_state.quiz_step != 'ai_settings' and attached_job("quiz"):
+        st.session_state.quiz_step = 'ai_settings'
+    
+    if st.session_state.quiz_step == 'play' and st.session_state.quiz_data:
+        data = st.session_state.quiz_data
+        questions = data.get("questions", [])
+        
+        if not questions:
+            st.error("No questions found!")
+            if st.button("Back to Menu"):
+                st.session_state.quiz_step = 'menu'
+                st.rerun()
+        else:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f"### {data.get('title', 'Quiz')}")
+            with col2:
+                if st.button("Exit Quiz"):
+                    st.session_state.quiz_step = 'menu'
+                    st.session_state.quiz_data = None
+                    st.session_state.quiz_answers = {}
+                    st.session_state.quiz_submitted = False
+                    st.session_state.quiz_reused = None
+                    st.session_state.quiz_banked = None
+                    st.rerun()
+            
+            if st.session_state.quiz_reused:
+                st.info(f"♻️ Reused a quiz from {int(st.session_state.quiz_reused * 100)}% similar content")
+            banked = st.session_state.quiz_banked
+            if banked and banked[0]:
+                st.info(f"🏦 {banked[0]} questions from the bank for this document, {banked[1]} newly generated")
+            
+            st.markdown("---")
+            
+            if not st.session_state.quiz_submitted:
+                for q in questions:
+                    st.markdown(f"**Q{q['id']}: {q['question']}**")
+                    opts = [f"{o['label']}. {o['text']}" for o in q['options']]
+                    ans = st.radio(f"q{q['id']}", opts, key=f"pq_{q['id']}", label_visibility="collapsed",
+                                   on_change=_mark_answer, args=(q['id'],))
+                    st.session_state.quiz_answers[q['id']] = ans[0] if ans else ""
+                    st.markdown("---")
+                
+                if st.button("Submit Answers", type="primary"):
+                    _record_attempt(data.get('title') or 'Quiz', questions)
+                    st.session_state.quiz_submitted = True
+                    st.rerun()
+            else:
+                correct = 0
+                for q, user_ans, is_right in _graded(questions):
+                    if is_right:
+                        correct += 1
+                    
+                    icon = "✅" if is_right else "❌"
+                    st.markdown(f"**{icon} Q{q['id']}: {q['question']}**")
+                    for o in q['options']:
+                        if o['is_correct']:
+                            st.markdown(f"  ✅ {o['label']}. {o['text']} *(Correct)*")
+                        elif o['label'] == user_ans:
+                            st.markdown(f"  ❌ {o['label']}. {o['text']} *(Your answer)*")
+                        else:
+                            st.markdown(f"  ⬜ {o['label']}. {o['text']}")
+                    if q.get('source'):
+                        st.caption(f"📎 {q['source']}")
+                    st.markdown("---")
+                
+                pct = int((correct / len(questions)) * 100) if questions else 0
+                c1, c2, c3 = st.columns(3)
+                c1.metric("Score", f"{correct}/{len(questions)}")
+                c2.metric("Percent", f"{pct}%")
+                c3.metric("Grade", grade(pct))
+                st.caption("📈 Saved to your progress")
+                export_buttons("questions", questions, data.get('title', 'Quiz'), "quiz")
+                
+                c1, c2 = st.columns(2)
+                if c1.button("Retry"):
+                    st.session_state.quiz_submitted = False
+                    st.session_state.quiz_answers = {}
+                    st.session_state.quiz_timing = None
+                    st.rerun()
+                if c2.button("Back to Menu"):
+                    st.session_state.quiz_step = 'menu'
+                    st.session_state.quiz_data = None
+                    st.session_state.quiz_submitted = False
+                    st.session_state.quiz_reused = None
+                    st.session_state.quiz_banked = None
+                    st.rerun()
+    
+    elif st.session_state.quiz_step == 'menu':
+        c1, c2 = st.columns(2)
+        with c1:
+            st.markdown("### 🤖 AI Generate")
+            st.write("Upload content, AI creates quiz")
+            if st.button("Start AI Quiz"):
+                st.session_state.quiz_step = 'ai_upload'
+                st.rerun()
+        with c2:
+            st.markdown("### ✏️ Create Manual")
+            st.write("Create your own questions")
+            if st.button("Create Manually"):
+                st.session_state.quiz_step = 'manual'
+                st.rerun()
+        
+        if st.session_state.custom_questions:
+            st.markdown("---")
+            st.write(f"You have {len(st.session_state.custom_questions)} saved questions")
+            if st.button("Play Saved Quiz"):
+                st.session_state.quiz_data = {"title": "My Quiz", "questions": st.session_state.custom_questions}
+                st.session_state.quiz_reused = None
+                st.session_state.quiz_banked = None
+                st.session_state.quiz_step = 'play'
+                st.session_state.quiz_timing = None
+                st.session_state.quiz_answers = {}
+                st.session_state.quiz_submitted = False
+                st.rerun()
+        
+        banks = get_question_bank_store().list_banks(job_owner())
+        if banks:
+            st.markdown("---")
+            st.markdown("### 📚 Question Banks")
+            c1, c2 = st.columns([3, 1])
+            bank = c1.selectbox(
+                "Question bank", banks, format_func=lambda b: f"{b[1]} ({b[2]} questions)", key="bank_select"
+            )
+            sample_size = c2.number_input("Questions", min_value=1, max_value=100, value=10, key="bank_sample")
+            if st.button("Play Random Sample"):
+                st.session_state.quiz_data = {
+                    "title": bank[1], "questions": get_question_bank_store().sample(bank[0], sample_size)
+                }
+                st.session_state.quiz_reused = None
+                st.session_state.quiz_banked = None
+                st.session_state.quiz_step = 'play'
+                st.session_state.quiz_timing = None
+                st.session_state.quiz_answers = {}
+                st.session_state.quiz_submitted = False
+                st.rerun()
+    
+    elif st.session_state.quiz_step == 'manual':
+        if st.button("← Back"):
+            st.session_state.quiz_step = 'menu'
+            st.rerun()
+        
+        st.markdown("### Add Question")
+        q_text = st.text_area("Question", key="m_q")
+        c1, c2 = st.columns(2)
+        opt_a = c1.text_input("Option A", key="m_a")
+        opt_b = c2.text_input("Option B", key="m_b")
+        opt_c = c1.text_input("Option C", key="m_c")
+        opt_d = c2.text_input("Option D", key="m_d")
+        correct = st.selectbox("Correct", ["A","B","C","D"], key="m_cor")
+        
+        if st.button("Add Question"):
+            if q_text and opt_a and opt_b:
+                st.session_state.custom_questions.append({
+                    "id": len(st.session_state.custom_questions)+1,
+                    "question": q_text,
+                    "options": [
+                        {"label":"A","text":opt_a,"is_correct":correct=="A"},
+                        {"label":"B","text":opt_b,"is_correct":correct=="B"},
+                        {"label":"C","text":opt_c or "N/A","is_correct":correct=="C"},
+                        {"label":"D","text":opt_d or "N/A","is_correct":correct=="D"},
+                    ],
+                    "explanation": ""
+                })
+                st.success("Added!")
+        
+        if st.session_state.custom_questions:
+            st.markdown("---")
+            st.write(f"**{len(st.session_state.custom_questions)} Questions:**")
+            for i, q in enumerate(st.session_state.custom_questions):
+                st.write(f"{q['id']}. {q['question'][:50]}...")
+            
+            c1, c2 = st.columns(2)
+            if c1.button("Play Quiz"):
+                st.session_state.quiz_data = {"title": "My Quiz", "questions": st.session_state.custom_questions}
+                st.session_state.quiz_reused = None
+                st.session_state.quiz_banked = None
+                st.session_state.quiz_step = 'play'
+                st.session_state.quiz_timing = None
+                st.session_state.quiz_answers = {}
+                st.session_state.quiz_submitted = False
+                st.rerun()
+            if c2.button("Clear All"):
+                st.session_state.custom_questions = []
+                st.rerun()
+        
+        st.markdown("---")
+        st.markdown("### 📥 Import Question Bank")
+        st.caption(
+            "CSV columns: question, a, b, c, d, correct, explanation. "
+            "JSON: an array or JSON Lines of questions. GIFT: multiple-choice and true/false questions."
+        )
+        bank_file = st.file_uploader("Question bank file", type=list(IMPORT_FORMATS), key="bank_file")
+        bank_name = st.text_input("Bank name", key="bank_name", placeholder="e.g., Biology midterm")
+        
+        if st.button("Import Questions", disabled=not bank_file):
+            store = get_question_bank_store()
+            bank_id = store.create_bank(job_owner(), bank_name or bank_file.name)
+            fmt = IMPORT_FORMATS[bank_file.name.rsplit('.', 1)[-1].lower()]
+            lines = io.TextIOWrapper(bank_file, encoding='utf-8', errors='replace', newline='')
+            failure = "No valid questions found"
+            try:
+                with st.spinner("Importing questions..."):
+                    imported, errors = store.import_stream(bank_id, lines, fmt)
+            except ImportFailed as e:
+                imported, errors, failure = 0, [], str(e)
+            lines.detach()
+            if imported:
+                st.success(f"✅ Imported {imported} questions. Play them from the quiz menu.")
+            else:
+                store.delete_bank(bank_id)
+                st.error(failure)
+            if errors:
+                with st.expander(f"⚠️ {len(errors)} rows skipped"):
+                    for row, message in errors:
+                        st.write(f"Row {row}: {message}")
+    
+    elif st.session_state.quiz_step == 'ai_upload':
+        if st.button("← Back"):
+            st.session_state.quiz_step = 'menu'
+            st.rerun()
+        
+        st.markdown("### Upload Content")
+        content = st.text_area("Paste notes", height=150, key="ai_txt")
+        
+        source = content
+        uploaded = st.file_uploader("Or upload files", type=['txt','pdf'], accept_multiple_files=True, key="ai_up")
+        if uploaded:
+            try:
+                source = spool_uploads(uploaded)
+                st.success(f"Loaded {source['bytes']} chars from {len(source['files'])} file(s)")
+            except Exception:
+                st.error("Cannot read file")
+        
+        if st.button("Continue", disabled=not source):
+            # Keep only a handle in the session; the text stays in the upload spool.
+            st.session_state.quiz_content = source if isinstance(source, dict) else get_upload_spool().spool_text(source)
+            st.session_state.quiz_step = 'ai_settings'
+            st.rerun()
+    
+    elif st.session_state.quiz_step == 'ai_settings':
+        if st.button("← Back"):
+            st.session_state.quiz_step = 'ai_upload'
+            st.rerun()
+        
+        st.markdown("### Quiz Settings")
+        num_q = st.selectbox("Number of Questions", [3,5,10,15], index=1)
+        topic = " ".join(st.text_input("Topic (optional)", key="quiz_topic", placeholder="e.g., Cell respiration").split())
+        handle = st.session_state.quiz_content
+        document = handle["id"] if isinstance(handle, dict) else ""
+        use_bank = st.checkbox("🏦 Use questions I haven't seen from the bank for these notes", value=True,
+                               key="quiz_bank", disabled=not document)
+        banked, seen = get_document_bank().coverage(job_owner(), document, topic) if document else (0, 0)
+        if banked:
+            st.caption(f"The bank holds {banked} questions for these notes{' on this topic' if topic else ''}; "
+                       f"you have seen {seen}.")
+        
+        if st.button("Generate Quiz", type="primary"):
+            try:
+                with document_text(st.session_state.get('quiz_content', '')) as text:
+                    content, before, after = compress_notes(text)
+            except UploadError as e:
+                st.error(f"❌ {e}")
+            else:
+                content = ''.join(c for c in content[:3000] if c.isprintable() or c in '\n\r\t')[:3000]
+                user_prompt = format_user_prompt("quiz", num=num_q, content=content)
+                job_prompt = f"{user_prompt}\n{topic_key(topic)}|{use_bank}"
+                start_job("quiz", partial(
+                    run_bank_quiz, provider, content, num_q, get_document_bank(), job_owner(), document,
+                    topic=topic, use_bank=use_bank, compression=[before, after],
+                    cite=source_citer(st.session_state.quiz_content)
+                ), QUIZ_SYSTEM, job_prompt)
+        
+        result = job_result("quiz", "Generating...")
+        if result:
+            dismiss_job("quiz")
+            st.session_state.quiz_data = result["data"]
+            st.session_state.quiz_reused = result["reused"]
+            st.session_state.quiz_banked = result.get("banked")
+            st.session_state.quiz_step = 'play'
+            st.session_state.quiz_timing = None
+            st.session_state.quiz_answers = {}
+            st.session_state.quiz_submitted = False
+            st.rerun()
+    
+    else:
+        st.session_state.quiz_step = 'menu'
+        st.rerun()
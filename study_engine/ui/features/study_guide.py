@@ -0,0 +1,130 @@
+"""
+Study guide generator page.
+"""
+
+from functools import partial
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.compression import compress_notes
+from study_engine.config import CONTEXT_TOKEN_BUDGET
+from study_engine.generation import GUIDE_SECTIONS, run_study_guide_outline, run_study_guide_section
+from study_engine.prompts import STUDY_GUIDE_SYSTEM, format_user_prompt
+from study_engine.retrieval import select_passages
+from study_engine.ui.components import attached_job, dismiss_job, job_result, show_generation_notes, start_job
+from study_engine.ui.resources import get_artifact_store
+
+
+def guide_section(provider: AIProvider, outline: dict, section: str) -> dict:
+    """A lazily generated section of the current guide; starts its job the first time it is needed."""
+    sections = st.session_state.setdefault("guide_sections", {})
+    if section in sections:
+        return sections[section]
+    feature = f"study_guide_{section}"
+    job = attached_job(feature)
+    if job and job["status"] == "done" and job["result"]["guide_id"] != outline["guide_id"]:
+        dismiss_job(feature)
+        job = None
+    if not job:
+        source = st.session_state.guide_source
+        start_job(feature, partial(
+            run_study_guide_section, provider, section, source["subject"], source["content"], outline,
+            get_artifact_store()
+        ), STUDY_GUIDE_SYSTEM, f"{outline['guide_id']}:{section}")
+    result = job_result(feature, f"Writing the {section}...")
+    if result:
+        dismiss_job(feature)
+        sections[section] = result["data"]
+    return sections.get(section)
+
+
+def render_study_guide(provider: AIProvider, data: dict):
+    st.success(f"✅ Generated: {data.get('title', 'Study Guide')}")
+    
+    # Only the open tab runs, so the lazy sections are generated when their tab is first opened.
+    tabs = st.tabs(
+        ["📋 Outline", "📝 Summary", "🎯 Key Takeaways", "📊 Key Topics", "💡 Facts"],
+        key="guide_tab", on_change="rerun"
+    )
+    
+    with tabs[0]:
+        if tabs[0].open and "outlines" in data:
+            for outline in data["outlines"]:
+                with st.expander(f"📌 {outline['title']}"):
+                    st.write(outline.get('content', ''))
+                    if 'sub_items' in outline:
+                        for item in outline['sub_items']:
+                            st.markdown(f"• {item}")
+    
+    with tabs[1]:
+        if tabs[1].open:
+            section = guide_section(provider, data, "summary")
+            if section:
+                st.markdown(section.get('summary', 'No summary available'))
+    
+    with tabs[2]:
+        if tabs[2].open:
+            section = guide_section(provider, data, "takeaways")
+            if section:
+                for takeaway in section.get("bullet_takeaways", []):
+                    st.markdown(f"✅ {takeaway}")
+    
+    with tabs[3]:
+        if tabs[3].open and "key_topics" in data:
+            for topic in data["key_topics"]:
+                importance = topic.get('importance', 'medium')
+                color = "#FF6B6B" if importance == "high" else "#FFB84D" if importance == "medium" else "#4ECDC4"
+                st.markdown(f"""
+                <span style="background: {color}; color: white; padding: 0.25rem 0.75rem; border-radius: 15px; margin-right: 0.5rem; display: inline-block; margin-bottom: 0.5rem;">
+                    {topic['topic']}
+                </span>
+                """, unsafe_allow_html=True)
+    
+    with tabs[4]:
+        if tabs[4].open:
+            section = guide_section(provider, data, "facts")
+            if section:
+                for fact in section.get("facts", []):
+                    st.info(f"💡 {fact['fact']}")
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">📖 Study Guide Generator</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Transform your notes into comprehensive study guides</p>', unsafe_allow_html=True)
+    
+    if not provider.is_configured():
+        st.error("❌ AI Provider not configured. Set GROQ_API_KEY environment variable.")
+    else:
+        subject = st.text_input("📚 Subject/Topic Name", placeholder="e.g., Biology, History, Physics")
+        key_topics = st.text_input("🎯 Key Topics (optional)", placeholder="e.g., cell division, mitosis, meiosis", key="guide_topics")
+        
+        content = st.text_area(
+            "📝 Enter your study content",
+            height=200,
+            placeholder="Paste your lecture notes, textbook content, or study material...",
+            key="guide_content"
+        )
+        
+        if st.button("📖 Generate Study Guide", disabled=not content or not subject):
+            notes, before, after = compress_notes(content)
+            passages, selected, total = select_passages(
+                notes, f"{subject} {key_topics}", token_budget=CONTEXT_TOKEN_BUDGET
+            )
+            user_prompt = format_user_prompt("study_guide_outline", subject=subject, content=passages)
+            st.session_state.guide_source = {"subject": subject, "content": passages}
+            st.session_state.guide_sections = {}
+            for section in GUIDE_SECTIONS:
+                dismiss_job(f"study_guide_{section}")
+            start_job("study_guide", partial(
+                run_study_guide_outline, provider, subject, passages, get_artifact_store(),
+                selection=[selected, total], compression=[before, after]
+            ), STUDY_GUIDE_SYSTEM, user_prompt)
+        
+        result = job_result("study_guide", "Creating the outline...")
+        if result and st.session_state.get("guide_source"):
+            try:
+                show_generation_notes(result, "a study guide")
+                render_study_guide(provider, result["data"])
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
@@ -0,0 +1,80 @@
+"""
+Study Pack page: every artifact type from one upload.
+"""
+
+from functools import partial
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.compression import compress_notes
+from study_engine.config import CONTEXT_TOKEN_BUDGET
+from study_engine.generation import run_study_pack
+from study_engine.prompts import STUDY_PACK_SYSTEM, format_user_prompt
+from study_engine.retrieval import select_passages
+from study_engine.ui.components import (
+    document_text, job_owner, job_result, show_generation_notes, spool_upload, start_job,
+)
+from study_engine.ui.resources import get_artifact_store, get_job_manager
+from study_engine.uploads import UploadError
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">📦 Study Pack</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Create a summary, flashcards, a quiz and a matching game from one upload in a single run</p>', unsafe_allow_html=True)
+    
+    if not provider.is_configured():
+        st.error("❌ AI Provider not configured. Set GROQ_API_KEY environment variable.")
+    else:
+        content = st.text_area(
+            "📝 Enter your study content",
+            height=150,
+            placeholder="Paste your notes, textbook content, or any study material here...",
+            key="pack_content"
+        )
+        
+        source = content
+        uploaded = st.file_uploader("Or upload file", type=['txt', 'pdf'], key="pack_file")
+        if uploaded:
+            try:
+                source = spool_upload(uploaded)
+                st.success(f"✅ Loaded {source['words']:,} words")
+            except Exception as e:
+                st.error(f"❌ Error reading file: {e}")
+        
+        c1, c2, c3 = st.columns(3)
+        num_cards = c1.number_input("Flashcards", min_value=1, max_value=10, value=5, key="pack_cards")
+        num_questions = c2.number_input("Quiz questions", min_value=1, max_value=10, value=5, key="pack_questions")
+        num_pairs = c3.number_input("Matching pairs", min_value=2, max_value=10, value=5, key="pack_pairs")
+        
+        if st.button("📦 Generate Study Pack", disabled=not source, type="primary"):
+            try:
+                with document_text(source) as text:
+                    notes, before, after = compress_notes(text)
+                    passages, selected, total = select_passages(notes, token_budget=CONTEXT_TOKEN_BUDGET)
+            except UploadError as e:
+                st.error(f"❌ {e}")
+            else:
+                task = partial(
+                    run_study_pack, provider, passages, num_cards, num_questions, num_pairs,
+                    store=get_artifact_store(), jobs=get_job_manager(), owner=job_owner(),
+                    compression=[before, after]
+                )
+                user_prompt = format_user_prompt(
+                    "study_pack", content=passages, num_cards=num_cards, num_questions=num_questions, num_pairs=num_pairs
+                )
+                start_job("study_pack", task, STUDY_PACK_SYSTEM, user_prompt)
+        
+        result = job_result("study_pack", "Creating your study pack...")
+        if result:
+            counts = result["counts"]
+            st.success("✅ Study pack ready! Open each page from the sidebar to study.")
+            c1, c2, c3 = st.columns(3)
+            c1.metric("🎴 Flashcards", counts["flashcards"])
+            c2.metric("❓ Quiz Questions", counts["quiz"])
+            c3.metric("🔗 Matching Pairs", counts["matching"])
+            if result["regenerated"]:
+                st.caption(f"Regenerated separately: {', '.join(result['regenerated'])}")
+            for feature, error in (result.get("failed") or {}).items():
+                st.warning(f"⚠️ The {feature} section could not be generated ({error}). Generate it from its own page.")
+            show_generation_notes(result, "a study pack")
@@ -0,0 +1,127 @@
+"""
+Notes summarization page.
+"""
+
+from functools import partial
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.compression import compress_notes
+from study_engine.generation import run_incremental_summary
+from study_engine.prompts import SUMMARY_SYSTEM, format_user_prompt
+from study_engine.ui.components import (
+    document_text, job_result, show_generation_notes, source_citer, spool_uploads, start_job,
+)
+from study_engine.ui.resources import get_artifact_store, get_upload_spool
+from study_engine.uploads import UploadError
+
+
+def render_summary(data: dict, original_words: int):
+    st.success("✅ Summary Generated!")
+    
+    st.markdown("### 📋 Overview")
+    st.markdown(f"""
+    <div style="background: #F5F0E8; padding: 1rem; border-radius: 10px; color: #2D2D2D;">
+        {data.get('overview', 'No overview available')}
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("### 🔑 Key Points")
+    for point in data.get('key_points', []):
+        st.markdown(f"• {point}")
+    
+    if data.get('terms'):
+        st.markdown("### 📚 Important Terms")
+        for term_item in data['terms']:
+            with st.expander(f"📖 {term_item.get('term', 'Term')}"):
+                st.write(term_item.get('definition', 'No definition'))
+                if term_item.get('source'):
+                    st.caption(f"📎 {term_item['source']}")
+    
+    st.markdown("### 🎯 Main Takeaways")
+    for i, takeaway in enumerate(data.get('takeaways', []), 1):
+        st.markdown(f"""
+        <div style="background: #E8F5E9; padding: 0.75rem; border-radius: 8px; margin-bottom: 0.5rem; border-left: 4px solid #4CAF50; color: #2D2D2D;">
+            <strong>{i}.</strong> {takeaway}
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Original Words", original_words)
+    with col2:
+        summary_text = data.get('overview', '') + ' '.join(data.get('key_points', []))
+        st.metric("Summary Words", len(summary_text.split()))
+    with col3:
+        reduction = int((1 - len(summary_text.split()) / max(original_words, 1)) * 100)
+        st.metric("Reduction", f"{reduction}%")
+
+
+def show(provider: AIProvider):
+    st.markdown('<p class="page-title">📝 Notes Summarization</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Create concise summaries from long study notes while preserving key concepts</p>', unsafe_allow_html=True)
+    
+    if not provider.is_configured():
+        st.error("❌ AI Provider not configured. Set GROQ_API_KEY environment variable.")
+    else:
+        input_method = st.radio("Input Method", ["📝 Paste Text", "📄 Upload File"], horizontal=True)
+        
+        source = ""
+        words = 0
+        
+        if input_method == "📝 Paste Text":
+            source = st.text_area(
+                "Paste your study notes here",
+                height=250,
+                placeholder="Paste your long study notes, lecture content, or any text you want to summarize...",
+                key="summary_content"
+            )
+            words = len(source.split())
+        else:
+            uploaded_files = st.file_uploader(
+                "Upload your notes", type=['txt', 'pdf'], accept_multiple_files=True, key="summary_file"
+            )
+            if uploaded_files:
+                try:
+                    source = spool_uploads(uploaded_files)
+                    words = source["words"]
+                    files = f" from {len(source['files'])} files" if len(source["files"]) > 1 else ""
+                    if source["pages"]:
+                        st.success(f"✅ Extracted {source['words']:,} words from {source['pages']} pages{files}")
+                    else:
+                        st.success(f"✅ Loaded {source['words']:,} words{files}")
+                    with st.expander("📄 Preview Content"):
+                        preview = get_upload_spool().preview(source)
+                        st.text(preview + "..." if source["bytes"] > len(preview) else preview)
+                except Exception as e:
+                    st.error(f"❌ Error reading file: {e}")
+        
+        if source:
+            st.info(f"📊 Word count: {words} words")
+        
+        reuse = st.checkbox("♻️ Reuse a summary from similar content", value=True, key="summary_reuse")
+        
+        if st.button("📝 Generate Summary", disabled=not source, type="primary"):
+            try:
+                with document_text(source) as text:
+                    notes, before, after = compress_notes(text)
+            except UploadError as e:
+                st.error(f"❌ {e}")
+            else:
+                clean_content = ''.join(c for c in notes if c.isprintable() or c in '\n\r\t')
+                user_prompt = format_user_prompt("summary", content=clean_content)
+                st.session_state.summary_words = words
+                start_job("summary", partial(
+                    run_incremental_summary, provider, clean_content, get_artifact_store(), reuse=reuse,
+                    compression=[before, after], cite=source_citer(source)
+                ), SUMMARY_SYSTEM, user_prompt)
+        
+        result = job_result("summary", "⏳ Analyzing and summarizing your notes...")
+        if result:
+            try:
+                show_generation_notes(result, "a summary")
+                render_summary(result["data"], result.get("original_words") or st.session_state.get("summary_words", 0))
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
@@ -0,0 +1,72 @@
+"""
+Admin page: token usage per user and model health.
+"""
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.ui.resources import admin_emails, daily_token_quota, get_usage_ledger
+
+
+def show(provider: AIProvider):
+    if st.session_state.user_email.lower() not in admin_emails():
+        st.error("This page is only available to admins.")
+        return
+
+    st.markdown('<p class="page-title">📊 Usage</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Who is using the shared Groq quota</p>', unsafe_allow_html=True)
+
+    ledger = get_usage_ledger()
+    ledger.rollup()
+    days = st.selectbox("Period", [1, 7, 30], format_func=lambda d: "Today" if d == 1 else f"Last {d} days")
+
+    quota = daily_token_quota()
+    st.caption(f"Daily quota per user: {quota:,} tokens" if quota else "Daily quota: unlimited")
+
+    totals = ledger.daily_totals(days)
+    c1, c2 = st.columns(2)
+    c1.metric("Requests", f"{sum(r[1] for r in totals):,}")
+    c2.metric("Tokens", f"{sum(r[2] for r in totals):,}")
+
+    st.markdown("### 🏆 Top Consumers")
+    rows = ledger.top_consumers(days)
+    if rows:
+        st.dataframe([
+            {"User": owner, "Requests": requests, "Prompt tokens": prompt,
+             "Completion tokens": completion, "Total tokens": total}
+            for owner, requests, prompt, completion, total in rows
+        ], use_container_width=True, hide_index=True)
+    else:
+        st.info("No usage recorded for this period yet.")
+
+    if days > 1 and totals:
+        st.markdown("### 📅 Tokens per Day")
+        st.bar_chart({"Tokens": {day: tokens for day, _, tokens in totals}})
+
+    st.markdown("### 🩺 Model Health")
+    st.dataframe([
+        {"Model": model, "Tier": s["tier"], "Requests": s["requests"], "p95 latency (s)": round(s["p95_latency"], 2),
+         "Error rate": f"{s['error_rate']:.0%}", "Parse failures": f"{s['parse_failure_rate']:.0%}",
+         "Rerouted for (s)": int(s["rerouted_for"])}
+        for model, s in provider.router.snapshot().items()
+    ], use_container_width=True, hide_index=True)
+    st.caption("Rolling statistics for this server process.")
+
+    st.markdown("### 🔀 Providers")
+    pool = provider.pool
+    st.caption("Hedging is on" if pool.hedge else "Hedging is off (set HEDGE_REQUESTS=1 to turn it on)")
+    st.dataframe([
+        {"Endpoint": name, "Circuit": s["state"], "Requests": s["requests"], "Failures": s["failures"],
+         "Wins": s["wins"], "Hedges sent": s["hedges"], "Hedge wins": s["hedge_wins"],
+         "Hedge after (s)": round(s["hedge_after"], 2)}
+        for name, s in pool.snapshot().items()
+    ], use_container_width=True, hide_index=True)
+    races = ledger.race_summary(days)
+    if races:
+        st.dataframe([
+            {"Primary": primary, "Answered by": winner, "Requests": requests, "Hedged": hedged,
+             "Avg first token (s)": round(first_token / 1000, 2), "Avg latency (s)": round(latency / 1000, 2),
+             "Max latency (s)": round(worst / 1000, 2)}
+            for primary, winner, requests, hedged, first_token, latency, worst in races
+        ], use_container_width=True, hide_index=True)
+
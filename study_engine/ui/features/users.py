@@ -0,0 +1,47 @@
+"""
+Admin page: registered accounts, a page at a time, with prefix search.
+"""
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.db import count_users, list_users
+from study_engine.ui.resources import admin_emails
+
+
+def show(provider: AIProvider):
+    if st.session_state.user_email.lower() not in admin_emails():
+        st.error("This page is only available to admins.")
+        return
+
+    st.markdown('<p class="page-title">👥 Users</p>', unsafe_allow_html=True)
+    st.markdown('<p class="page-desc">Registered accounts, newest first</p>', unsafe_allow_html=True)
+
+    c1, c2 = st.columns([3, 1])
+    query = c1.text_input("Search", placeholder="Start of an email or name", key="users_query").strip()
+    field = c2.radio("Search by", ["Email", "Name"], horizontal=True, key="users_field").lower()
+
+    # Cursors of the pages before the current one; a new search starts again at the first page.
+    if st.session_state.get("users_search") != [query, field]:
+        st.session_state.users_search = [query, field]
+        st.session_state.users_pages = [None]
+    pages = st.session_state.users_pages
+    users, next_cursor = list_users(query, field, pages[-1])
+
+    total = count_users()
+    st.caption(f"{count_users(query, field):,} of {total:,} users match" if query else f"{total:,} users")
+    if users:
+        st.dataframe([
+            {"ID": u["id"], "Email": u["email"], "Name": u["name"], "Joined": u["created_at"]} for u in users
+        ], use_container_width=True, hide_index=True)
+    else:
+        st.info("No users match this search.")
+
+    c1, c2, c3 = st.columns([1, 2, 1])
+    if c1.button("← Previous", disabled=len(pages) == 1, key="users_prev"):
+        pages.pop()
+        st.rerun()
+    c2.caption(f"Page {len(pages)}")
+    if c3.button("Next →", disabled=next_cursor is None, key="users_next"):
+        pages.append(next_cursor)
+        st.rerun()
@@ -0,0 +1,76 @@
+"""
+Main app shell: sidebar navigation and lazily imported feature pages.
+"""
+
+import importlib
+
+import streamlit as st
+
+from study_engine.ai import AIProvider
+from study_engine.ui.components import job_owner
+from study_engine.ui.resources import (
+    admin_emails, daily_token_quota, get_model_router, get_provider_pool, get_rate_limiter, get_usage_ledger,
+)
+from study_engine.ui.session import end_session
+
+PAGES = {
+    "🏠 Home": "home",
+    "📦 Study Pack": "study_pack",
+    "🎴 Flashcards": "flashcards",
+    "❓ Quiz": "quiz",
+    "🔗 Matching": "matching",
+    "📝 Notes Summary": "summary",
+    "📖 Study Guide": "study_guide",
+    "✅ Evaluation": "evaluation",
+    "📈 Progress": "progress",
+    "📤 Export": "export",
+}
+ADMIN_PAGES = {
+    "📊 Usage": "usage",
+    "🧠 Memory": "memory",
+    "👥 Users": "users",
+}
+
+
+def show_main_app():
+    provider = AIProvider(
+        rate_limiter=get_rate_limiter(), router=get_model_router(),
+        ledger=get_usage_ledger(), owner=job_owner(), daily_quota=daily_token_quota(),
+        pool=get_provider_pool()
+    )
+    pages = dict(PAGES)
+    if st.session_state.user_email.lower() in admin_emails():
+        pages.update(ADMIN_PAGES)
+    
+    with st.sidebar:
+        st.markdown("## 📚 Study Buddy")
+        if st.session_state.username:
+            st.markdown(f"👋 Hello, **{st.session_state.username}**!")
+        st.caption("AI-Powered Learning")
+        st.markdown("---")
+        
+        page = st.radio(
+            "Navigate",
+            list(pages),
+            label_visibility="collapsed"
+        )
+        
+        st.markdown("---")
+        st.markdown("### ⚙️ AI Provider")
+        if provider.is_configured():
+            st.success(f"✅ {provider.get_provider_name()}")
+        else:
+            st.error("❌ Not configured")
+            st.caption("Set GROQ_API_KEY or AI_ENDPOINTS")
+        
+        st.markdown("---")
+        if st.button("🚪 Logout", key="logout_btn"):
+            st.session_state.authenticated = False
+            st.session_state.username = ""
+            st.session_state.user_email = ""
+            st.session_state.current_page = "splash"
+            end_session()
+            st.rerun()
+    
+    # Only the open page's module is imported, so a cold start never pays for the others.
+    importlib.import_module(f"study_engine.ui.features.{pages[page]}").show(provider)
@@ -0,0 +1,255 @@
+"""
+Splash, onboarding and account pages shown before the main app.
+"""
+
+import streamlit as st
+
+from study_engine.db import add_user, get_user, hash_password
+from study_engine.ui.components import dots_indicator, robot_svg
+from study_engine.ui.session import resume_session
+
+
+ONBOARDING_STEPS = [
+    {
+        "title": "Turn your notes, lectures, or videos into flashcards, quizzes, study guides and fun study games.",
+        "features": ["📝 Notes", "🎴 Flashcards", "❓ Quizzes", "🎮 Games"]
+    },
+    {
+        "title": "How It Works",
+        "description": "Record or upload your lectures, and MyStudyBuddy will turn them into organized notes and study tools - instantly."
+    },
+    {
+        "title": "Why You'll Love It",
+        "description": "Study solo or play with friends — test your knowledge through games, track your friends, and make studying fun again."
+    }
+]
+
+
+def show_splash():
+    st.markdown("<br><br><br>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown(robot_svg(150), unsafe_allow_html=True)
+        st.markdown('<h1 class="main-title">My Study Buddy</h1>', unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.button("🚀 Get Started", key="splash_start"):
+            st.session_state.current_page = "onboarding"
+            st.rerun()
+
+
+def show_onboarding():
+    step = st.session_state.onboarding_step
+    
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        st.markdown(robot_svg(100), unsafe_allow_html=True)
+        
+        content = ONBOARDING_STEPS[step]
+        
+        st.markdown(f'<p class="onboarding-title">{content["title"]}</p>', unsafe_allow_html=True)
+        
+        if "description" in content:
+            st.markdown(f'<p class="onboarding-text">{content["description"]}</p>', unsafe_allow_html=True)
+        
+        if "features" in content:
+            fcols = st.columns(4)
+            for i, feat in enumerate(content["features"]):
+                with fcols[i]:
+                    st.markdown(f"""
+                    <div style="background: #F5F0E8; padding: 0.5rem; border-radius: 8px; text-align: center; font-size: 0.8rem; color: #2D2D2D;">
+                        {feat}
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        st.markdown(dots_indicator(step, len(ONBOARDING_STEPS)), unsafe_allow_html=True)
+        
+        col_skip, col_next = st.columns(2)
+        
+        with col_skip:
+            if st.button("Skip", key="skip_onboarding"):
+                st.session_state.onboarding_complete = True
+                st.session_state.current_page = "welcome"
+                st.rerun()
+        
+        with col_next:
+            btn_text = "Continue" if step < len(ONBOARDING_STEPS) - 1 else "Get Started"
+            if st.button(btn_text, key="next_onboarding"):
+                if step < len(ONBOARDING_STEPS) - 1:
+                    st.session_state.onboarding_step += 1
+                    st.rerun()
+                else:
+                    st.session_state.onboarding_complete = True
+                    st.session_state.current_page = "welcome"
+                    st.rerun()
+
+
+def show_welcome():
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        st.markdown("""
+        <div style="text-align: center;">
+            <h1 style="color: #2D2D2D; font-size: 2.5rem; margin-bottom: 0.5rem;">Welcome</h1>
+            <p style="color: #666666; font-size: 1rem;">Study Smarter, Not Harder.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(robot_svg(120), unsafe_allow_html=True)
+        
+        st.markdown("<p style='text-align: center; color: #666; font-size: 0.9rem;'>Let's Get Started!</p>", unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        col_signup, col_login = st.columns(2)
+        
+        with col_signup:
+            if st.button("📝 Sign Up", key="welcome_signup", use_container_width=True):
+                st.session_state.current_page = "signup"
+                st.rerun()
+        
+        with col_login:
+            if st.button("🔑 Log In", key="welcome_login", use_container_width=True):
+                st.session_state.current_page = "login"
+                st.rerun()
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        st.markdown("""
+        <p style="text-align: center; color: #888; font-size: 0.85rem;">
+            By continuing, you agree to our <a href="#" style="color: #6B5CA5;">Terms</a> and <a href="#" style="color: #6B5CA5;">Privacy Policy</a>.
+        </p>
+        """, unsafe_allow_html=True)
+
+
+def show_login():
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        st.markdown(robot_svg(80), unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div style="text-align: center;">
+            <h2 style="color: #2D2D2D;">Welcome Back!</h2>
+            <p style="color: #666666; font-size: 0.9rem;">Sign in to your account</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<p class="section-header">Log into your account</p>', unsafe_allow_html=True)
+        
+        email = st.text_input("Email", placeholder="example@gmail.com", key="login_email")
+        password = st.text_input("Password", type="password", placeholder="••••••••", key="login_password")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        if st.button("Log In", key="login_btn"):
+            if email and password:
+                hashed = hash_password(password)
+                user = get_user(email)
+                if user and user["password"] == hashed:
+                    st.session_state.authenticated = True
+                    st.session_state.username = user["name"]
+                    st.session_state.user_email = email
+                    resume_session(email)
+                    st.session_state.current_page = "app"
+                    st.rerun()
+                else:
+                    st.error("Invalid email or password")
+            else:
+                st.warning("Please fill in all fields")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        col_a, col_b = st.columns(2)
+        with col_a:
+            if st.button("Forgot Password?", key="forgot_btn"):
+                st.info("Password reset feature coming soon!")
+        with col_b:
+            if st.button("Create Account", key="to_signup"):
+                st.session_state.current_page = "signup"
+                st.rerun()
+
+
+def show_signup():
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        st.markdown(robot_svg(80), unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div style="text-align: center;">
+            <h2 style="color: #2D2D2D;"><span style="color: #6B5CA5;">Sign</span> up for your account</h2>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_fn, col_ln = st.columns(2)
+        with col_fn:
+            first_name = st.text_input("First Name", placeholder="Your Name", key="signup_fname")
+        with col_ln:
+            last_name = st.text_input("Last Name", placeholder="Your Name", key="signup_lname")
+        
+        email = st.text_input("Email", placeholder="example@gmail.com", key="signup_email")
+        password = st.text_input("Password", type="password", placeholder="abc12345", key="signup_password")
+        confirm_password = st.text_input("Re-type Password", type="password", placeholder="abc12345", key="signup_confirm")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        if st.button("Sign Up", key="signup_btn"):
+            if first_name and last_name and email and password and confirm_password:
+                if password != confirm_password:
+                    st.error("Passwords do not match")
+                elif len(password) < 6:
+                    st.error("Password must be at least 6 characters")
+                else:
+                    hashed = hash_password(password)
+                    if add_user(email, f"{first_name} {last_name}", hashed):
+                        st.session_state.authenticated = True
+                        st.session_state.username = f"{first_name} {last_name}"
+                        st.session_state.user_email = email
+                        st.session_state.current_page = "name_prompt"
+                        st.rerun()
+                    else:
+                        st.error("Email already registered")
+            else:
+                st.warning("Please fill in all fields")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        st.markdown("""
+        <p style="text-align: center; color: #888; font-size: 0.85rem;">
+            Already have an account?
+        </p>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Log In", key="to_login"):
+            st.session_state.current_page = "login"
+            st.rerun()
+
+
+def show_name_prompt():
+    st.markdown("<br><br><br>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        st.markdown(robot_svg(100), unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div style="text-align: center;">
+            <h2 style="color: #2D2D2D;">My Study Buddy</h2>
+            <p style="color: #666666;">What should I call you?</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        nickname = st.text_input("", placeholder="Enter your nickname", key="nickname_input", label_visibility="collapsed")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        if st.button("Continue", key="name_continue"):
+            if nickname:
+                st.session_state.username = nickname
+            st.session_state.current_page = "app"
+            st.rerun()
@@ -0,0 +1,129 @@
+"""
+Process-wide resources, created once per server process and shared by all
+sessions and reruns.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import streamlit as st
+
+from study_engine.artifacts import ArtifactStore
+from study_engine.attempts import AttemptStore
+from study_engine.config import database, db_path, load_env
+from study_engine.db import init_database
+from study_engine.jobs import JobManager
+from study_engine.kvstore import KeyValueStore, open_store
+from study_engine.providers import ProviderPool, default_pool
+from study_engine.question_banks import DocumentQuestionBank, QuestionBankStore
+from study_engine.ratelimit import RateLimiter
+from study_engine.routing import ModelRouter
+from study_engine.session_memory import SessionMeter
+from study_engine.uploads import HTTPBlobStore, UploadSpool
+from study_engine.usage import UsageLedger
+
+
+@st.cache_resource(show_spinner=False)
+def init_app() -> bool:
+    """One-time startup: load settings and create the user table."""
+    load_env()
+    init_database()
+    return True
+
+
+@st.cache_resource(show_spinner=False)
+def get_state_store() -> KeyValueStore:
+    """Store for session, job and rate-limit state; shared between replicas via STATE_STORE_URL."""
+    return open_store(os.getenv("STATE_STORE_URL"), db_path())
+
+
+@st.cache_resource(show_spinner=False)
+def get_rate_limiter() -> RateLimiter:
+    """Deployment-wide limit on Groq requests."""
+    return RateLimiter(get_state_store(), "groq", float(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30")))
+
+
+@st.cache_resource(show_spinner=False)
+def get_model_router() -> ModelRouter:
+    """Per-process model routing, so latency and failure statistics survive reruns."""
+    return ModelRouter()
+
+
+@st.cache_resource(show_spinner=False)
+def get_provider_pool() -> ProviderPool:
+    """Per-process endpoint pool, so circuit breakers and first-token timings survive reruns."""
+    return default_pool()
+
+
+@st.cache_resource(show_spinner=False)
+def get_usage_ledger() -> UsageLedger:
+    """Shared token-usage ledger; rolls up daily totals in the background."""
+    ledger = UsageLedger(database())
+    ledger.start_rollups()
+    return ledger
+
+
+def daily_token_quota() -> int:
+    """Tokens each user may spend per day; 0 disables the quota."""
+    return int(os.getenv("DAILY_TOKEN_QUOTA", "200000"))
+
+
+def export_url() -> str:
+    """Base URL of the export server (study_engine.exportserver), or "" to build downloads in the app."""
+    return os.getenv("EXPORT_URL", "").rstrip("/")
+
+
+def admin_emails() -> set:
+    """Accounts allowed to see the admin pages, from ADMIN_EMAILS."""
+    return {e.strip().lower() for e in os.getenv("ADMIN_EMAILS", "").split(",") if e.strip()}
+
+
+@st.cache_resource(show_spinner=False)
+def get_upload_spool() -> UploadSpool:
+    """Disk spool for uploads, with memory caps on the text loaded from it; shared between hosts via UPLOAD_STORE_URL."""
+    spool = UploadSpool(
+        os.getenv("UPLOAD_SPOOL_DIR") or Path(tempfile.gettempdir()) / "study_engine_uploads",
+        per_session_bytes=int(float(os.getenv("UPLOAD_SESSION_MAX_MB", "20")) * 1_000_000),
+        total_bytes=int(float(os.getenv("UPLOAD_TOTAL_MAX_MB", "200")) * 1_000_000),
+        pdf_workers=int(os.getenv("UPLOAD_PDF_WORKERS", "2")),
+        shared=HTTPBlobStore(os.getenv("UPLOAD_STORE_URL")) if os.getenv("UPLOAD_STORE_URL") else None,
+    )
+    spool.cleanup()
+    return spool
+
+
+@st.cache_resource(show_spinner=False)
+def get_session_meter() -> SessionMeter:
+    """Per-process record of how much memory each session's state takes."""
+    return SessionMeter()
+
+
+@st.cache_resource(show_spinner=False)
+def get_artifact_store() -> ArtifactStore:
+    """Shared artifact store used to reuse results for near-duplicate content."""
+    return ArtifactStore(database())
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_bank_store() -> QuestionBankStore:
+    """Shared store for imported question banks."""
+    return QuestionBankStore(database())
+
+
+@st.cache_resource(show_spinner=False)
+def get_document_bank() -> DocumentQuestionBank:
+    """Shared bank of generated quiz questions per source document."""
+    return DocumentQuestionBank(database())
+
+
+@st.cache_resource(show_spinner=False)
+def get_attempt_store() -> AttemptStore:
+    """Shared store of quiz attempts and progress totals."""
+    return AttemptStore(database())
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_manager() -> JobManager:
+    """Shared worker pool that runs generation jobs outside of script reruns."""
+    return JobManager(get_state_store(), max_workers=int(os.getenv("JOB_WORKERS", "4")))
@@ -0,0 +1,196 @@
+"""
+Per-session defaults and snapshots that let any replica resume a session.
+"""
+
+import hashlib
+import json
+import os
+import secrets
+import time
+
+import streamlit as st
+
+from study_engine.session_memory import approx_size
+from study_engine.ui.resources import get_session_meter, get_state_store
+
+SESSION_TTL_SECONDS = 7 * 24 * 3600
+IDLE_CHECK_SECONDS = 60
+SPILL_MIN_BYTES = 8 * 1024
+# Sign-in state is never part of a snapshot: the sid in a shared or bookmarked
+# URL must not log anyone in.
+SESSION_KEYS = [
+    "onboarding_complete", "onboarding_step", "current_page",
+    "quiz_step", "quiz_data", "quiz_answers", "quiz_submitted", "quiz_content", "quiz_reused", "custom_questions",
+    "quiz_banked", "quiz_timing", "guide_source", "guide_sections", "spilled_keys",
+]
+# Bookkeeping that must stay in memory for spilling and snapshots to work.
+RESIDENT_KEYS = {"session_token", "session_saved", "spilled_keys", "spilled_bytes", "last_active", "pending_session"}
+
+
+def init_session():
+    """Set session defaults and reattach to a saved session if there is one."""
+    if 'authenticated' not in st.session_state:
+        st.session_state.authenticated = False
+    if 'username' not in st.session_state:
+        st.session_state.username = ""
+    if 'onboarding_complete' not in st.session_state:
+        st.session_state.onboarding_complete = False
+    if 'onboarding_step' not in st.session_state:
+        st.session_state.onboarding_step = 0
+    if 'user_email' not in st.session_state:
+        st.session_state.user_email = ""
+    if 'current_page' not in st.session_state:
+        st.session_state.current_page = "splash"
+    restore_session()
+    restore_spilled()
+
+
+def session_snapshot() -> dict:
+    """Session values that let any replica resume this session, with the account they belong to."""
+    state = st.session_state
+    snapshot = {k: state[k] for k in state if k in SESSION_KEYS or str(k).endswith("_job_id")}
+    snapshot["session_owner"] = state.get("user_email", "").lower() if state.get("authenticated") else ""
+    return snapshot
+
+
+def _apply(snapshot: dict):
+    for key, value in snapshot.items():
+        st.session_state[key] = _decode(key, value)
+
+
+def _decode(key: str, value):
+    """Undo what the JSON round trip changed: quiz answers are keyed by int question id."""
+    if key == "quiz_answers" and isinstance(value, dict):
+        return {int(k) if str(k).isdigit() else k: v for k, v in value.items()}
+    return value
+
+
+def restore_session():
+    """
+    Reattach to a saved session named by the sid query parameter, once per
+    session. A signed-out session is resumed at once; one that belonged to
+    an account is held until that account signs in again (see resume_session).
+    """
+    if st.session_state.get("session_token"):
+        return
+    token = st.query_params.get("sid")
+    snapshot = get_state_store().get(f"session:{token}") if token else None
+    if snapshot and snapshot.get("session_owner"):
+        st.session_state.pending_session = {"token": token, "snapshot": snapshot}
+        snapshot = None
+        token = None
+        st.session_state.current_page = "login"
+    if snapshot:
+        snapshot.pop("session_owner", None)
+        _apply(snapshot)
+    else:
+        token = secrets.token_urlsafe(24)
+    st.session_state.session_token = token
+    st.session_state.session_saved = _digest(session_snapshot()) if snapshot else ""
+    st.query_params["sid"] = token
+
+
+def resume_session(email: str):
+    """
+    After a sign-in, continue the saved session from the URL if it belongs to
+    this account; otherwise it is dropped and the fresh session is kept.
+    """
+    pending = st.session_state.pop("pending_session", None)
+    if not pending or pending["snapshot"].get("session_owner") != email.lower():
+        return
+    store = get_state_store()
+    store.delete(f"session:{st.session_state.session_token}")
+    get_session_meter().forget(st.session_state.session_token)
+    snapshot = dict(pending["snapshot"])
+    snapshot.pop("session_owner")
+    _apply(snapshot)
+    st.session_state.session_token = pending["token"]
+    st.session_state.session_saved = ""
+    st.query_params["sid"] = pending["token"]
+    restore_spilled()
+
+
+def _digest(snapshot: dict) -> str:
+    return hashlib.sha1(json.dumps(snapshot, sort_keys=True).encode()).hexdigest()
+
+
+def persist_session():
+    """Save the session snapshot to the shared store when it has changed."""
+    snapshot = session_snapshot()
+    digest = _digest(snapshot)
+    if digest != st.session_state.session_saved:
+        get_state_store().set(f"session:{st.session_state.session_token}", snapshot, ttl=SESSION_TTL_SECONDS)
+        st.session_state.session_saved = digest
+
+
+def end_session():
+    """Drop the saved session and start a fresh one."""
+    get_state_store().delete(f"session:{st.session_state.session_token}")
+    get_session_meter().forget(st.session_state.session_token)
+    st.session_state.session_token = secrets.token_urlsafe(24)
+    st.session_state.session_saved = ""
+    st.query_params["sid"] = st.session_state.session_token
+
+
+def idle_seconds() -> float:
+    """Seconds without activity before a session's large values are moved out of memory."""
+    return float(os.getenv("SESSION_IDLE_SECONDS", "600"))
+
+
+def restore_spilled():
+    """Bring back values spilled while the session was idle; runs at the start of every full run."""
+    st.session_state.last_active = time.time()
+    spilled = st.session_state.get("spilled_keys")
+    if not spilled:
+        return
+    store = get_state_store()
+    token = st.session_state.session_token
+    for key in spilled:
+        value = store.get(f"spill:{token}:{key}")
+        if value is not None and key not in st.session_state:
+            st.session_state[key] = _decode(key, value)
+        store.delete(f"spill:{token}:{key}")
+    st.session_state.spilled_keys = []
+    st.session_state.spilled_bytes = 0
+
+
+def spill_idle_state():
+    """Move large values of an idle session to the shared store until it is used again."""
+    store = get_state_store()
+    token = st.session_state.session_token
+    spilled = list(st.session_state.get("spilled_keys") or [])
+    released = 0
+    for key in list(st.session_state):
+        if key in RESIDENT_KEYS:
+            continue
+        value = st.session_state[key]
+        size = approx_size(value)
+        if size < SPILL_MIN_BYTES:
+            continue
+        try:
+            store.set(f"spill:{token}:{key}", value, ttl=SESSION_TTL_SECONDS)
+        except (TypeError, ValueError):
+            continue
+        del st.session_state[key]
+        spilled.append(key)
+        released += size
+    st.session_state.spilled_keys = spilled
+    st.session_state.spilled_bytes = st.session_state.get("spilled_bytes", 0) + released
+
+
+def account_session():
+    """Send this session's approximate state size to the process-wide meter."""
+    state = st.session_state
+    sizes = {str(key): approx_size(state[key]) for key in state}
+    get_session_meter().report(
+        state.session_token, state.get("user_email") or "(signed out)", sizes,
+        state.get("spilled_bytes", 0), state.get("last_active", time.time())
+    )
+
+
+@st.fragment(run_every=IDLE_CHECK_SECONDS)
+def idle_watch():
+    """Reruns on its own while the tab is open, so idle sessions give their memory back."""
+    if time.time() - st.session_state.get("last_active", time.time()) >= idle_seconds():
+        spill_idle_state()
+    account_session()
@@ -0,0 +1,306 @@
+"""
+Global CSS for the app.
+"""
+
+import streamlit as st
+
+APP_CSS = """
+<style>
+    /* Main background */
+    .stApp { 
+        background-color:
+    }
+    
+    .main .block-container { 
+        padding-top: 2rem; 
+        max-width: 1200px; 
+    }
+    
+    /* ALL TEXT IN MAIN AREA - DARK */
+    .main h1, .main h2, .main h3, .main h4, .main h5, .main h6 {
+        color:
+    }
+    
+    .main p, .main span, .main label, .main div {
+        color:
+    }
+    
+    /* Markdown text */
+    .stMarkdown, .stMarkdown p, .stMarkdown span {
+        color:
+    }
+    
+    /* Headers */
+    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
+        color:
+    }
+    
+    /* Text area labels */
+    .stTextArea label, .stTextInput label, .stSelectbox label {
+        color:
+        font-weight: 600 !important;
+    }
+    
+    /* Text area placeholder */
+    .stTextArea textarea::placeholder {
+        color:
+    }
+    
+    /* Text inside text areas */
+    .stTextArea textarea, .stTextInput input {
+        color:
+        background-color: white !important;
+    }
+    
+    /* Selectbox */
+    .stSelectbox > div > div {
+        color:
+        background-color: white !important;
+    }
+    
+    /* Purple buttons */
+    .stButton > button {
+        background: linear-gradient(135deg,
+        color: white !important;
+        border: none !important;
+        border-radius: 12px !important;
+        padding: 0.75rem 2rem !important;
+        font-weight: 600 !important;
+        width: 100%;
+    }
+    
+    .stButton > button:hover {
+        background: linear-gradient(135deg,
+        color: white !important;
+    }
+    
+    /* Feature boxes */
+    .feature-box {
+        background: white !important;
+        padding: 1.5rem;
+        border-radius: 12px;
+        border: 1px solid
+        margin-bottom: 1rem;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+    }
+    
+    .feature-box h4 {
+        color:
+        margin-bottom: 0.5rem;
+        font-size: 1.1rem;
+    }
+    
+    .feature-box p {
+        color:
+        margin: 0;
+        font-size: 0.95rem;
+    }
+    
+    /* Main title styling */
+    .main-title {
+        text-align: center;
+        color:
+        font-size: 2.5rem;
+        margin-bottom: 0.5rem;
+    }
+    
+    .sub-title {
+        text-align: center;
+        color:
+        font-size: 1.1rem;
+        margin-bottom: 2rem;
+    }
+    
+    /* Page titles */
+    .page-title {
+        color:
+        font-size: 1.8rem;
+        font-weight: 600;
+        margin-bottom: 0.5rem;
+    }
+    
+    .page-desc {
+        color:
+        font-size: 1rem;
+        margin-bottom: 1.5rem;
+    }
+    
+    /* Section headers */
+    .section-header {
+        color:
+        font-weight: 600;
+        font-size: 1.1rem;
+        margin: 1rem 0 0.5rem 0;
+    }
+    
+    /* Tabs styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        color:
+        background-color: white !important;
+        border-radius: 8px !important;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background-color:
+        color: white !important;
+    }
+    
+    /* Expanders */
+    .streamlit-expanderHeader {
+        color:
+        background-color:
+        font-weight: 600;
+    }
+    
+    .streamlit-expanderContent {
+        color:
+    }
+    
+    /* Metrics */
+    [data-testid="stMetricValue"] {
+        color:
+    }
+    
+    [data-testid="stMetricLabel"] {
+        color:
+    }
+    
+    /* Radio buttons */
+    .stRadio > label {
+        color:
+        font-weight: 600 !important;
+    }
+    
+    .stRadio > div {
+        color:
+    }
+    
+    /* Number input */
+    .stNumberInput label {
+        color:
+        font-weight: 600 !important;
+    }
+    
+    .stNumberInput input {
+        color:
+        background-color: white !important;
+    }
+    
+    /* Alerts/info boxes */
+    .stAlert {
+        color:
+    }
+    
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background-color:
+    }
+    
+    [data-testid="stSidebar"] * {
+        color:
+    }
+    
+    /* Hide default elements */
+    footer {visibility: hidden;}
+    
+    /* Spinner text */
+    .stSpinner > div {
+        color:
+    }
+    
+    /* Onboarding card */
+    .onboarding-card {
+        background: white;
+        border-radius: 20px;
+        padding: 2rem;
+        text-align: center;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+        max-width: 400px;
+        margin: 0 auto;
+    }
+    
+    .onboarding-title {
+        color:
+        font-size: 1.3rem;
+        font-weight: 600;
+        margin: 1rem 0;
+    }
+    
+    .onboarding-text {
+        color:
+        font-size: 0.95rem;
+        margin-bottom: 1.5rem;
+    }
+    
+    /* Auth card */
+    .auth-card {
+        background: white;
+        border-radius: 20px;
+        padding: 2rem;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+        max-width: 400px;
+        margin: 0 auto;
+    }
+    
+    .auth-title {
+        color:
+        font-size: 1.5rem;
+        font-weight: 600;
+        text-align: center;
+        margin-bottom: 0.5rem;
+    }
+    
+    .auth-subtitle {
+        color:
+        font-size: 0.9rem;
+        text-align: center;
+        margin-bottom: 1.5rem;
+    }
+    
+    /* Welcome badge */
+    .welcome-badge {
+        background: linear-gradient(135deg,
+        color: white !important;
+        padding: 0.5rem 1rem;
+        border-radius: 20px;
+        font-size: 0.85rem;
+        display: inline-block;
+        margin-bottom: 1rem;
+    }
+    
+    /* Skip button */
+    .skip-btn {
+        color:
+        font-size: 0.9rem;
+        text-decoration: underline;
+        cursor: pointer;
+    }
+    
+    /* Dots indicator */
+    .dots-container {
+        display: flex;
+        justify-content: center;
+        gap: 8px;
+        margin: 1rem 0;
+    }
+    
+    .dot {
+        width: 8px;
+        height: 8px;
+        border-radius: 50%;
+        background-color:
+    }
+    
+    .dot.active {
+        background-color:
+    }
+</style>
+"""
+
+
+def inject_styles():
+    st.markdown(APP_CSS, unsafe_allow_html=True)
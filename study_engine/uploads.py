@@ -0,0 +1,350 @@
+"""
+Disk spooling for uploaded documents with bounded memory use.
+
+An upload is streamed to a spool directory under its content hash and its
+text is extracted next to it: text files are memory-mapped and decoded
+incrementally, PDFs are parsed from the spooled file page by page, in a
+process pool when one is configured so several uploads are parsed in
+parallel. Only uploads of the same content wait for each other. Sessions
+keep only a small handle; the text is loaded for the few moments a prompt
+is being built, under a per-session and a process-wide memory budget.
+
+The spool directory is a per-host cache. With a shared store
+(HTTPBlobStore, UPLOAD_STORE_URL), every spooled text, page count and
+metadata file is also copied there, and a host that does not have a file
+yet fetches it on first use, so sessions can move between replicas on
+different hosts.
+"""
+
+import codecs
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from study_engine.compression import PAGE_BREAK
+
+CHUNK_BYTES = 1 << 20
+SPOOL_TTL_SECONDS = 24 * 3600
+
+
+class UploadError(RuntimeError):
+    pass
+
+
+class MemoryLimitExceeded(UploadError):
+    pass
+
+
+class MemoryBudget:
+    """Bytes of document text allowed in memory, per session and in total."""
+
+    def __init__(self, per_session: int, total: int):
+        self.per_session = per_session
+        self.total = total
+        self._used = 0
+        self._by_session = {}
+        self._cond = threading.Condition()
+
+    def acquire(self, session: str, size: int, timeout: float = 30.0):
+        """Reserve size bytes for session, waiting up to timeout for room in the total."""
+        if size > self.per_session:
+            raise MemoryLimitExceeded(
+                f"This document is too large to process ({size // 1_000_000} MB of text, "
+                f"limit {self.per_session // 1_000_000} MB)"
+            )
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if self._by_session.get(session, 0) + size > self.per_session:
+                raise MemoryLimitExceeded("Another document is still being processed in this session, please wait")
+            while self._used and self._used + size > self.total:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise MemoryLimitExceeded("The server is busy processing other documents, please try again")
+                self._cond.wait(remaining)
+            self._used += size
+            self._by_session[session] = self._by_session.get(session, 0) + size
+
+    def release(self, session: str, size: int):
+        with self._cond:
+            self._used -= size
+            left = self._by_session.get(session, 0) - size
+            if left > 0:
+                self._by_session[session] = left
+            else:
+                self._by_session.pop(session, None)
+            self._cond.notify_all()
+
+    def usage(self) -> dict:
+        with self._cond:
+            return {"total": self._used, "sessions": dict(self._by_session)}
+
+
+class HTTPBlobStore:
+    """Client for the shared upload store served by study_engine.dbserver."""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _url(self, name: str) -> str:
+        return f"{self.base_url}/blobs/{urllib.parse.quote(name, safe='')}"
+
+    def put(self, name: str, path: Path):
+        """Upload the file at path under name, streamed from disk."""
+        with open(path, "rb") as source:
+            request = urllib.request.Request(
+                self._url(name), data=source, method="PUT",
+                headers={"Content-Length": str(os.fstat(source.fileno()).st_size),
+                         "Content-Type": "application/octet-stream"}
+            )
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+
+    def fetch(self, name: str, target: Path) -> bool:
+        """Download name into target; False if the store does not have it."""
+        try:
+            with urllib.request.urlopen(self._url(name), timeout=self.timeout) as response, \
+                    open(target, "wb") as out:
+                for block in iter(lambda: response.read(CHUNK_BYTES), b""):
+                    out.write(block)
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return False
+            raise
+        return True
+
+
+def _decode_file(source: Path, target: Path):
+    """Write source's bytes to target as UTF-8, decoding a memory-mapped window at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    with open(source, "rb") as raw, open(target, "w", encoding="utf-8", newline="") as out:
+        if os.fstat(raw.fileno()).st_size == 0:
+            return
+        with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for start in range(0, len(view), CHUNK_BYTES):
+                out.write(decoder.decode(view[start:start + CHUNK_BYTES]))
+            out.write(decoder.decode(b"", final=True))
+
+
+def _extract_pdf(source: Path, target: Path) -> int:
+    import PyPDF2
+    reader = PyPDF2.PdfReader(str(source))
+    with open(target, "w", encoding="utf-8") as out:
+        for i, page in enumerate(reader.pages):
+            if i:
+                out.write(PAGE_BREAK)
+            out.write(page.extract_text() or "")
+    return len(reader.pages)
+
+
+class UploadSpool:
+    """Content-addressed spool of uploads and their extracted text."""
+
+    def __init__(self, root, per_session_bytes: int, total_bytes: int, pdf_workers: int = 0,
+                 shared: HTTPBlobStore = None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.budget = MemoryBudget(per_session_bytes, total_bytes)
+        self.pdf_workers = pdf_workers
+        self.shared = shared
+        self._pdf_pool = None
+        self._lock = threading.Lock()
+        self._digest_locks = {}
+
+    def _text_path(self, digest: str) -> Path:
+        return self.root / f"{digest}.txt"
+
+    def _pages_path(self, digest: str) -> Path:
+        return self.root / f"{digest}.pages.json"
+
+    def _staging(self, suffix: str = ".tmp") -> str:
+        """
+        A new, uniquely named file in the spool for output that is then moved
+        into place with os.replace, so concurrent writers never share one.
+        """
+        fd, path = tempfile.mkstemp(dir=self.root, suffix=suffix)
+        os.close(fd)
+        return path
+
+    def _publish(self, path: Path):
+        if self.shared:
+            self.shared.put(path.name, path)
+
+    def _fetch(self, name: str) -> bool:
+        """Copy name from the shared store into the spool; False if there is none."""
+        if not self.shared:
+            return False
+        part = self._staging()
+        try:
+            if not self.shared.fetch(name, Path(part)):
+                return False
+            os.replace(part, self.root / name)
+            return True
+        finally:
+            if os.path.exists(part):
+                os.remove(part)
+
+    def _local(self, digest: str) -> bool:
+        """Whether digest's text is in the spool, fetching it from the shared store if needed."""
+        text_path = self._text_path(digest)
+        if text_path.exists():
+            return True
+        # The page count first, so that once the text is here the count is too.
+        self._fetch(self._pages_path(digest).name)
+        return self._fetch(text_path.name)
+
+    def _read_pages(self, digest: str):
+        try:
+            return json.loads(self._pages_path(digest).read_text(encoding="utf-8"))["pages"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+
+    @contextmanager
+    def _digest_lock(self, key: str):
+        """Serialize extraction of one content hash; different uploads do not wait for each other."""
+        with self._lock:
+            entry = self._digest_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._digest_locks[key]
+
+    def _parse_pdf(self, source: Path, target: Path) -> int:
+        """Extract a PDF's text, in the process pool when pdf_workers is set since parsing is CPU-bound."""
+        if not self.pdf_workers:
+            return _extract_pdf(source, target)
+        with self._lock:
+            if self._pdf_pool is None:
+                self._pdf_pool = ProcessPoolExecutor(max_workers=self.pdf_workers)
+        return self._pdf_pool.submit(_extract_pdf, source, target).result()
+
+    def spool(self, stream, name: str) -> dict:
+        """Copy a binary stream to disk, extract its text under its content hash, and return a handle."""
+        digest = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for block in iter(lambda: stream.read(CHUNK_BYTES), b""):
+                    digest.update(block)
+                    out.write(block)
+            key = digest.hexdigest()
+            text_path = self._text_path(key)
+            pages = None
+            with self._digest_lock(key):
+                if not self._local(key):
+                    part = self._staging()
+                    try:
+                        if name.lower().endswith(".pdf"):
+                            pages = self._parse_pdf(Path(tmp), Path(part))
+                            # Written before the text appears, so a cache hit always finds it.
+                            self._write_json(self._pages_path(key), {"pages": pages})
+                        else:
+                            _decode_file(Path(tmp), Path(part))
+                        os.replace(part, text_path)
+                    finally:
+                        if os.path.exists(part):
+                            os.remove(part)
+                    self._publish(text_path)
+                else:
+                    os.utime(text_path)
+                    pages = self._read_pages(key)
+                    if pages is not None:
+                        os.utime(self._pages_path(key))
+        finally:
+            os.remove(tmp)
+        return {"id": key, "name": name, "bytes": text_path.stat().st_size, "pages": pages,
+                "words": self._count_words(text_path)}
+
+    def spool_text(self, text: str, name: str = "pasted.txt") -> dict:
+        """Spool pasted text so the session can drop its own copy."""
+        data = text.encode("utf-8")
+        key = hashlib.sha256(data).hexdigest()
+        text_path = self._text_path(key)
+        if not self._local(key):
+            part = self._staging()
+            try:
+                Path(part).write_bytes(data)
+                os.replace(part, text_path)
+            finally:
+                if os.path.exists(part):
+                    os.remove(part)
+            self._publish(text_path)
+        return {"id": key, "name": name, "bytes": len(data), "pages": None, "words": len(text.split())}
+
+    def _write_json(self, path: Path, value):
+        part = self._staging(".jtmp")
+        try:
+            Path(part).write_text(json.dumps(value), encoding="utf-8")
+            os.replace(part, path)
+        finally:
+            if os.path.exists(part):
+                os.remove(part)
+        self._publish(path)
+
+    def write_meta(self, handle: dict, meta):
+        """Store JSON metadata next to a handle's text."""
+        self._write_json(self.root / f"{handle['id']}.json", meta)
+
+    def read_meta(self, handle: dict, default=None):
+        path = self.root / f"{handle['id']}.json"
+        if not path.exists() and not self._fetch(path.name):
+            return default
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return default
+
+    @staticmethod
+    def _count_words(path: Path) -> int:
+        with open(path, encoding="utf-8") as f:
+            return sum(len(line.split()) for line in f)
+
+    def exists(self, handle: dict) -> bool:
+        return bool(handle) and self._local(handle["id"])
+
+    def preview(self, handle: dict, max_bytes: int = 1000) -> str:
+        """The first max_bytes of the text, read without loading the rest."""
+        self._local(handle["id"])
+        with open(self._text_path(handle["id"]), "rb") as f:
+            return f.read(max_bytes).decode("utf-8", errors="ignore")
+
+    @contextmanager
+    def open_text(self, handle: dict, session: str):
+        """Load a handle's text for the duration of the block, within the memory budget."""
+        path = self._text_path(handle["id"])
+        if not self._local(handle["id"]):
+            raise UploadError("This upload has expired, please upload the file again")
+        size = path.stat().st_size
+        self.budget.acquire(session, size)
+        try:
+            yield path.read_text(encoding="utf-8")
+        finally:
+            self.budget.release(session, size)
+
+    def cleanup(self, max_age: float = SPOOL_TTL_SECONDS) -> int:
+        """Delete spooled files not touched for max_age seconds (the shared store expires its own)."""
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in self.root.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
@@ -0,0 +1,231 @@
+"""
+Per-user token accounting and daily quotas.
+
+Every model call appends one row to usage_events, which has no secondary
+indexes so writes stay cheap. A scheduled rollup folds new events into
+usage_daily, keyed by (owner, day). A quota check is one primary-key lookup
+in usage_daily plus the owner's events past the rollup watermark, written
+by any replica, so its cost is bounded by one rollup interval of calls.
+
+Each call also records which endpoint answered it, and whether a hedged
+request was sent, in provider_races.
+"""
+
+import sqlite3
+import threading
+import time
+
+from study_engine.database import connect, location
+
+ROLLUP_SECONDS = 60
+RETENTION_DAYS = 30
+
+
+class QuotaExceeded(RuntimeError):
+    pass
+
+
+def usage_day(timestamp: float = None) -> str:
+    """UTC day a usage event is counted against."""
+    return time.strftime("%Y-%m-%d", time.gmtime(time.time() if timestamp is None else timestamp))
+
+
+class UsageLedger:
+    """Append-only usage log with daily rollups per user."""
+
+    def __init__(self, db_path):
+        self.db_path = location(db_path)
+        self._rollup_thread = None
+        self._init_tables()
+
+    def _connect(self):
+        return connect(self.db_path)
+
+    def _init_tables(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS usage_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                owner TEXT NOT NULL,
+                feature TEXT NOT NULL,
+                model TEXT NOT NULL,
+                prompt_tokens INTEGER NOT NULL,
+                completion_tokens INTEGER NOT NULL,
+                total_tokens INTEGER NOT NULL,
+                latency_ms INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS usage_daily (
+                owner TEXT NOT NULL,
+                day TEXT NOT NULL,
+                requests INTEGER NOT NULL,
+                prompt_tokens INTEGER NOT NULL,
+                completion_tokens INTEGER NOT NULL,
+                total_tokens INTEGER NOT NULL,
+                PRIMARY KEY (owner, day)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_usage_daily_day ON usage_daily (day, total_tokens)')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS usage_rollup_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                last_event_id INTEGER NOT NULL
+            )
+        ''')
+        conn.execute('INSERT OR IGNORE INTO usage_rollup_state (id, last_event_id) VALUES (1, 0)')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS provider_races (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feature TEXT NOT NULL,
+                primary_endpoint TEXT NOT NULL,
+                winner TEXT NOT NULL,
+                hedged INTEGER NOT NULL,
+                hedge_delay_ms INTEGER,
+                first_token_ms INTEGER NOT NULL,
+                latency_ms INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def record(self, owner: str, feature: str, model: str, usage, latency: float):
+        """Append one call; usage is the response's usage dict or object (or None)."""
+        def field(name):
+            value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, 0)
+            return value or 0
+
+        prompt = field("prompt_tokens")
+        completion = field("completion_tokens")
+        total = field("total_tokens") or prompt + completion
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            'INSERT INTO usage_events (owner, feature, model, prompt_tokens, completion_tokens, total_tokens, '
+            'latency_ms, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (owner, feature, model, prompt, completion, total, int(latency * 1000), now)
+        )
+        conn.commit()
+        conn.close()
+
+    def record_race(self, feature: str, race: dict):
+        """Append which endpoint answered a call, from ProviderPool.complete's result."""
+        conn = self._connect()
+        conn.execute(
+            'INSERT INTO provider_races (feature, primary_endpoint, winner, hedged, hedge_delay_ms, first_token_ms, '
+            'latency_ms, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (feature, race["primary"], race["endpoint"], int(race["hedged"]),
+             None if race["hedge_delay"] is None else int(race["hedge_delay"] * 1000),
+             int(race["first_token"] * 1000), int(race["latency"] * 1000), time.time())
+        )
+        conn.commit()
+        conn.close()
+
+    def used_today(self, owner: str) -> int:
+        """Tokens used by owner today, including events any replica wrote since the last rollup."""
+        day = usage_day()
+        conn = self._connect()
+        # One statement, so the daily total and the watermark come from the same rollup.
+        row = conn.execute('''
+            SELECT COALESCE((SELECT total_tokens FROM usage_daily WHERE owner = ? AND day = ?), 0)
+                 + COALESCE((SELECT SUM(total_tokens) FROM usage_events
+                             WHERE id > (SELECT last_event_id FROM usage_rollup_state WHERE id = 1)
+                               AND owner = ? AND date(created_at, 'unixepoch') = ?), 0)
+        ''', (owner, day, owner, day)).fetchone()
+        conn.close()
+        return row[0]
+
+    def check_quota(self, owner: str, daily_quota: int):
+        """Raise QuotaExceeded when owner has used up today's quota; 0 means unlimited."""
+        if daily_quota and owner and self.used_today(owner) >= daily_quota:
+            raise QuotaExceeded("You have used today's AI allowance. It resets at midnight UTC.")
+
+    def rollup(self) -> int:
+        """Fold events newer than the watermark into usage_daily; returns the number folded."""
+        conn = connect(self.db_path, isolation_level=None)
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            last_id = conn.execute('SELECT last_event_id FROM usage_rollup_state WHERE id = 1').fetchone()[0]
+            max_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM usage_events').fetchone()[0]
+            folded = 0
+            if max_id > last_id:
+                rows = conn.execute('''
+                    SELECT owner, date(created_at, 'unixepoch') AS day, COUNT(*), SUM(prompt_tokens),
+                           SUM(completion_tokens), SUM(total_tokens)
+                    FROM usage_events WHERE id > ? AND id <= ? GROUP BY owner, day
+                ''', (last_id, max_id)).fetchall()
+                conn.executemany('''
+                    INSERT INTO usage_daily (owner, day, requests, prompt_tokens, completion_tokens, total_tokens)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (owner, day) DO UPDATE SET
+                        requests = requests + excluded.requests,
+                        prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+                        completion_tokens = completion_tokens + excluded.completion_tokens,
+                        total_tokens = total_tokens + excluded.total_tokens
+                ''', rows)
+                conn.execute('UPDATE usage_rollup_state SET last_event_id = ? WHERE id = 1', (max_id,))
+                folded = sum(row[2] for row in rows)
+            conn.execute(
+                'DELETE FROM usage_events WHERE id <= ? AND created_at < ?',
+                (max_id, time.time() - RETENTION_DAYS * 86400)
+            )
+            conn.execute('DELETE FROM provider_races WHERE created_at < ?', (time.time() - RETENTION_DAYS * 86400,))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return folded
+
+    def start_rollups(self, interval: float = ROLLUP_SECONDS):
+        """Run rollup every interval seconds on a daemon thread."""
+        if self._rollup_thread:
+            return
+
+        def loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.rollup()
+                except sqlite3.Error:
+                    pass
+
+        self._rollup_thread = threading.Thread(target=loop, name="usage-rollup", daemon=True)
+        self._rollup_thread.start()
+
+    def top_consumers(self, days: int = 1, limit: int = 20) -> list:
+        """(owner, requests, prompt, completion, total) over the last `days` days, heaviest first."""
+        since = usage_day(time.time() - (days - 1) * 86400)
+        conn = self._connect()
+        rows = conn.execute('''
+            SELECT owner, SUM(requests), SUM(prompt_tokens), SUM(completion_tokens), SUM(total_tokens)
+            FROM usage_daily WHERE day >= ? GROUP BY owner ORDER BY SUM(total_tokens) DESC LIMIT ?
+        ''', (since, limit)).fetchall()
+        conn.close()
+        return rows
+
+    def daily_totals(self, days: int = 7) -> list:
+        """(day, requests, total tokens) for the last `days` days."""
+        since = usage_day(time.time() - (days - 1) * 86400)
+        conn = self._connect()
+        rows = conn.execute('''
+            SELECT day, SUM(requests), SUM(total_tokens) FROM usage_daily
+            WHERE day >= ? GROUP BY day ORDER BY day
+        ''', (since,)).fetchall()
+        conn.close()
+        return rows
+
+    def race_summary(self, days: int = 1) -> list:
+        """(primary, winner, requests, hedged, avg first token ms, avg latency ms, max latency ms) over `days` days."""
+        conn = self._connect()
+        rows = conn.execute('''
+            SELECT primary_endpoint, winner, COUNT(*), SUM(hedged), AVG(first_token_ms), AVG(latency_ms),
+                   MAX(latency_ms)
+            FROM provider_races WHERE created_at >= ?
+            GROUP BY primary_endpoint, winner ORDER BY COUNT(*) DESC
+        ''', (time.time() - days * 86400,)).fetchall()
+        conn.close()
+        return rows
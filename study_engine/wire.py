@@ -0,0 +1,168 @@
+"""
+Compact wire format for model output and its local expansion.
+
+Output tokens dominate generation latency, so the compact prompt templates
+ask for short keys and positional arrays instead of the verbose objects the
+pages render, e.g. a quiz question is
+
+    ["Question?", ["opt", "opt", "opt", "opt"], 1, "Why"]
+
+with the index of the correct option instead of an is_correct flag on every
+option. expand_output turns such a response back into the verbose structure.
+Responses that are already verbose pass through unchanged, so the expander
+is safe to apply whichever format was requested.
+"""
+
+from study_engine.schemas import OPTION_LABELS
+
+
+def _list(value) -> list:
+    return value if isinstance(value, list) else []
+
+
+def _pair(item, first: str, second: str, number: int = None) -> dict:
+    if isinstance(item, dict):
+        return item
+    item = _list(item) + ["", ""]
+    pair = {first: item[0], second: item[1]}
+    if number is not None:
+        pair = {"id": number, **pair}
+    return pair
+
+
+def _correct_index(value, count: int) -> int:
+    if isinstance(value, str):
+        value = value.strip()
+        if value.upper() in OPTION_LABELS:
+            return OPTION_LABELS.index(value.upper())
+        value = int(value) if value.isdigit() else -1
+    return value if isinstance(value, int) and 0 <= value < count else -1
+
+
+def expand_question(item, number: int) -> dict:
+    if isinstance(item, dict):
+        return item
+    item = _list(item) + [None] * 4
+    question, options, correct, explanation = item[:4]
+    options = _list(options)
+    correct = _correct_index(correct, len(options))
+    return {
+        "id": number,
+        "question": question,
+        "options": [
+            {"label": label, "text": text, "is_correct": i == correct}
+            for i, (label, text) in enumerate(zip(OPTION_LABELS, options))
+        ],
+        "explanation": explanation or "",
+    }
+
+
+def expand_flashcards(data: dict) -> dict:
+    if "c" not in data:
+        return data
+    return {
+        "title": data.get("t") or "Flashcards",
+        "flashcards": [_pair(card, "question", "answer", i) for i, card in enumerate(_list(data["c"]), 1)],
+    }
+
+
+def expand_quiz(data: dict) -> dict:
+    if "q" not in data:
+        return data
+    return {
+        "title": data.get("t") or "Quiz",
+        "questions": [expand_question(q, i) for i, q in enumerate(_list(data["q"]), 1)],
+    }
+
+
+def expand_matching(data: dict) -> dict:
+    if "p" not in data:
+        return data
+    return {
+        "title": data.get("t") or "Matching Game",
+        "pairs": [_pair(pair, "term", "definition", i) for i, pair in enumerate(_list(data["p"]), 1)],
+    }
+
+
+def expand_summary(data: dict) -> dict:
+    if "o" not in data:
+        return data
+    return {
+        "title": data.get("t") or "Summary",
+        "overview": data["o"],
+        "key_points": _list(data.get("k")),
+        "terms": [_pair(term, "term", "definition") for term in _list(data.get("d"))],
+        "takeaways": _list(data.get("w")),
+    }
+
+
+def expand_study_guide(data: dict) -> dict:
+    """Expand a full guide or one of its sections; only the keys present are expanded."""
+    if "summary" in data or not any(key in data for key in ("s", "o", "b", "k", "f")):
+        return data
+    expanded = {}
+    if any(key in data for key in ("t", "j", "o")):
+        expanded.update(title=data.get("t") or "Study Guide", subject=data.get("j", ""))
+    if "s" in data:
+        expanded["summary"] = data["s"]
+    if "o" in data:
+        outlines = []
+        for i, section in enumerate(_list(data["o"]), 1):
+            if isinstance(section, dict):
+                outlines.append(section)
+                continue
+            section = _list(section) + ["", "", []]
+            outlines.append({"id": i, "title": section[0], "content": section[1], "sub_items": _list(section[2])})
+        expanded["outlines"] = outlines
+    if "b" in data:
+        expanded["bullet_takeaways"] = _list(data["b"])
+    if "k" in data:
+        expanded["key_topics"] = [_pair(t, "topic", "importance", i) for i, t in enumerate(_list(data["k"]), 1)]
+    if "f" in data:
+        expanded["facts"] = [_pair(f, "fact", "category", i) for i, f in enumerate(_list(data["f"]), 1)]
+    return expanded
+
+
+def expand_evaluation(data: dict) -> dict:
+    if "c" not in data or "is_correct" in data:
+        return data
+    return {
+        "is_correct": bool(data["c"]),
+        "score": data.get("s", 0),
+        "feedback": data.get("f", ""),
+        "suggestions": _list(data.get("g")),
+    }
+
+
+def expand_study_pack(data: dict) -> dict:
+    if not any(key in data for key in ("s", "c", "q", "p")):
+        return data
+    return {
+        "summary": expand_summary(data["s"]) if isinstance(data.get("s"), dict) else None,
+        "flashcards": expand_flashcards({"c": data.get("c")})["flashcards"] if "c" in data else None,
+        "questions": expand_quiz({"q": data.get("q")})["questions"] if "q" in data else None,
+        "pairs": expand_matching({"p": data.get("p")})["pairs"] if "p" in data else None,
+    }
+
+
+EXPANDERS = {
+    "flashcards": expand_flashcards,
+    "quiz": expand_quiz,
+    "matching": expand_matching,
+    "summary": expand_summary,
+    "study_guide": expand_study_guide,
+    "study_guide_outline": expand_study_guide,
+    "study_guide_summary": expand_study_guide,
+    "study_guide_takeaways": expand_study_guide,
+    "study_guide_facts": expand_study_guide,
+    "evaluation": expand_evaluation,
+    "study_pack": expand_study_pack,
+}
+
+
+def expand_output(feature: str, data):
+    """Verbose structure for a parsed response in either format."""
+    expander = EXPANDERS.get(feature)
+    if expander is None or not isinstance(data, dict):
+        return data
+    return expander(data)
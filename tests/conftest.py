@@ -0,0 +1,16 @@
+import threading
+
+import pytest
+
+from study_engine.dbserver import serve
+
+
+@pytest.fixture
+def db_server(tmp_path):
+    """URL of a dbserver on a free port, backed by files under tmp_path."""
+    server = serve("127.0.0.1", 0, str(tmp_path / "shared.db"), str(tmp_path / "blobs"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
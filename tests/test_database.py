@@ -0,0 +1,42 @@
+import sqlite3
+
+import pytest
+
+from study_engine.database import connect
+from study_engine.question_banks import QuestionBankStore
+
+
+def test_remote_connection_behaves_like_sqlite(db_server):
+    conn = connect(db_server)
+    conn.execute('CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT UNIQUE, data BLOB)')
+    cursor = conn.execute('INSERT INTO notes (body, data) VALUES (?, ?)', ("first", b"\x00\x01"))
+    assert cursor.lastrowid == 1
+    conn.commit()
+    assert conn.execute('SELECT body, data FROM notes').fetchall() == [("first", b"\x00\x01")]
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute('INSERT INTO notes (body) VALUES (?)', ("first",))
+    conn.close()
+
+
+def test_uncommitted_work_is_rolled_back_on_close(db_server):
+    setup = connect(db_server)
+    setup.execute('CREATE TABLE notes (body TEXT)')
+    setup.close()
+    conn = connect(db_server, isolation_level=None)
+    conn.execute('BEGIN IMMEDIATE')
+    conn.execute('INSERT INTO notes VALUES (?)', ("lost",))
+    conn.close()
+    other = connect(db_server)
+    assert other.execute('SELECT COUNT(*) FROM notes').fetchone() == (0,)
+    other.close()
+
+
+def test_store_on_network_database(db_server):
+    banks = QuestionBankStore(db_server)
+    bank = banks.create_bank("ana@example.com", "Biology")
+    banks.add_questions(bank, [{
+        "question": "Where is ATP made?", "explanation": "",
+        "options": [{"label": "A", "text": "Mitochondria", "is_correct": True},
+                    {"label": "B", "text": "Nucleus", "is_correct": False}],
+    }])
+    assert QuestionBankStore(db_server).list_banks("ana@example.com") == [(bank, "Biology", 1)]
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from study_engine.question_banks import ImportFailed, QuestionBankStore
+
+HEADER = "question,a,b,correct,explanation\n"
+
+
+def rows(prefix: str, n: int) -> str:
+    return "".join(f"{prefix} {i}?,yes,no,A,because\n" for i in range(n))
+
+
+@pytest.fixture
+def banks(tmp_path):
+    return QuestionBankStore(tmp_path / "banks.db")
+
+
+def test_import_reports_bad_rows(banks):
+    bank = banks.create_bank("ana@example.com", "Biology")
+    lines = io.StringIO(HEADER + rows("Good", 3) + "No options?,,,A,\n")
+    imported, errors = banks.import_stream(bank, lines, "CSV", batch_size=2)
+    assert imported == 3
+    assert [row for row, _ in errors] == [5]
+    assert len(list(banks.iter_questions(bank))) == 3
+
+
+def test_unreadable_file_rolls_back_the_import(banks):
+    bank = banks.create_bank("ana@example.com", "Biology")
+    banks.import_stream(bank, io.StringIO(HEADER + rows("Kept", 2)), "CSV")
+    broken = HEADER + rows("Added", 5) + '"' + "x" * 200_000 + '",yes,no,A,\n'
+    with pytest.raises(ImportFailed, match="could not be read"):
+        banks.import_stream(bank, io.StringIO(broken), "CSV", batch_size=2)
+    questions = [q["question"] for q in banks.iter_questions(bank)]
+    assert questions == ["Kept 0?", "Kept 1?"]
+    assert len(banks.sample(bank, 10)) == 2
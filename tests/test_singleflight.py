@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from study_engine.singleflight import SingleFlight
+
+
+def wait_for(condition, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_concurrent_callers_share_one_call_and_get_copies():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait()
+        return {"items": [1]}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flights.do("key", slow))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: flights.in_flight() == 1 and calls)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [{"items": [1]}] * 3
+    results[0]["items"].append(2)
+    assert results[1] == results[2] == {"items": [1]}
+
+
+def test_hung_leader_times_out_and_frees_the_key():
+    flights = SingleFlight()
+    hang = threading.Event()
+    with pytest.raises(TimeoutError):
+        flights.do("key", hang.wait, timeout=0.1)
+    assert flights.in_flight() == 0
+    assert flights.do("key", lambda: "fresh", timeout=1) == "fresh"
+    hang.set()
+
+
+def test_leader_error_is_not_shared():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait()
+        raise RuntimeError("upstream failed")
+
+    errors = []
+
+    def lead():
+        try:
+            flights.do("key", failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    wait_for(lambda: flights.in_flight() == 1)
+    follower = []
+    thread = threading.Thread(target=lambda: follower.append(flights.do("key", lambda: "retried")))
+    thread.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join()
+    thread.join()
+    assert [str(e) for e in errors] == ["upstream failed"]
+    assert follower == ["retried"]
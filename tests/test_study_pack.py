@@ -0,0 +1,95 @@
+import pytest
+
+from study_engine.artifacts import ArtifactStore
+from study_engine.generation import run_study_pack
+from study_engine.jobs import JobManager
+from study_engine.kvstore import SQLiteKeyValueStore
+from study_engine.ui import components
+
+OWNER = "ana@example.com"
+NOTES = "Mitochondria release energy from glucose. Ribosomes build proteins from amino acids."
+PACK = {
+    "flashcards": [
+        {"question": "What do mitochondria release?", "answer": "Energy from glucose"},
+        {"question": "What do ribosomes build?", "answer": "Proteins from amino acids"},
+    ],
+    "pairs": [
+        {"term": "Mitochondrion", "definition": "Releases energy"},
+        {"term": "Ribosome", "definition": "Builds proteins"},
+    ],
+    "summary": {"overview": "How cell parts divide the work.", "key_points": ["Organelles specialise"],
+                "terms": [{"term": "ATP", "definition": "Energy currency"}], "takeaways": ["Structure fits function"]},
+}
+
+
+class FakeProvider:
+    """Returns PACK for the combined request and fails every per-section fallback."""
+
+    def __init__(self, pack):
+        self.pack = pack
+        self.features = []
+
+    def generate_json(self, system_prompt, user_prompt, feature):
+        self.features.append(feature)
+        if feature == "study_pack":
+            return self.pack
+        raise RuntimeError(f"{feature} unavailable")
+
+
+class SessionState(dict):
+    __getattr__ = dict.get
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+
+@pytest.fixture
+def jobs(tmp_path):
+    return JobManager(SQLiteKeyValueStore(tmp_path / "state.db"), max_workers=1)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(tmp_path / "artifacts.db")
+
+
+@pytest.fixture
+def session(monkeypatch, jobs):
+    state = SessionState(user_email=OWNER, username=None)
+    monkeypatch.setattr(components.st, "session_state", state)
+    monkeypatch.setattr(components, "get_job_manager", lambda: jobs)
+    return state
+
+
+def test_failed_section_does_not_drop_the_others(jobs, store):
+    result = run_study_pack(FakeProvider(PACK), NOTES, 2, 2, 2, store, jobs, OWNER)
+    assert list(result["failed"]) == ["quiz"]
+    assert result["regenerated"] == []
+    assert result["counts"] == {"flashcards": 2, "quiz": 0, "matching": 2}
+    for feature in ("flashcards", "matching", "summary"):
+        job = jobs.latest(OWNER, feature)
+        assert job["status"] == "done"
+        assert job["result"]["data"]
+    assert jobs.latest(OWNER, "quiz") is None
+
+
+def test_pack_fails_only_when_every_section_fails(jobs, store):
+    with pytest.raises(RuntimeError, match="could not be generated"):
+        run_study_pack(FakeProvider({}), NOTES, 2, 2, 2, store, jobs, OWNER)
+    assert jobs.latest(OWNER, "flashcards") is None
+
+
+def test_page_with_an_older_job_shows_the_pack_result(session, jobs, store):
+    old = jobs.record(OWNER, "flashcards", {"data": {"title": "Old", "flashcards": []}})
+    session["flashcards_job_id"] = old
+    run_study_pack(FakeProvider(PACK), NOTES, 2, 2, 2, store, jobs, OWNER)
+    job = components.attached_job("flashcards")
+    assert job["id"] != old
+    assert job["result"]["data"]["flashcards"][0]["question"] == "What do mitochondria release?"
+    assert session["flashcards_job_id"] == job["id"]
+
+
+def test_reconnected_session_finds_the_latest_job(session, jobs):
+    latest = jobs.record(OWNER, "summary", {"data": "summary"})
+    assert components.attached_job("summary")["id"] == latest
+    assert session["summary_job_id"] == latest
@@ -0,0 +1,71 @@
+import io
+
+import pytest
+from PyPDF2 import PdfWriter
+
+from study_engine.uploads import HTTPBlobStore, UploadError, UploadSpool
+
+
+def pdf_bytes(pages: int) -> bytes:
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=612, height=792)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def make_spool(root, **kwargs) -> UploadSpool:
+    return UploadSpool(root, per_session_bytes=1_000_000, total_bytes=10_000_000, **kwargs)
+
+
+def test_pdf_cache_hit_keeps_page_count(tmp_path):
+    spool = make_spool(tmp_path)
+    data = pdf_bytes(3)
+    first = spool.spool(io.BytesIO(data), "notes.pdf")
+    again = spool.spool(io.BytesIO(data), "copy.pdf")
+    assert first["pages"] == 3
+    assert again["id"] == first["id"]
+    assert again["pages"] == 3
+
+
+def test_text_upload_handle_and_text(tmp_path):
+    spool = make_spool(tmp_path)
+    handle = spool.spool(io.BytesIO("one two\nthree café".encode()), "notes.txt")
+    assert handle["words"] == 4
+    assert handle["bytes"] == len("one two\nthree café".encode())
+    assert handle["pages"] is None
+    with spool.open_text(handle, "session") as text:
+        assert text == "one two\nthree café"
+    assert spool.budget.usage()["total"] == 0
+
+
+def test_spooling_leaves_only_final_files(tmp_path):
+    spool = make_spool(tmp_path)
+    handle = spool.spool(io.BytesIO(pdf_bytes(1)), "notes.pdf")
+    spool.spool_text("pasted notes")
+    spool.write_meta(handle, {"files": 1})
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert not [name for name in names if name.endswith((".tmp", ".jtmp", ".part"))]
+    assert f"{handle['id']}.pages.json" in names
+    assert spool.read_meta(handle) == {"files": 1}
+
+
+def test_expired_upload_raises(tmp_path):
+    spool = make_spool(tmp_path)
+    handle = spool.spool_text("short lived")
+    assert spool.cleanup(max_age=-1) == 1
+    assert not spool.exists(handle)
+    with pytest.raises(UploadError):
+        with spool.open_text(handle, "session"):
+            pass
+
+
+def test_shared_store_serves_other_hosts(tmp_path, db_server):
+    first = make_spool(tmp_path / "host1", shared=HTTPBlobStore(db_server))
+    second = make_spool(tmp_path / "host2", shared=HTTPBlobStore(db_server))
+    handle = first.spool(io.BytesIO(pdf_bytes(2)), "notes.pdf")
+    first.write_meta(handle, {"files": 1})
+    assert second.exists(handle)
+    assert second.read_meta(handle) == {"files": 1}
+    assert second.spool(io.BytesIO(pdf_bytes(2)), "notes.pdf")["pages"] == 2
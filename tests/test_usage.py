@@ -0,0 +1,61 @@
+import sqlite3
+import time
+
+import pytest
+
+from study_engine.usage import QuotaExceeded, UsageLedger
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "usage.db"
+
+
+def usage(tokens: int) -> dict:
+    return {"prompt_tokens": tokens // 2, "completion_tokens": tokens - tokens // 2, "total_tokens": tokens}
+
+
+def test_quota_counts_other_replicas_before_rollup(db):
+    first, second = UsageLedger(db), UsageLedger(db)
+    first.record("ana@example.com", "quiz", "small", usage(100), 0.5)
+    second.record("ana@example.com", "summary", "large", usage(50), 0.5)
+    second.record("ben@example.com", "quiz", "small", usage(7), 0.5)
+    assert first.used_today("ana@example.com") == 150
+    assert second.used_today("ana@example.com") == 150
+    assert first.used_today("ben@example.com") == 7
+
+
+def test_rollup_keeps_totals_and_is_idempotent(db):
+    ledger = UsageLedger(db)
+    ledger.record("ana@example.com", "quiz", "small", usage(100), 0.5)
+    ledger.record("ana@example.com", "quiz", "small", usage(20), 0.5)
+    assert ledger.rollup() == 2
+    assert ledger.rollup() == 0
+    ledger.record("ana@example.com", "quiz", "small", usage(1), 0.5)
+    assert ledger.used_today("ana@example.com") == 121
+    assert ledger.top_consumers() == [("ana@example.com", 2, 60, 60, 120)]
+
+
+def test_earlier_days_do_not_count(db):
+    ledger = UsageLedger(db)
+    conn = sqlite3.connect(str(db))
+    conn.execute(
+        'INSERT INTO usage_events (owner, feature, model, prompt_tokens, completion_tokens, total_tokens, '
+        'latency_ms, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        ("ana@example.com", "quiz", "small", 500, 500, 1000, 100, time.time() - 2 * 86400)
+    )
+    conn.commit()
+    conn.close()
+    ledger.record("ana@example.com", "quiz", "small", usage(10), 0.5)
+    assert ledger.used_today("ana@example.com") == 10
+    ledger.rollup()
+    assert ledger.used_today("ana@example.com") == 10
+
+
+def test_check_quota(db):
+    ledger = UsageLedger(db)
+    ledger.record("ana@example.com", "quiz", "small", usage(100), 0.5)
+    ledger.check_quota("ana@example.com", 101)
+    ledger.check_quota("ana@example.com", 0)
+    with pytest.raises(QuotaExceeded):
+        ledger.check_quota("ana@example.com", 100)